@@ -6,6 +6,7 @@
 
 from __future__ import annotations
 import logging
+import threading
 from typing import List, Dict, Any, Optional
 from pathlib import Path
 
@@ -15,6 +16,8 @@ from langchain_community.document_loaders import DirectoryLoader, UnstructuredMa
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 from langchain_core.documents import Document
 
+from common.llm_replay import wrap_embeddings
+
 logger = logging.getLogger(__name__)
 
 
@@ -22,7 +25,7 @@ class CSRagService:
     """CS 전용 RAG 시스템.
 
     ChromaDB 기반 벡터스토어. 제품 마크다운 + FAQ 문서를 로드하여
-    고객 문의에 대한 시맨틱 검색 수행.
+    고객 문의에 대한 시맨틱 검색 수행. 임베딩/벡터스토어는 첫 사용 시 지연 로드.
     """
 
     def __init__(
@@ -33,18 +36,51 @@ class CSRagService:
     ):
         self.knowledge_dir = Path(knowledge_dir)
         self.persist_directory = persist_directory
-        self.embeddings = OpenAIEmbeddings(model=embedding_model)
-        self.vectorstore: Optional[Chroma] = None
-        self._initialize_vectorstore()
-
-    def _initialize_vectorstore(self):
-        """기존 DB 로드 시도. 없으면 build_vectorstore() 필요."""
+        self.embedding_model = embedding_model
+        self._embeddings: Optional[OpenAIEmbeddings] = None
+        self._vectorstore: Optional[Chroma] = None
+        self._embeddings_lock = threading.Lock()
+        self._vectorstore_lock = threading.Lock()
+
+    @property
+    def embeddings(self) -> OpenAIEmbeddings:
+        """OpenAIEmbeddings 지연 생성. LLM_REPLAY_MODE 설정 시 record-replay 래퍼 적용."""
+        if self._embeddings is None:
+            with self._embeddings_lock:
+                if self._embeddings is None:
+                    self._embeddings = wrap_embeddings(lambda: OpenAIEmbeddings(model=self.embedding_model))
+        return self._embeddings
+
+    @property
+    def vectorstore(self) -> Optional[Chroma]:
+        """Chroma 지연 로드 (첫 검색 또는 warmup 시).
+
+        임베딩은 벡터스토어 락 밖에서 먼저 만든다 — 리소스별 락을 따로 두어 중첩 획득이 없다.
+        """
+        if self._vectorstore is None:
+            embeddings = self.embeddings
+            with self._vectorstore_lock:
+                if self._vectorstore is None:
+                    self._initialize_vectorstore(embeddings)
+        return self._vectorstore
+
+    @vectorstore.setter
+    def vectorstore(self, value: Optional[Chroma]) -> None:
+        self._vectorstore = value
+
+    def warmup(self) -> None:
+        """임베딩 클라이언트 + Chroma 로드를 미리 수행."""
+        _ = self.embeddings
+        _ = self.vectorstore
+
+    def _initialize_vectorstore(self, embeddings: OpenAIEmbeddings):
+        """기존 DB 로드 시도 → self._vectorstore. 없으면 build_vectorstore() 필요."""
         ...
 
     def build_vectorstore(self, force_rebuild: bool = False) -> None:
         """문서 로드 → 청킹 → ChromaDB 벡터스토어 생성.
 
-        force_rebuild=True면 기존 DB 삭제 후 재구축.
+        force_rebuild=True면 기존 DB 삭제 후 재구축. 결과는 self._vectorstore에 저장.
         """
         ...
 
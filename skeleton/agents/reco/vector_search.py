@@ -19,7 +19,7 @@ logger = logging.getLogger(__name__)
 class ProductVectorSearch:
     """벡터 기반 제품 검색.
 
-    초기화 시 임베딩 NPZ + 제품 Parquet 로드.
+    임베딩 NPZ + 제품 Parquet 로드와 인덱스 구축은 첫 search() 또는 warmup() 시 1회 수행.
     FAISS IndexFlatIP(코사인)로 인덱스 구축, 없으면 NumPy 폴백.
     """
 
@@ -29,9 +29,17 @@ class ProductVectorSearch:
         products_path: str = "data/products.parquet",
         use_faiss: bool = True,
     ):
-        """임베딩/제품 데이터 로드 + FAISS 인덱스 구축."""
+        """경로/옵션만 저장. 데이터 로드는 _ensure_loaded()로 지연."""
         ...
 
+    def _ensure_loaded(self) -> None:
+        """임베딩/제품 데이터 로드 + FAISS 인덱스 구축 (스레드 안전, 1회)."""
+        ...
+
+    def warmup(self) -> None:
+        """데이터 로드 + 인덱스 구축을 미리 수행."""
+        self._ensure_loaded()
+
     def _normalize_embeddings(self):
         """NumPy L2 정규화 (FAISS 미사용 시)."""
         ...
@@ -134,17 +134,17 @@ def symptom_probe(state: SkincareState) -> SkincareState:
 
 
 def evidence_retriever(state: SkincareState) -> SkincareState:
-    """FAISS 벡터 검색으로 스킨케어 지식 조회. 고민+피부타입 기준 캐싱."""
+    """FAISS 벡터 검색으로 스킨케어 지식 조회. 고민+피부타입 기준 캐싱. 턴 예산 부족 시 k 축소."""
     ...
 
 
 def scope_consistency_guard(state: SkincareState) -> SkincareState:
-    """LLM이 솔루션 적합도 평가, 주제 이탈 구간 제거. 부족하면 웹 폴백."""
+    """LLM이 솔루션 적합도 평가, 주제 이탈 구간 제거. 부족하면 웹 폴백. 턴 예산 CRITICAL이면 스킵(pass)."""
     ...
 
 
 def web_fallback(state: SkincareState) -> SkincareState:
-    """RAG 근거 부족 시 Tavily 웹 검색으로 보완 답변 생성."""
+    """RAG 근거 부족 시 Tavily 웹 검색으로 보완 답변 생성. 턴 예산 CRITICAL이면 스킵 후 RAG 근거로 응답."""
     ...
 
 
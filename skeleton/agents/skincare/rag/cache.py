@@ -10,6 +10,8 @@ import time
 import hashlib
 import logging
 
+from common.cache_registry import get_cache_registry
+
 logger = logging.getLogger(__name__)
 
 
@@ -61,8 +63,12 @@ class RAGCache:
         """캐시 전체 삭제."""
         ...
 
+    def warm(self, entries) -> int:
+        """(슬롯 kwargs dict, 검색 결과) 목록으로 캐시 채우기. CacheRegistry.warm() 경유. 채운 수 반환."""
+        ...
+
     def get_stats(self) -> Dict[str, Any]:
-        """hit/miss/eviction/hit_rate 통계 반환."""
+        """hit/miss/eviction/hit_rate/size 통계 반환."""
         ...
 
 
@@ -75,4 +81,7 @@ def get_rag_cache() -> RAGCache:
     global _global_rag_cache
     if _global_rag_cache is None:
         _global_rag_cache = RAGCache(ttl=3600, max_size=100)
+        get_cache_registry().register_cache(
+            "skincare.rag", _global_rag_cache, warm_fn=_global_rag_cache.warm,
+        )
     return _global_rag_cache
@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 from langchain_openai import OpenAIEmbeddings
+from common.llm_replay import wrap_embeddings
 
 
 def get_embeddings(model: str = "text-embedding-3-small") -> OpenAIEmbeddings:
-    """임베딩 모델 인스턴스 반환."""
-    return OpenAIEmbeddings(model=model)
+    """임베딩 모델 인스턴스 반환. LLM_REPLAY_MODE 설정 시 record-replay 래퍼 적용.
+
+    OpenAIEmbeddings는 팩토리로 넘겨 replay 모드에서는 생성하지 않는다 (API 키 불필요).
+    """
+    return wrap_embeddings(lambda: OpenAIEmbeddings(model=model))
@@ -6,6 +6,8 @@ from functools import lru_cache
 import json
 import logging
 
+from common.cache_registry import get_cache_registry
+
 logger = logging.getLogger(__name__)
 
 
@@ -25,6 +27,9 @@ def _llm_expand_query_cached(
     ...
 
 
+get_cache_registry().register_lru("skincare.query_expansion", _llm_expand_query_cached)
+
+
 def llm_expand_query(
     primary_concern: str,
     skin_type: str,
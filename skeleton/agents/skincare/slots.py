@@ -3,7 +3,9 @@
 from __future__ import annotations
 import json
 import re
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Type
+
+from pydantic import BaseModel
 
 # # from .llm import get_chat
 # # from .prompts import load_prompt
@@ -44,8 +46,17 @@ def scan_concern_keywords(utterance: str) -> List[str]:
 
 # ---- LLM 기반 추출 ----
 
-def _invoke_json(prompt, values: Dict[str, Any]) -> Dict[str, Any]:
-    """gpt-4o-mini로 프롬프트 실행 후 JSON 파싱. 실패 시 안전한 기본값 반환."""
+def _invoke_json(
+    prompt,
+    values: Dict[str, Any],
+    output_schema: Optional[Type[BaseModel]] = None,
+    call_site: str = "skincare.slot_extract",
+) -> Dict[str, Any]:
+    """gpt-4o-mini로 프롬프트 실행 후 JSON 파싱. 실패 시 안전한 기본값 반환.
+
+    output_schema 지정 시 LLMCallBuilder.call_json 경유 — strict json_schema response_format으로
+    디코딩 단계에서 스키마 강제, 기본값 폴백은 get_parse_stats()에 call_site별로 집계된다.
+    """
     ...
 
 
@@ -74,7 +85,10 @@ def llm_classify_intent(
     asked_ingredient_avoid: bool = False,
     conversation_stage: Optional[str] = None,
 ) -> Dict[str, Any]:
-    """슬롯 이미 채워진 경우 인텐트만 경량 분류."""
+    """슬롯 이미 채워진 경우 인텐트만 경량 분류.
+
+    QUICK 분류 호출이므로 LLMCallConfig(batchable=True) — 비동기 경로에서는 세션 간 마이크로 배칭 대상.
+    """
     ...
 
 
@@ -0,0 +1,71 @@
+"""캐시 백엔드 읽기/쓰기 처리량 벤치마크 (MemoryCache vs SQLiteCache vs RedisCache).
+
+LLM 응답 크기 분포(라우터 판단 ~200B, 에이전트 응답 ~2-8KB)를 흉내 낸 값으로
+set/get 처리량(ops/s)과 지연 p50/p99를 스레드 수별로 측정한다.
+SQLiteCache는 재시작 후 웜 히트율도 측정 (프로세스 재생성 대신 인스턴스 재생성).
+
+실행: python -m benchmarks.cache_backends --ops 20000 --threads 1,4,16 [--redis-host 127.0.0.1]
+"""
+
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Sequence
+import argparse
+import logging
+
+logger = logging.getLogger(__name__)
+
+# (라벨, 바이트 크기, 비율)
+VALUE_PROFILE = (
+    ("router_decision", 200, 0.6),
+    ("agent_answer", 4_000, 0.35),
+    ("routine", 8_000, 0.05),
+)
+
+
+@dataclass
+class BackendResult:
+    """백엔드 x 작업 x 스레드 수 측정 결과."""
+    backend: str                 # "memory" | "sqlite" | "redis"
+    op: str                      # "set" | "get_hit" | "get_miss"
+    threads: int
+    ops_per_s: float = 0.0
+    latency_p50_us: float = 0.0
+    latency_p99_us: float = 0.0
+    warm_after_restart: float = 0.0   # 재생성 후 히트율 (sqlite/redis만 의미 있음)
+
+
+def make_values(n: int, seed: int = 0) -> List[Dict[str, Any]]:
+    """VALUE_PROFILE 비율대로 n개의 JSON 직렬화 가능한 값 생성."""
+    ...
+
+
+def build_backends(args: argparse.Namespace) -> Dict[str, Callable[[], Any]]:
+    """백엔드 팩토리. Redis 연결 실패 시 redis 항목은 건너뛴다 (경고 로그)."""
+    ...
+
+
+def run_backend(name: str, factory: Callable[[], Any], values: List[Dict[str, Any]], threads: Sequence[int]) -> List[BackendResult]:
+    """set → get(hit) → get(miss) 순서로 측정. 각 측정 전 clear()."""
+    ...
+
+
+def format_report(results: List[BackendResult]) -> str:
+    """백엔드별 ops/s, p50/p99, 재시작 후 웜 히트율 마크다운 표."""
+    ...
+
+
+def main(argv: Sequence[str] | None = None) -> List[BackendResult]:
+    """CLI 진입점."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--ops", type=int, default=20_000)
+    parser.add_argument("--threads", default="1,4,16")
+    parser.add_argument("--sqlite-path", default="/tmp/bench_cache.sqlite3")
+    parser.add_argument("--redis-host", default=None)
+    parser.add_argument("--redis-port", type=int, default=6379)
+    args = parser.parse_args(argv)
+    ...
+
+
+if __name__ == "__main__":
+    main()
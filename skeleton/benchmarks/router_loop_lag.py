@@ -0,0 +1,66 @@
+"""동기 vs 비동기 라우터 이벤트 루프 지연 벤치마크.
+
+N개 동시 세션이 라우팅을 수행하는 동안 별도 probe 코루틴이 주기적으로 sleep하며
+예정 시각 대비 실제 깨어난 시각의 차이(event-loop lag)를 측정한다.
+
+    sync  : 노드 안에서 LLMRouter.route() 직접 호출 (루프 차단)
+    async : LLMRouter.aroute() (AsyncOpenAI + asyncio.gather + 공유 세마포어)
+
+실행: python -m benchmarks.router_loop_lag --sessions 50 100 300 --mode both
+"""
+
+from __future__ import annotations
+from dataclasses import dataclass, field
+from typing import Dict, List, Sequence
+import argparse
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class LoopLagResult:
+    """동시 세션 수 × 라우터 모드별 측정 결과."""
+    mode: str                      # "sync" | "async"
+    sessions: int
+    lag_p50_ms: float = 0.0
+    lag_p99_ms: float = 0.0
+    lag_max_ms: float = 0.0
+    route_p50_ms: float = 0.0
+    route_p95_ms: float = 0.0
+    route_p99_ms: float = 0.0
+    samples: List[float] = field(default_factory=list)
+
+
+async def probe_loop_lag(stop: asyncio.Event, interval_s: float = 0.01) -> List[float]:
+    """interval_s마다 깨어나며 지연(ms) 샘플 수집."""
+    ...
+
+
+async def run_sessions(router, states: Sequence, mode: str) -> List[float]:
+    """동시 세션 라우팅 실행 후 세션별 라우팅 소요(ms) 반환."""
+    ...
+
+
+async def run_benchmark(router, session_counts: Sequence[int], modes: Sequence[str]) -> List[LoopLagResult]:
+    """세션 수/모드 조합별로 probe와 라우팅을 동시 실행해 결과 수집."""
+    ...
+
+
+def format_report(results: List[LoopLagResult]) -> str:
+    """마크다운 표 형태 리포트 (benchmarks/ 문서 포맷과 동일)."""
+    ...
+
+
+def main(argv: Sequence[str] | None = None) -> Dict[str, List[LoopLagResult]]:
+    """CLI 진입점."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sessions", type=int, nargs="+", default=[50, 100, 300])
+    parser.add_argument("--mode", choices=["sync", "async", "both"], default="both")
+    args = parser.parse_args(argv)
+    ...
+
+
+if __name__ == "__main__":
+    main()
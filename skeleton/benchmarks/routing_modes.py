@@ -0,0 +1,58 @@
+"""Fused vs split 라우팅 모드 비교 벤치마크.
+
+50-시나리오 라우팅 세트를 케이스별 모드 조합으로 실행하고
+라우팅 정확도, 라우팅 지연(p50/p95), 턴당 프롬프트 토큰을 비교한다.
+
+실행: python -m benchmarks.routing_modes --scenarios data/routing_scenarios.jsonl --repeat 5
+"""
+
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, List, Sequence
+import argparse
+import logging
+
+if TYPE_CHECKING:  # numpy 의존 모듈 — 타입 검사 시에만 임포트
+    from orchestrator.intent_fastpath import RoutingScenario
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RoutingModeResult:
+    """모드별 측정 결과."""
+    mode: str                      # "split" | "fused"
+    case: str                      # "case1".."case4" | "all"
+    accuracy: float = 0.0          # intent + agent 모두 일치한 비율
+    latency_p50_ms: float = 0.0
+    latency_p95_ms: float = 0.0
+    prompt_tokens_per_turn: float = 0.0
+    llm_calls_per_turn: float = 0.0
+
+
+def load_scenarios(path: str) -> List[RoutingScenario]:
+    """JSONL 시나리오 로드 → intent_fastpath.RoutingScenario 리스트 (대화 이력 포함)."""
+    ...
+
+
+def run_mode(router, scenarios: Sequence, routing_modes: Dict[str, str], repeat: int) -> List[RoutingModeResult]:
+    """지정된 routing_modes로 시나리오를 repeat회 실행 (캐시 비활성), 케이스별 집계."""
+    ...
+
+
+def format_report(results: List[RoutingModeResult]) -> str:
+    """split/fused 나란히 비교하는 마크다운 표."""
+    ...
+
+
+def main(argv: Sequence[str] | None = None) -> List[RoutingModeResult]:
+    """CLI 진입점."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--scenarios", required=True)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+    ...
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""콜드 스타트 벤치마크: 컴포넌트별 time-to-first-request.
+
+각 컴포넌트(라우터, skincare FAISS, CS Chroma, reco Parquet/NPZ, 그래프 컴파일)를
+새 프로세스에서 측정한다.
+    eager : 모든 리소스를 생성자에서 로드 (기존 방식)
+    lazy  : 첫 요청 시 로드 (워밍업 없음)
+    warm  : warmup(background=True) 직후 첫 요청
+지표: 프로세스 시작 → routing ready, → 컴포넌트 첫 요청 응답까지 ms.
+
+실행: python -m benchmarks.startup_time --mode eager lazy warm --repeat 3
+"""
+
+from __future__ import annotations
+from dataclasses import dataclass, field
+from typing import Dict, List, Sequence
+import argparse
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class StartupResult:
+    """모드별 측정 결과."""
+    mode: str
+    routing_ready_ms: float = 0.0
+    first_request_ms: Dict[str, float] = field(default_factory=dict)   # component -> ms
+    init_ms: Dict[str, float] = field(default_factory=dict)            # LazyResource.init_ms
+
+
+def measure_in_subprocess(mode: str) -> StartupResult:
+    """새 인터프리터에서 앱 부팅 후 컴포넌트별 첫 요청 시간 측정 (import 캐시 영향 제거)."""
+    ...
+
+
+def format_report(results: List[StartupResult]) -> str:
+    """컴포넌트 × 모드 마크다운 표."""
+    ...
+
+
+def main(argv: Sequence[str] | None = None) -> List[StartupResult]:
+    """CLI 진입점."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--mode", nargs="+", default=["eager", "lazy", "warm"])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+    ...
+
+
+if __name__ == "__main__":
+    main()
@@ -2,12 +2,38 @@
 
 모든 캐시 백엔드(인메모리, Redis 등)의 계약 정의.
 캐시 키는 콘텐츠 해시로 생성 (session_id 미포함 → 크로스 유저 캐시 공유).
+질의 텍스트는 normalize_query()로 정규화한 뒤 해시 → 표기만 다른 같은 질문이 한 엔트리를 공유.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Optional
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
 import hashlib
 import json
+import re
+import unicodedata
+
+_WS_RE = re.compile(r"\s+")
+_TRAILING_PUNCT_RE = re.compile(r"[\s?!.~…]+$")
+
+
+def normalize_query(text: str) -> str:
+    """NFKC → 소문자 → 공백 정리 → 끝 문장부호 제거. 라우터/에이전트 캐시 키와 프리웜 집계가 공유."""
+    text = unicodedata.normalize("NFKC", text).lower().strip()
+    text = _WS_RE.sub(" ", text)
+    return _TRAILING_PUNCT_RE.sub("", text)
+
+
+@dataclass
+class CacheLookup:
+    """stale-while-revalidate 조회 결과. is_stale이면 soft TTL 경과 (hard TTL 이내).
+
+    ttl_s / soft_ttl_s: 남은 hard / soft TTL(초). 백엔드가 모르면 None (상위 계층 채움 시 상한 판단용).
+    """
+    value: Any
+    is_stale: bool = False
+    ttl_s: Optional[float] = None
+    soft_ttl_s: Optional[float] = None
 
 
 class CacheManager(ABC):
@@ -38,6 +64,48 @@ class CacheManager(ABC):
         """키 존재 여부 확인."""
         pass
 
+    def get_with_ttl(self, key: str) -> Optional[CacheLookup]:
+        """값 + 남은 TTL 조회 (니어 캐시 L1 채움용). 기본 구현은 TTL 미상(ttl_s=None)."""
+        value = self.get(key)
+        return None if value is None else CacheLookup(value)
+
+    # ---- stale-while-revalidate ----
+
+    def get_swr(self, key: str) -> Optional[CacheLookup]:
+        """soft/hard TTL 인지 조회. 기본 구현은 get() 결과를 항상 fresh로 반환 (SWR 미지원 백엔드)."""
+        value = self.get(key)
+        return None if value is None else CacheLookup(value)
+
+    def set_swr(self, key: str, value: Any, soft_ttl: int, hard_ttl: int) -> None:
+        """soft TTL(신선)과 hard TTL(삭제) 지정 저장. 기본 구현은 hard_ttl로 set()."""
+        self.set(key, value, hard_ttl)
+
+    def get_or_revalidate(
+        self,
+        key: str,
+        loader: Callable[[], Any],
+        soft_ttl: int,
+        hard_ttl: int,
+        revalidator=None,
+    ) -> Any:
+        """SWR 조회. fresh면 그대로, stale이면 즉시 반환하고 revalidator.schedule(key, ...)로
+        백그라운드 갱신 1회 예약 (요청 간 중복 제거), 미스면 loader() 동기 실행 후 set_swr.
+
+        revalidator: BackgroundRevalidator (None이면 get_revalidator()).
+        """
+        lookup = self.get_swr(key)
+        if lookup is not None:
+            if lookup.is_stale:
+                from .revalidator import get_revalidator
+                (revalidator or get_revalidator()).schedule(
+                    key, loader, lambda v: self.set_swr(key, v, soft_ttl, hard_ttl)
+                )
+            return lookup.value
+        value = loader()
+        if value is not None:
+            self.set_swr(key, value, soft_ttl, hard_ttl)
+        return value
+
     # ---- 공용 헬퍼 ----
 
     @staticmethod
@@ -51,10 +119,10 @@ class CacheManager(ABC):
         current_agent: Optional[str] = None, intent: Optional[str] = None,
         **kwargs,
     ) -> str:
-        """라우터 판단 캐시 키: 'router:{step}:{hash}'. session_id 미포함."""
+        """라우터 판단 캐시 키: 'router:{step}:{hash}'. user_text는 normalize_query() 후 해시, session_id 미포함."""
         ...
 
     @staticmethod
     def make_agent_cache_key(agent: str, query: str, **slots) -> str:
-        """에이전트 응답 캐시 키: 'agent:{name}:{hash}'."""
+        """에이전트 응답 캐시 키: 'agent:{name}:{hash}'. query는 normalize_query() 후 해시."""
         ...
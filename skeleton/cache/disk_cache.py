@@ -0,0 +1,165 @@
+"""SQLite 기반 온디스크 캐시 구현.
+
+MemoryCache는 재시작 시 소실되고 RedisCache는 Redis 서버가 필요하다.
+개발 머신, 벤치마크 실행, 단일 노드 배포에서도 재시작 후 웜 상태를 유지하도록
+임베디드 SQLite(WAL 모드) 파일 하나에 캐시를 보관한다.
+
+- TTL: expires_at 컬럼. 조회 시 만료 행은 미스 처리, cleanup_expired()로 일괄 삭제.
+- 크기 제한: max_bytes 초과 시 last_access 오래된 순으로 목표치(low_watermark)까지 방출.
+- 인코딩: msgpack(설치 시) 또는 JSON → zlib 압축(compress_min_bytes 이상) → BLOB. 1바이트 헤더로 포맷 표기.
+- 동시성: 연결은 스레드별(threading.local), WAL이라 읽기는 쓰기와 병행. 쓰기는 프로세스 내 락으로 직렬화.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Any, Dict, Optional
+
+from common.cache_registry import get_cache_registry
+
+from .cache_manager import CacheManager
+
+logger = logging.getLogger(__name__)
+
+try:
+    import msgpack
+except ImportError:  # 선택 의존성 — 없으면 JSON 인코딩
+    msgpack = None
+
+# 값 BLOB 첫 바이트 (인코딩 포맷)
+_FMT_JSON = 0x01
+_FMT_MSGPACK = 0x02
+_FMT_STR = 0x03
+_FLAG_ZLIB = 0x80
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache (
+    key         TEXT PRIMARY KEY,
+    value       BLOB NOT NULL,
+    size        INTEGER NOT NULL,
+    expires_at  REAL NOT NULL,
+    last_access REAL NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_cache_expires ON cache(expires_at);
+CREATE INDEX IF NOT EXISTS idx_cache_access ON cache(last_access);
+"""
+
+_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",     # WAL에서는 NORMAL이어도 손상 없음 (마지막 트랜잭션만 유실 가능)
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA busy_timeout=5000",
+)
+
+
+def encode_value(value: Any, compress_min_bytes: int = 512) -> bytes:
+    """값 → 헤더 1바이트 + 페이로드. 문자열은 UTF-8 그대로, 객체는 msgpack/JSON."""
+    if isinstance(value, str):
+        fmt, payload = _FMT_STR, value.encode("utf-8")
+    elif msgpack is not None:
+        fmt, payload = _FMT_MSGPACK, msgpack.packb(value, use_bin_type=True, default=str)
+    else:
+        fmt, payload = _FMT_JSON, json.dumps(value, ensure_ascii=False, default=str).encode("utf-8")
+    if len(payload) >= compress_min_bytes:
+        compressed = zlib.compress(payload, 6)
+        if len(compressed) < len(payload):
+            fmt, payload = fmt | _FLAG_ZLIB, compressed
+    return bytes((fmt,)) + payload
+
+
+def decode_value(blob: bytes) -> Any:
+    """encode_value의 역변환."""
+    fmt, payload = blob[0], blob[1:]
+    if fmt & _FLAG_ZLIB:
+        payload = zlib.decompress(payload)
+        fmt &= ~_FLAG_ZLIB
+    if fmt == _FMT_STR:
+        return payload.decode("utf-8")
+    if fmt == _FMT_MSGPACK:
+        return msgpack.unpackb(payload, raw=False)
+    return json.loads(payload)
+
+
+class SQLiteCache(CacheManager):
+    """SQLite(WAL) 기반 영속 캐시.
+
+    LLMCallBuilder / LLMRouter / 에이전트 어댑터의 cache_manager로 RedisCache 대신 주입 가능.
+    """
+
+    def __init__(
+        self,
+        path: str = "data/cache/llm_cache.sqlite3",
+        max_bytes: int = 512 * 1024 * 1024,
+        low_watermark: float = 0.9,
+        compress_min_bytes: int = 512,
+        access_update_interval_s: float = 60.0,
+        name: Optional[str] = None,
+    ):
+        """path: DB 파일 경로 (디렉터리 자동 생성).
+
+        access_update_interval_s: last_access 갱신 최소 간격 — 매 조회마다 쓰기가 발생하지 않도록 제한.
+        name 지정 시 CacheRegistry에 자기 등록 (/debug/cache 통계, clear/warm 대상).
+        """
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._path = path
+        self._max_bytes = max_bytes
+        self._low_watermark = low_watermark
+        self._compress_min_bytes = compress_min_bytes
+        self._access_update_interval_s = access_update_interval_s
+        self._local = threading.local()
+        self._write_lock = threading.Lock()
+        self._total_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        if name:
+            get_cache_registry().register_cache(name, self)
+
+    def _conn(self) -> sqlite3.Connection:
+        """스레드별 연결 (최초 생성 시 PRAGMA + 스키마 적용, 현재 총 크기 로드)."""
+        ...
+
+    def get(self, key: str) -> Optional[Any]:
+        """캐시 조회. 만료 행은 미스 (삭제는 cleanup_expired에 맡김)."""
+        ...
+
+    def set(self, key: str, value: Any, ttl: int = 3600) -> None:
+        """캐시 저장 (INSERT OR REPLACE). max_bytes 초과 시 _evict() 호출."""
+        ...
+
+    def delete(self, key: str) -> None:
+        """키 삭제."""
+        ...
+
+    def clear(self) -> None:
+        """전체 삭제 후 VACUUM 없이 WAL 체크포인트."""
+        ...
+
+    def exists(self, key: str) -> bool:
+        """만료되지 않은 키 존재 여부."""
+        ...
+
+    def _evict(self) -> None:
+        """만료 행 삭제 후에도 초과면 last_access 오래된 순으로 max_bytes * low_watermark까지 방출."""
+        ...
+
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 통계 (행 수, 총 바이트, hit/miss, 히트율, 방출 수, DB/WAL 파일 크기)."""
+        ...
+
+    def get_size_bytes(self) -> int:
+        """저장된 값 BLOB 총 바이트."""
+        ...
+
+    def cleanup_expired(self) -> int:
+        """만료 행 일괄 삭제. 삭제된 행 수 반환."""
+        ...
+
+    def close(self) -> None:
+        """현재 스레드 연결 종료."""
+        ...
@@ -11,7 +11,7 @@ from typing import Any, Optional, Dict
 import redis
 from redis.exceptions import RedisError
 
-from .cache_manager import CacheManager
+from .cache_manager import CacheLookup, CacheManager
 
 logger = logging.getLogger(__name__)
 
@@ -26,7 +26,9 @@ class RedisCache(CacheManager):
         password: Optional[str] = None,
         db: int = 0,
         decode_responses: bool = True,
+        name: Optional[str] = None,
     ):
+        """name 지정 시 CacheRegistry에 자기 등록 (/debug/cache 통계, clear/warm 대상)."""
         ...
 
     def get(self, key: str) -> Optional[Any]:
@@ -37,6 +39,21 @@ class RedisCache(CacheManager):
         """캐시 저장. 문자열은 그대로, 객체는 JSON 직렬화."""
         ...
 
+    def get_with_ttl(self, key: str) -> Optional[CacheLookup]:
+        """GET(해시(SWR) 키면 HMGET 'v', 's') + PTTL 파이프라인 1회 왕복.
+        ttl_s = PTTL/1000 (만료 없음(-1)이면 None), 해시 키면 soft_ttl_s = s - now."""
+        ...
+
+    def get_swr(self, key: str) -> Optional[CacheLookup]:
+        """SWR 조회. 값과 함께 저장된 soft 만료 시각(HGET 'v', 's')으로 스테일 판정.
+        HMGET + PTTL 파이프라인 1회 왕복 — 남은 hard/soft TTL을 ttl_s/soft_ttl_s로 함께 반환."""
+        ...
+
+    def set_swr(self, key: str, value: Any, soft_ttl: int, hard_ttl: int) -> None:
+        """HSET {'v': 직렬화 값, 's': now + soft_ttl} + EXPIRE hard_ttl (파이프라인 1회 왕복).
+        일반 get()은 해시 키를 만나면 'v'만 읽어 반환 (SWR 미인지 호출부 호환)."""
+        ...
+
     def delete(self, key: str) -> None:
         """키 삭제."""
         ...
@@ -49,8 +66,12 @@ class RedisCache(CacheManager):
         """키 존재 여부 확인."""
         ...
 
+    def clear_namespace(self, prefix: str) -> int:
+        """prefix로 시작하는 키 삭제 (SCAN MATCH '{prefix}*' + UNLINK 배치, KEYS 미사용). 삭제 수 반환."""
+        ...
+
     def get_stats(self) -> Dict[str, Any]:
-        """캐시 통계 (사이즈, hit/miss, 히트율, Redis 메모리 사용량)."""
+        """캐시 통계 (사이즈, hit/miss, 히트율, 스테일 히트 수, Redis 메모리 사용량)."""
         ...
 
     def get_size_bytes(self) -> int:
@@ -0,0 +1,82 @@
+"""stale-while-revalidate 백그라운드 갱신기.
+
+인기 크로스 유저 엔트리가 만료되면 다음 사용자가 콜드 경로(CS 최대 ~20초)를 그대로 치른다.
+soft TTL과 hard TTL 사이에서는 스테일 값을 즉시 반환하고, 갱신은 여기서 백그라운드로 1회만 실행한다.
+
+- 프로세스 내 중복 제거: in-flight 키 집합 (같은 키의 갱신 예약은 첫 건만 실행, 나머지는 deduped)
+- 프로세스 간 중복 제거(선택): SingleFlight.acquire_remote() — Redis SET NX PX 단기 락
+- 갱신 실패 시 스테일 값은 hard TTL까지 계속 서빙 (다음 스테일 조회에서 재시도)
+"""
+
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+
+class BackgroundRevalidator:
+    """키 단위로 중복 제거되는 백그라운드 캐시 갱신 실행기."""
+
+    def __init__(self, max_workers: int = 4, single_flight=None):
+        """single_flight: SingleFlight (선택). redis_client가 설정돼 있으면 워커 간 갱신도 1회로 제한."""
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="swr")
+        self._single_flight = single_flight
+        self._inflight: Set[str] = set()
+        self._lock = threading.Lock()
+        self._stats = {
+            "stale_serves": 0, "refresh_scheduled": 0, "refresh_deduped": 0,
+            "refresh_ok": 0, "refresh_failed": 0, "remote_skipped": 0,
+        }
+
+    def schedule(
+        self,
+        key: str,
+        loader: Callable[[], Any],
+        store: Callable[[Any], None],
+    ) -> bool:
+        """스테일 서빙 1건 기록 후 갱신 예약. 이미 갱신 중이거나 제출 실패면 False.
+
+        loader(): 새 값 계산 (LLM/에이전트 호출), store(value): cache.set_swr로 저장.
+        """
+        with self._lock:
+            self._stats["stale_serves"] += 1
+            if key in self._inflight:
+                self._stats["refresh_deduped"] += 1
+                return False
+            self._inflight.add(key)
+            self._stats["refresh_scheduled"] += 1
+        try:
+            self._executor.submit(self._run, key, loader, store)
+        except Exception:
+            # 종료된 executor(RuntimeError) 등 — in-flight 키를 남기면 이후 갱신이 영구히 dedupe된다
+            with self._lock:
+                self._inflight.discard(key)
+                self._stats["refresh_failed"] += 1
+            logger.warning("revalidation submit failed for %s", key, exc_info=True)
+            return False
+        return True
+
+    def _run(self, key: str, loader: Callable[[], Any], store: Callable[[Any], None]) -> None:
+        """갱신 실행. 원격 락 획득 실패 시(다른 워커가 갱신 중) 건너뜀. 예외는 로깅 후 refresh_failed."""
+        ...
+
+    def stats(self) -> Dict[str, Any]:
+        """스테일 서빙 수, 갱신 예약/중복 제거/성공/실패/원격 스킵 수, 현재 in-flight 수."""
+        ...
+
+    def shutdown(self) -> None:
+        """실행기 종료 (앱 shutdown)."""
+        self._executor.shutdown(wait=False)
+
+
+_global_revalidator: Optional[BackgroundRevalidator] = None
+
+
+def get_revalidator() -> BackgroundRevalidator:
+    """프로세스 전역 BackgroundRevalidator 싱글톤 반환."""
+    global _global_revalidator
+    if _global_revalidator is None:
+        _global_revalidator = BackgroundRevalidator()
+    return _global_revalidator
@@ -0,0 +1,100 @@
+"""라우터 판단 시맨틱 근사 중복 캐시.
+
+make_router_cache_key()는 raw user_text 해시라서 "건성 피부 보습제 추천해줘"와
+"건성피부 보습제 추천 좀"이 서로 미스난다. 이 레이어는 (step, current_agent) 버킷마다
+캐시된 발화 임베딩을 고정 크기 float32 행렬로 보관하고, 코사인 유사도가 임계치 이상이면
+저장된 판단을 반환한다. 정확 일치 캐시(CacheManager) 미스 후에만 조회.
+"""
+
+from __future__ import annotations
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import logging
+import random
+import threading
+import time
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SemanticCacheConfig:
+    """시맨틱 라우터 캐시 설정."""
+    similarity_threshold: float = 0.93   # 이 이상이면 히트
+    max_entries_per_bucket: int = 2048   # 버킷별 행렬 크기 상한 (초과 시 LRU 방출)
+    ttl: int = 1800                      # 라우터 캐시 TTL과 동일 (초)
+    verify_sample_rate: float = 0.02     # 히트 중 LLM으로 재판단해 false-hit 측정할 비율
+
+
+@dataclass
+class _Bucket:
+    """(step, current_agent) 버킷. 행 i = 엔트리 i."""
+    matrix: np.ndarray                                  # (capacity, D) L2 정규화 임베딩
+    values: List[Any] = field(default_factory=list)
+    texts: List[str] = field(default_factory=list)
+    expires_at: Optional[np.ndarray] = None             # (capacity,) float64
+    last_used: Optional[np.ndarray] = None              # (capacity,) float64, LRU 방출용
+    size: int = 0
+
+
+class SemanticRouterCache:
+    """임베딩 유사도 기반 라우터 판단 캐시 (스레드 안전).
+
+    embed_fn: str -> (D,) 임베딩. LocalIntentClassifier와 같은 임베딩을 공유하면
+    라우팅 1회당 임베딩 호출이 1회로 유지된다.
+    """
+
+    def __init__(
+        self,
+        embed_fn: Callable[[str], np.ndarray],
+        config: Optional[SemanticCacheConfig] = None,
+    ):
+        self._embed_fn = embed_fn
+        self.config = config or SemanticCacheConfig()
+        self._buckets: Dict[Tuple[str, str], _Bucket] = {}
+        self._lock = threading.Lock()
+        self._stats = {
+            "hits": 0, "misses": 0, "evictions": 0,
+            "verified": 0, "false_hits": 0,
+        }
+
+    def _nearest(self, bucket: _Bucket, query_vec: np.ndarray, now: float) -> Tuple[int, float]:
+        """만료되지 않은 행 중 최고 코사인 유사도 (인덱스, 점수). 없으면 (-1, 0.0)."""
+        n = bucket.size
+        if n == 0:
+            return -1, 0.0
+        sims = bucket.matrix[:n] @ query_vec
+        sims[bucket.expires_at[:n] < now] = -1.0
+        idx = int(np.argmax(sims))
+        return idx, float(sims[idx])
+
+    def lookup(
+        self, step: str, user_text: str, current_agent: Optional[str] = None
+    ) -> Optional[Tuple[Any, float]]:
+        """임계치 이상 근사 히트면 (캐시된 판단, 유사도), 아니면 None."""
+        ...
+
+    def store(
+        self, step: str, user_text: str, value: Any,
+        current_agent: Optional[str] = None, ttl: Optional[int] = None,
+    ) -> None:
+        """판단 저장. 버킷이 가득 차면 만료 행 → last_used 최소 행 순으로 덮어씀."""
+        ...
+
+    def should_verify(self) -> bool:
+        """이번 히트를 샘플 검증할지 여부 (verify_sample_rate 확률)."""
+        return random.random() < self.config.verify_sample_rate
+
+    def report_verification(self, matched: bool) -> None:
+        """샘플 검증 결과 기록. LLM 판단과 캐시 판단이 다르면 false hit."""
+        ...
+
+    def clear(self) -> None:
+        """전체 버킷 삭제."""
+        ...
+
+    def get_stats(self) -> Dict[str, Any]:
+        """hit/miss/eviction, 히트율, 검증 표본 기준 false-hit 비율, 버킷별 엔트리 수."""
+        ...
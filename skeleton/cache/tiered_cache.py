@@ -0,0 +1,176 @@
+"""2단 니어 캐시: 프로세스 로컬 MemoryCache(L1) + 공유 RedisCache(L2).
+
+RedisCache.get은 가장 뜨거운 라우터 키조차 매번 네트워크 왕복 + JSON 디코드를 치른다.
+MemoryCache 단독으로는 uvicorn 워커 간 공유가 안 된다. 두 계층을 합성한다:
+
+- read-through: L1 → (미스) L2 → (히트) L1 채움
+- write-through: L2 저장 후 L1 저장
+- 일관성: set(덮어쓰기)/delete/clear 시 Redis pub/sub로 무효화 메시지 발행 →
+  다른 워커의 리스너 스레드가 자기 L1에서 해당 키 제거. 자기 메시지는 origin으로 무시.
+- 메시지 유실(리스너 재연결 구간) 대비 L1 TTL은 l1_max_ttl로 상한 → 최대 스테일 시간 제한.
+- L2 히트로 L1을 채울 때는 L2의 남은 TTL(PTTL)도 상한 → L1이 L2보다 오래 살지 않는다.
+"""
+
+import logging
+import threading
+import uuid
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from common.cache_registry import get_cache_registry
+from common.memory_cache import MemoryCache
+
+from .cache_manager import CacheLookup, CacheManager
+
+logger = logging.getLogger(__name__)
+
+_CLEAR_ALL = "*"
+
+
+@dataclass
+class TieredCacheConfig:
+    """니어 캐시 설정."""
+    channel: str = "cache:invalidate"
+    l1_max_ttl: int = 300            # L1 TTL 상한 (초). 무효화 메시지 유실 시 최대 스테일 시간
+    l1_max_bytes: int = 64 * 1024 * 1024
+    publish_on_set: bool = True      # 덮어쓰기도 무효화 발행 (신규 키만 쓰는 워크로드면 False로 절감)
+
+
+class TieredCache(CacheManager):
+    """MemoryCache(L1) + RedisCache(L2) 합성 CacheManager.
+
+    LLMCallBuilder / LLMRouter / 에이전트 어댑터의 cache_manager로 RedisCache 대신 주입.
+    """
+
+    def __init__(
+        self,
+        l2: CacheManager,
+        l1: Optional[MemoryCache] = None,
+        redis_client=None,
+        config: Optional[TieredCacheConfig] = None,
+        name: Optional[str] = None,
+    ):
+        """l2: RedisCache. redis_client: pub/sub용 클라이언트 (None이면 무효화 전파 없이 L1 TTL에만 의존).
+
+        name 지정 시 CacheRegistry에 자기 등록하고, 내부 생성 L1은 '{name}.l1'로 함께 등록.
+        """
+        self.config = config or TieredCacheConfig()
+        self._l1 = l1 or MemoryCache(
+            max_bytes=self.config.l1_max_bytes, name=f"{name}.l1" if name else None,
+        )
+        self._l2 = l2
+        self._redis = redis_client
+        self._origin = uuid.uuid4().hex[:12]
+        self._listener: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._stats = {
+            "l1_hits": 0, "l2_hits": 0, "misses": 0,
+            "invalidations_sent": 0, "invalidations_received": 0,
+        }
+        if name:
+            get_cache_registry().register_cache(name, self)
+
+    # ---- CacheManager ----
+
+    def _fill_l1(self, key: str, lookup: CacheLookup) -> None:
+        """L2 조회 결과로 L1 채움. TTL은 min(l1_max_ttl, L2 남은 TTL), 남은 soft TTL이 있으면 함께 적용."""
+        ttl = self.config.l1_max_ttl
+        if lookup.ttl_s is not None:
+            ttl = min(ttl, lookup.ttl_s)
+        if ttl <= 0:
+            return
+        soft_ttl = None
+        if lookup.soft_ttl_s is not None:
+            soft_ttl = max(0, min(lookup.soft_ttl_s, ttl))
+        self._l1.set(key, lookup.value, ttl=ttl, soft_ttl=soft_ttl)
+
+    def get(self, key: str) -> Optional[Any]:
+        """L1 → L2 순 조회. L2 히트는 남은 TTL 기준으로 L1에 채운다 (_fill_l1)."""
+        value = self._l1.get(key)
+        if value is not None:
+            self._incr("l1_hits")
+            return value
+        lookup = self._l2.get_with_ttl(key)
+        if lookup is None:
+            self._incr("misses")
+            return None
+        self._incr("l2_hits")
+        self._fill_l1(key, lookup)
+        return lookup.value
+
+    def set(self, key: str, value: Any, ttl: int = 3600) -> None:
+        """write-through. L2 저장 → 무효화 발행 → L1 저장 (순서상 자기 L1은 최신값 유지)."""
+        self._l2.set(key, value, ttl)
+        if self.config.publish_on_set:
+            self._publish(key)
+        self._l1.set(key, value, ttl=min(ttl, self.config.l1_max_ttl))
+
+    def delete(self, key: str) -> None:
+        """L2/L1 삭제 후 무효화 발행."""
+        self._l2.delete(key)
+        self._l1.invalidate(key)
+        self._publish(key)
+
+    def clear(self) -> None:
+        """L2/L1 전체 삭제 후 전체 무효화 발행."""
+        self._l2.clear()
+        self._l1.clear()
+        self._publish(_CLEAR_ALL)
+
+    def get_swr(self, key: str) -> Optional[CacheLookup]:
+        """L1 get_swr → L2 get_swr. L2 스테일 값은 L1에 채우지 않는다 (갱신 후 set_swr가 채움)."""
+        hit = self._l1.get_swr(key)
+        if hit is not None:
+            self._incr("l1_hits")
+            return CacheLookup(value=hit[0], is_stale=hit[1])
+        lookup = self._l2.get_swr(key)
+        if lookup is None:
+            self._incr("misses")
+            return None
+        self._incr("l2_hits")
+        if not lookup.is_stale:
+            self._fill_l1(key, lookup)
+        return lookup
+
+    def set_swr(self, key: str, value: Any, soft_ttl: int, hard_ttl: int) -> None:
+        """L2 set_swr → 무효화 발행 → L1 set(soft_ttl, ttl=min(hard_ttl, l1_max_ttl))."""
+        self._l2.set_swr(key, value, soft_ttl, hard_ttl)
+        if self.config.publish_on_set:
+            self._publish(key)
+        l1_ttl = min(hard_ttl, self.config.l1_max_ttl)
+        self._l1.set(key, value, ttl=l1_ttl, soft_ttl=min(soft_ttl, l1_ttl))
+
+    def exists(self, key: str) -> bool:
+        """L1에 있으면 True, 아니면 L2 확인. L1은 peek — 존재 확인이 히트 통계/admission 빈도를 부풀리지 않는다."""
+        return self._l1.peek(key) is not None or self._l2.exists(key)
+
+    # ---- 무효화 전파 ----
+
+    def _publish(self, key: str) -> None:
+        """'{origin}|{key}' 발행. Redis 오류는 경고 후 무시 (L1 TTL 상한이 안전망)."""
+        ...
+
+    def start_invalidation_listener(self) -> None:
+        """pub/sub 구독 데몬 스레드 시작 (앱 startup에서 1회). 연결 끊김 시 백오프 후 재구독하며,
+        재구독 직후에는 유실 구간 보호를 위해 L1 전체를 비운다."""
+        ...
+
+    def _on_message(self, data: str) -> None:
+        """수신 메시지 처리. 자기 origin 무시, '*'면 L1 전체 비움, 아니면 키 1개 invalidate."""
+        ...
+
+    def stop(self) -> None:
+        """리스너 종료 (앱 shutdown)."""
+        ...
+
+    # ---- 통계 ----
+
+    def _incr(self, name: str) -> None:
+        with self._lock:
+            self._stats[name] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """계층별 히트율: l1_hit_rate(전체 조회 대비), l2_hit_rate(L1 미스 대비), 전체 히트율,
+        무효화 송수신 수, 리스너 상태, 하위 L1 stats() / L2 get_stats()."""
+        ...
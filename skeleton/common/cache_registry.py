@@ -0,0 +1,300 @@
+"""캐시 레이어 중앙 레지스트리 (통합 통계, clear/warm API).
+
+4개 캐시 레이어가 각자 다른 모양으로 통계를 내고, lru_cache는 통계 자체가 없어
+TTL/크기를 감으로 조정하고 있었다. 모든 레이어가 여기에 등록하고,
+/debug/cache 엔드포인트는 snapshot() / clear() / warm()만 호출한다.
+
+통일 스키마 (CacheLayerStats):
+  hits, misses, hit_rate, stale_hits(SWR 스테일 서빙, 모르면 None), evictions, size(엔트리 수),
+  bytes(추정, 모르면 None), get_latency_us(EWMA), get_latency_max_us
+
+등록은 캐시가 만들어지는 곳에서 한다: MemoryCache / SQLiteCache / TieredCache는 name 인자로 자기 등록,
+RAGCache와 lru_cache 함수는 싱글톤/모듈 로드 시 등록. 키-값 캐시의 get은 timed()로 감싸 지연을 샘플링한다.
+인스턴스는 weakref로 보관 — GC된 캐시의 레이어는 layers() 조회 시 정리된다.
+
+레이어 종류별 어댑터:
+  - MemoryCache: stats() / clear() / set()
+  - RAGCache: get_stats() / clear()
+  - CacheManager 구현체(Redis/SQLite/Tiered): get_stats() / clear() / set()
+  - functools.lru_cache 함수: cache_info() / cache_clear() (bytes, evictions는 None)
+
+SimpleCache(문서상 함수 레벨 메모이제이션 레이어)는 이 트리에 구현이 없다 — 추가 시 register_cache로 등록.
+"""
+
+from __future__ import annotations
+
+import itertools
+import logging
+import threading
+import time
+import weakref
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+StatsFn = Callable[[], Dict[str, Any]]
+
+
+@dataclass
+class CacheLayerStats:
+    """레이어 통계 (통일 스키마)."""
+    name: str
+    kind: str
+    hits: int = 0
+    misses: int = 0
+    hit_rate: float = 0.0
+    stale_hits: Optional[int] = None
+    evictions: Optional[int] = None
+    size: Optional[int] = None
+    bytes: Optional[int] = None
+    get_latency_us: Optional[float] = None
+    get_latency_max_us: Optional[float] = None
+    namespaces: List[str] = field(default_factory=list)
+
+
+@dataclass
+class _Layer:
+    name: str
+    kind: str
+    stats_fn: StatsFn
+    clear_fn: Callable[[], Any]
+    clear_namespace_fn: Optional[Callable[[str], int]] = None
+    warm_fn: Optional[Callable[[Iterable[Tuple[Any, Any]]], int]] = None
+    namespaces: List[str] = field(default_factory=list)
+    latency_ewma_us: Optional[float] = None
+    latency_max_us: float = 0.0
+    ref: Optional[weakref.ReferenceType] = None    # register_cache 인스턴스 (죽으면 레이어 자동 제거)
+
+    @property
+    def alive(self) -> bool:
+        return self.ref is None or self.ref() is not None
+
+
+def _weak_call(ref: weakref.ReferenceType, attr: str) -> Callable[..., Any]:
+    """인스턴스를 강참조하지 않고 메서드를 호출하는 콜백. 인스턴스가 사라졌으면 ReferenceError."""
+    def call(*args):
+        obj = ref()
+        if obj is None:
+            raise ReferenceError(f"cache instance for '{attr}' was garbage collected")
+        return getattr(obj, attr)(*args)
+    return call
+
+
+def _normalize(raw: Dict[str, Any]) -> Dict[str, Any]:
+    """레이어별 통계 키 → 통일 스키마 키. 알 수 없는 키는 버린다."""
+    hits = int(raw.get("hits", raw.get("l1_hits", 0) + raw.get("l2_hits", 0)) or 0)
+    misses = int(raw.get("misses", 0) or 0)
+    total = hits + misses
+    return {
+        "hits": hits,
+        "misses": misses,
+        "hit_rate": round(hits / total, 4) if total else 0.0,
+        "stale_hits": raw.get("stale_hits", raw.get("stale_serves")),
+        "evictions": raw.get("evictions"),
+        "size": raw.get("size", raw.get("currsize", raw.get("entries"))),
+        "bytes": raw.get("bytes", raw.get("used_bytes", raw.get("size_bytes"))),
+    }
+
+
+class CacheRegistry:
+    """프로세스 전역 캐시 레이어 레지스트리 (스레드 안전)."""
+
+    LATENCY_ALPHA = 0.1
+    LATENCY_SAMPLE_EVERY = 16      # timed() 래퍼는 get N회 중 1회만 측정
+
+    def __init__(self):
+        self._layers: Dict[str, _Layer] = {}
+        self._lock = threading.Lock()
+
+    # ---- 등록 ----
+
+    def register(
+        self,
+        name: str,
+        kind: str,
+        stats_fn: StatsFn,
+        clear_fn: Callable[[], Any],
+        clear_namespace_fn: Optional[Callable[[str], int]] = None,
+        warm_fn: Optional[Callable[[Iterable[Tuple[Any, Any]]], int]] = None,
+        namespaces: Optional[List[str]] = None,
+        ref: Optional[weakref.ReferenceType] = None,
+    ) -> None:
+        """레이어 등록. 같은 name 재등록은 교체 (싱글톤 재생성/테스트 대비)."""
+        with self._lock:
+            self._layers[name] = _Layer(
+                name, kind, stats_fn, clear_fn, clear_namespace_fn, warm_fn, list(namespaces or []), ref=ref,
+            )
+
+    def register_cache(
+        self,
+        name: str,
+        cache: Any,
+        namespaces: Optional[List[str]] = None,
+        warm_fn: Optional[Callable[[Iterable[Tuple[Any, Any]]], int]] = None,
+        time_get: bool = True,
+    ) -> Any:
+        """MemoryCache / RAGCache / CacheManager 인스턴스 등록 (메서드 이름으로 어댑터 선택). cache 그대로 반환.
+
+        warm_fn 미지정 시 키-값 캐시(MemoryCache, CacheManager)는 set(key, value)로 채운다.
+        time_get=True면 인스턴스의 get을 timed()로 감싸 get_latency_us를 채운다 (재등록 시 중복 래핑 안 함).
+        인스턴스는 weakref로만 보관 — 같은 name으로 재생성된 캐시가 이전 인스턴스를 붙잡지 않는다.
+        """
+        ref = weakref.ref(cache)
+        stats_attr = "get_stats" if hasattr(cache, "get_stats") else "stats"
+        if warm_fn is not None and getattr(warm_fn, "__self__", None) is cache:
+            warm_fn = _weak_call(ref, warm_fn.__name__)
+        elif warm_fn is None and (hasattr(cache, "invalidate") or hasattr(cache, "exists")):
+            set_fn = _weak_call(ref, "set")
+
+            def warm_fn(entries):
+                n = 0
+                for key, value in entries:
+                    set_fn(key, value)
+                    n += 1
+                return n
+        self.register(
+            name, type(cache).__name__, _weak_call(ref, stats_attr), _weak_call(ref, "clear"),
+            clear_namespace_fn=_weak_call(ref, "clear_namespace") if hasattr(cache, "clear_namespace") else None,
+            warm_fn=warm_fn, namespaces=namespaces, ref=ref,
+        )
+        get = getattr(cache, "get", None)
+        if time_get and get is not None and not getattr(get, "_cache_timed", False):
+            cache.get = self.timed(name, get)
+        return cache
+
+    def register_lru(self, name: str, fn: Callable) -> Callable:
+        """functools.lru_cache 함수 등록. warm은 인자 튜플 리스트로 함수를 호출해 채운다. fn 그대로 반환."""
+        def stats() -> Dict[str, Any]:
+            info = fn.cache_info()
+            return {"hits": info.hits, "misses": info.misses, "currsize": info.currsize, "maxsize": info.maxsize}
+
+        def warm(entries) -> int:
+            n = 0
+            for args, _ in entries:
+                fn(*args)
+                n += 1
+            return n
+
+        self.register(name, "lru_cache", stats, fn.cache_clear, warm_fn=warm)
+        return fn
+
+    def unregister(self, name: str) -> None:
+        with self._lock:
+            self._layers.pop(name, None)
+
+    # ---- 계측 ----
+
+    def record_get_latency(self, name: str, latency_us: float) -> None:
+        """레이어 get 지연 기록 (EWMA + 최대, 레지스트리 락 안에서 갱신). 호출 측은 샘플링 권장."""
+        with self._lock:
+            layer = self._layers.get(name)
+            if layer is None:
+                return
+            if layer.latency_ewma_us is None:
+                layer.latency_ewma_us = latency_us
+            else:
+                layer.latency_ewma_us += self.LATENCY_ALPHA * (latency_us - layer.latency_ewma_us)
+            layer.latency_max_us = max(layer.latency_max_us, latency_us)
+
+    def timed(self, name: str, fn: Callable[..., Any], sample_every: Optional[int] = None) -> Callable[..., Any]:
+        """get 계열 함수를 감싸 지연을 기록하는 래퍼 반환. sample_every(기본 LATENCY_SAMPLE_EVERY)회 중 1회만 측정."""
+        every = max(1, sample_every or self.LATENCY_SAMPLE_EVERY)
+        counter = itertools.count()
+
+        def wrapper(*args, **kwargs):
+            if next(counter) % every:
+                return fn(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self.record_get_latency(name, (time.perf_counter() - start) * 1e6)
+        wrapper._cache_timed = True
+        return wrapper
+
+    # ---- 조회 / 조작 (/debug/cache) ----
+
+    def layers(self) -> List[str]:
+        """살아 있는 레이어 이름 (인스턴스가 GC된 레이어는 여기서 정리)."""
+        with self._lock:
+            for name in [n for n, layer in self._layers.items() if not layer.alive]:
+                del self._layers[name]
+            return sorted(self._layers)
+
+    def _layer(self, name: str) -> _Layer:
+        """등록된 레이어. 없거나 인스턴스가 GC됐으면 ValueError (엔드포인트는 404로 변환)."""
+        layer = self._layers.get(name)
+        if layer is None or not layer.alive:
+            raise ValueError(f"unknown cache layer '{name}'")
+        return layer
+
+    def stats(self, name: str) -> CacheLayerStats:
+        """단일 레이어 통일 통계. stats_fn 예외는 로깅 후 빈 통계. 미등록 name은 ValueError."""
+        layer = self._layer(name)
+        try:
+            normalized = _normalize(layer.stats_fn() or {})
+        except Exception as e:
+            logger.warning("cache stats failed for %s: %s", name, e)
+            normalized = {}
+        return CacheLayerStats(
+            name=name, kind=layer.kind, namespaces=list(layer.namespaces),
+            get_latency_us=layer.latency_ewma_us,
+            get_latency_max_us=layer.latency_max_us or None,
+            **normalized,
+        )
+
+    def snapshot(self) -> Dict[str, Any]:
+        """GET /debug/cache 응답: 레이어별 통일 통계 + 전체 합계 히트율."""
+        layers = []
+        for name in self.layers():
+            try:
+                layers.append(asdict(self.stats(name)))
+            except ValueError:   # 조회 도중 unregister됨
+                continue
+        hits = sum(l["hits"] for l in layers)
+        misses = sum(l["misses"] for l in layers)
+        return {
+            "layers": layers,
+            "total": {"hits": hits, "misses": misses, "hit_rate": round(hits / (hits + misses), 4) if hits + misses else 0.0},
+        }
+
+    def clear(self, name: Optional[str] = None, namespace: Optional[str] = None) -> Dict[str, Any]:
+        """POST /debug/cache/clear. name 없으면 전체 레이어, namespace 지정 시 해당 prefix만
+        (clear_namespace_fn 없는 레이어는 건너뛰고 skipped로 보고). 미등록 name은 ValueError."""
+        if name:
+            self._layer(name)
+        targets = [name] if name else self.layers()
+        cleared, skipped = [], []
+        for target in targets:
+            layer = self._layers.get(target)
+            if layer is None or not layer.alive:
+                continue
+            if namespace is None:
+                layer.clear_fn()
+                cleared.append(target)
+            elif layer.clear_namespace_fn is not None:
+                layer.clear_namespace_fn(namespace)
+                cleared.append(target)
+            else:
+                skipped.append(target)
+        return {"cleared": cleared, "skipped": skipped, "namespace": namespace}
+
+    def warm(self, name: str, entries: Iterable[Tuple[Any, Any]]) -> int:
+        """POST /debug/cache/warm. (key, value) 또는 lru_cache면 (args, None) 목록으로 채운다. 채운 수 반환.
+        미등록 name 또는 warm 미지원 레이어는 ValueError."""
+        layer = self._layer(name)
+        if layer.warm_fn is None:
+            raise ValueError(f"cache layer '{name}' does not support warm")
+        return layer.warm_fn(entries)
+
+
+_global_cache_registry: Optional[CacheRegistry] = None
+
+
+def get_cache_registry() -> CacheRegistry:
+    """프로세스 전역 CacheRegistry 싱글톤 반환."""
+    global _global_cache_registry
+    if _global_cache_registry is None:
+        _global_cache_registry = CacheRegistry()
+    return _global_cache_registry
@@ -0,0 +1,67 @@
+"""협조적 취소 토큰 (ContextVar 기반).
+
+동기 에이전트 process()는 asyncio.to_thread로 실행되므로 asyncio.wait_for 취소가 스레드를 멈추지 못한다.
+슈퍼바이저는 실행 전에 CancelToken을 바인딩하고(to_thread는 컨텍스트를 복사하므로 스레드에서도 보임),
+기한 초과 시 cancel()한다. LLMCallBuilder와 에이전트 그래프 노드 경계가 check()를 호출해
+다음 LLM 호출 전에 AgentCancelled로 빠져나온다 — 이미 진행 중인 LLM 호출 1건은 끝까지 실행된다.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from contextvars import ContextVar, Token
+from typing import Optional
+
+
+class AgentCancelled(Exception):
+    """취소 토큰이 취소된 뒤 체크포인트에 도달함."""
+
+
+class CancelToken:
+    """스레드 안전 취소 플래그 + 선택적 절대 기한(monotonic)."""
+
+    def __init__(self, deadline_s: Optional[float] = None):
+        self._event = threading.Event()
+        self._deadline = time.monotonic() + deadline_s if deadline_s is not None else None
+
+    def cancel(self) -> None:
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        if self._deadline is not None and time.monotonic() >= self._deadline:
+            self._event.set()
+        return self._event.is_set()
+
+    def check(self) -> None:
+        """취소됐으면 AgentCancelled."""
+        if self.cancelled:
+            raise AgentCancelled()
+
+
+_current_cancel_token: ContextVar[Optional[CancelToken]] = ContextVar(
+    "_current_cancel_token", default=None
+)
+
+
+def get_cancel_token() -> Optional[CancelToken]:
+    """현재 컨텍스트의 CancelToken (미바인딩 시 None)."""
+    return _current_cancel_token.get()
+
+
+def set_cancel_token(token: CancelToken) -> Token:
+    """현재 컨텍스트에 CancelToken 바인딩."""
+    return _current_cancel_token.set(token)
+
+
+def reset_cancel_token(token: Token) -> None:
+    """ContextVar를 이전 값으로 복원."""
+    _current_cancel_token.reset(token)
+
+
+def check_cancelled() -> None:
+    """바인딩된 토큰이 취소됐으면 AgentCancelled (미바인딩이면 no-op)."""
+    token = _current_cancel_token.get()
+    if token is not None:
+        token.check()
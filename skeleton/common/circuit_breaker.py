@@ -0,0 +1,137 @@
+"""모델별 서킷 브레이커 + 폴백 체인.
+
+gpt-4o가 저하되면 기존에는 매 턴, 매 호출마다 max_retries만큼 재시도하며 타임아웃을 반복했다.
+브레이커는 최근 호출의 에러율/지연 초과율을 보고 모델을 OPEN으로 전환하고,
+OPEN 동안 호출은 폴백 체인(gpt-4o → gpt-4o-mini)의 다음 모델로 즉시 보낸다.
+open_duration_s 후 HALF_OPEN에서 소수 probe만 원 모델로 보내 회복을 확인한다.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitState:
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@dataclass
+class CircuitBreakerConfig:
+    """브레이커 임계치."""
+    window: int = 50                  # 최근 N개 호출 결과 기준
+    min_calls: int = 10               # 표본 부족 시 OPEN 전환 안 함
+    error_rate_threshold: float = 0.5
+    slow_call_ms: float = 20_000.0    # 이보다 느리면 slow call
+    slow_rate_threshold: float = 0.5
+    open_duration_s: float = 30.0
+    half_open_max_probes: int = 3     # HALF_OPEN에서 동시에 허용할 probe 수
+    half_open_success_to_close: int = 3
+
+
+DEFAULT_FALLBACK_CHAINS: Dict[str, List[str]] = {
+    "gpt-4o": ["gpt-4o-mini"],
+}
+
+
+class CircuitBreaker:
+    """단일 모델 브레이커 (스레드 안전)."""
+
+    def __init__(self, model: str, config: Optional[CircuitBreakerConfig] = None):
+        self.model = model
+        self.config = config or CircuitBreakerConfig()
+        self.state = CircuitState.CLOSED
+        self._results: Deque[Tuple[bool, float]] = deque(maxlen=self.config.window)  # (ok, latency_ms)
+        self._opened_at = 0.0
+        self._probes_in_flight = 0
+        self._probe_successes = 0
+        self._lock = threading.Lock()
+        self.transitions: List[Tuple[float, str]] = []
+
+    def allow_request(self) -> bool:
+        """이 모델로 보내도 되는지. OPEN 만료 시 HALF_OPEN 전환 후 probe 슬롯 배정."""
+        with self._lock:
+            if self.state == CircuitState.OPEN:
+                if time.monotonic() - self._opened_at < self.config.open_duration_s:
+                    return False
+                self._transition(CircuitState.HALF_OPEN)
+            if self.state == CircuitState.HALF_OPEN:
+                if self._probes_in_flight >= self.config.half_open_max_probes:
+                    return False
+                self._probes_in_flight += 1
+            return True
+
+    def release_probe(self) -> None:
+        """결과 기록 없이 probe 슬롯 반환 (allow_request 후 레이트 리미터 거절, 취소 등).
+        호출 측은 allow_request()가 True면 finally에서 record_* 또는 이 메서드 중 하나를 반드시 호출."""
+        with self._lock:
+            if self.state == CircuitState.HALF_OPEN and self._probes_in_flight > 0:
+                self._probes_in_flight -= 1
+
+    def record_success(self, latency_ms: float) -> None:
+        """성공 기록. HALF_OPEN에서 연속 성공이 기준 도달 시 CLOSED. slow call은 실패율과 별도 집계."""
+        ...
+
+    def record_failure(self, latency_ms: float, error: Optional[BaseException] = None) -> None:
+        """실패 기록 (타임아웃, 5xx, 연결 오류. 4xx 요청 오류는 제외). HALF_OPEN 실패 시 즉시 OPEN."""
+        ...
+
+    def _evaluate(self) -> None:
+        """window 기준 에러율/slow 비율이 임계치 이상이면 OPEN."""
+        ...
+
+    def _transition(self, new_state: str) -> None:
+        """상태 전환 + 로그 + transitions 기록 (OPEN 진입 시 _opened_at 갱신)."""
+        ...
+
+    def snapshot(self) -> Dict[str, Any]:
+        """state, 에러율, slow 비율, 남은 OPEN 시간."""
+        ...
+
+
+class ModelFallbackChain:
+    """모델별 브레이커 모음 + 폴백 체인 해석."""
+
+    def __init__(
+        self,
+        chains: Optional[Dict[str, List[str]]] = None,
+        config: Optional[CircuitBreakerConfig] = None,
+    ):
+        self._chains = chains or DEFAULT_FALLBACK_CHAINS
+        self._config = config or CircuitBreakerConfig()
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def breaker(self, model: str) -> CircuitBreaker:
+        """모델 브레이커 (없으면 생성)."""
+        ...
+
+    def select(self, model: str, skip: Optional[Set[str]] = None) -> Optional[str]:
+        """요청 모델부터 체인 순서로 allow_request()가 True인 첫 모델. 전부 OPEN이면 None.
+
+        skip: 이번 호출에서 이미 타임아웃 난 모델 — 브레이커 상태와 무관하게 건너뛴다.
+        """
+        ...
+
+    def snapshot(self) -> Dict[str, Any]:
+        """모델별 브레이커 상태 (/debug 용)."""
+        ...
+
+
+_global_fallback_chain: Optional[ModelFallbackChain] = None
+
+
+def get_fallback_chain() -> ModelFallbackChain:
+    """프로세스 전역 ModelFallbackChain 싱글톤 반환."""
+    global _global_fallback_chain
+    if _global_fallback_chain is None:
+        _global_fallback_chain = ModelFallbackChain()
+    return _global_fallback_chain
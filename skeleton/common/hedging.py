@@ -0,0 +1,96 @@
+"""QUICK 호출용 hedged request (꼬리 지연 절단).
+
+라우팅/분류 호출은 수 %가 중앙값의 5-10배 걸린다. 모델별 최근 지연 분포의 p-분위수까지
+응답이 없으면 동일 요청을 한 번 더 보내고, 먼저 온 응답을 쓴다. 비동기 경로는 패자 태스크를 취소하지만,
+동기 경로는 스레드를 중단할 수 없어 패자 요청이 끝까지 실행되고 결과만 버린다 (토큰 비용은 그대로 발생).
+p95 지연 기준이면 hedge는 최대 ~5% 호출에서만 발생 → p50 비용은 거의 그대로, p99만 줄어든다.
+"""
+
+from __future__ import annotations
+
+import bisect
+import logging
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class HedgePolicy:
+    """hedge 발동 정책."""
+    percentile: float = 0.95       # 이 분위수 지연을 넘기면 hedge
+    min_delay_ms: float = 300.0    # 분위수가 너무 낮아도 이 시간은 기다림
+    max_delay_ms: float = 5_000.0
+    min_samples: int = 50          # 표본 부족 시 hedge 안 함
+    window: int = 500              # 모델별 최근 N개 지연만 사용
+    max_hedge_ratio: float = 0.10  # 최근 호출 중 hedge 비율 상한 (장애 시 부하 2배 방지)
+
+
+class LatencyHistogram:
+    """최근 window개 지연(ms) 롤링 분포 (정렬 리스트 유지).
+
+    분위수 조회는 인덱싱 O(1). add는 bisect 탐색 O(log n) + insort/del 원소 이동 O(n) — window(기본 500)가 작아 무방.
+    """
+
+    def __init__(self, window: int):
+        self._window: Deque[float] = deque()
+        self._sorted: list = []
+        self._max = window
+        self._lock = threading.Lock()
+
+    def add(self, latency_ms: float) -> None:
+        with self._lock:
+            if len(self._window) >= self._max:
+                old = self._window.popleft()
+                del self._sorted[bisect.bisect_left(self._sorted, old)]
+            self._window.append(latency_ms)
+            bisect.insort(self._sorted, latency_ms)
+
+    def percentile(self, p: float) -> Optional[float]:
+        with self._lock:
+            if not self._sorted:
+                return None
+            return self._sorted[min(len(self._sorted) - 1, int(p * len(self._sorted)))]
+
+    def __len__(self) -> int:
+        return len(self._window)
+
+
+class HedgeController:
+    """모델별 hedge 지연 계산과 hedge 비용 집계."""
+
+    def __init__(self, policy: Optional[HedgePolicy] = None):
+        self.policy = policy or HedgePolicy()
+        self._histograms: Dict[str, LatencyHistogram] = {}
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, Any]] = {}
+
+    def hedge_delay_s(self, model: str) -> Optional[float]:
+        """hedge 발송까지 기다릴 초. 표본 부족 또는 hedge 비율 상한 초과 시 None (hedge 안 함)."""
+        ...
+
+    def record_latency(self, model: str, latency_ms: float) -> None:
+        """단일 요청 지연 기록 (hedge 승자의 지연은 원 요청 발송 기준으로 기록)."""
+        ...
+
+    def record_hedge(self, model: str, hedge_won: bool, extra_prompt_tokens: int, extra_completion_tokens: int) -> None:
+        """hedge 1건 기록. 취소된 쪽도 프롬프트 토큰은 과금되므로 extra로 집계."""
+        ...
+
+    def stats(self) -> Dict[str, Any]:
+        """모델별 현재 hedge 지연, hedge 비율, hedge 승률, 추가 토큰/추정 비용(calculate_cost)."""
+        ...
+
+
+_global_hedge_controller: Optional[HedgeController] = None
+
+
+def get_hedge_controller() -> HedgeController:
+    """프로세스 전역 HedgeController 싱글톤 반환."""
+    global _global_hedge_controller
+    if _global_hedge_controller is None:
+        _global_hedge_controller = HedgeController()
+    return _global_hedge_controller
@@ -0,0 +1,96 @@
+"""턴 단위 레이턴시 예산 (ContextVar 기반).
+
+ChatService가 턴 시작 시 TurnBudget을 바인딩하고, 노드 데코레이터가 OrchestratorState에
+잔여 예산을 반영한다. 에이전트 서브그래프 노드와 LLMCallBuilder처럼 OrchestratorState를
+보지 못하는 계층도 get_turn_budget()으로 잔여 시간을 조회해 단계적으로 품질을 낮춘다:
+  NORMAL → REDUCED (작은 모델, retrieval k 축소) → CRITICAL (옵션 노드 스킵)
+"""
+
+from __future__ import annotations
+
+import time
+import logging
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class DegradeLevel:
+    """잔여 예산 구간."""
+    NORMAL = "normal"
+    REDUCED = "reduced"
+    CRITICAL = "critical"
+
+
+@dataclass
+class BudgetPolicy:
+    """잔여 예산(ms) 기준 degrade 정책."""
+    reduced_below_ms: float = 8_000.0
+    critical_below_ms: float = 3_000.0
+    fallback_models: Dict[str, str] = field(default_factory=lambda: {"gpt-4o": "gpt-4o-mini"})
+    reduced_k_ratio: float = 0.5          # REDUCED 이하에서 retrieval k 배율
+    optional_nodes: tuple = ("scope_consistency_guard", "web_fallback", "routine_synthesizer")
+
+
+@dataclass
+class TurnBudget:
+    """턴 하나의 레이턴시 예산. 기준 시각은 time.monotonic()."""
+    total_ms: float
+    started_at: float = field(default_factory=time.monotonic)
+    policy: BudgetPolicy = field(default_factory=BudgetPolicy)
+
+    def elapsed_ms(self) -> float:
+        return (time.monotonic() - self.started_at) * 1000
+
+    def remaining_ms(self) -> float:
+        """잔여 예산 (음수 가능 — 이미 초과)."""
+        return self.total_ms - self.elapsed_ms()
+
+    def level(self) -> str:
+        """현재 DegradeLevel."""
+        remaining = self.remaining_ms()
+        if remaining < self.policy.critical_below_ms:
+            return DegradeLevel.CRITICAL
+        if remaining < self.policy.reduced_below_ms:
+            return DegradeLevel.REDUCED
+        return DegradeLevel.NORMAL
+
+    def pick_model(self, model: str) -> str:
+        """REDUCED 이하면 fallback_models 매핑의 작은 모델, 아니면 원래 모델."""
+        ...
+
+    def retrieval_k(self, k: int) -> int:
+        """REDUCED 이하면 k * reduced_k_ratio (최소 1)."""
+        ...
+
+    def should_skip(self, node_name: str) -> bool:
+        """CRITICAL이고 optional_nodes에 포함되면 True."""
+        ...
+
+    def clamp_timeout(self, timeout_s: float) -> float:
+        """LLM 타임아웃을 잔여 예산 이내로 제한 (하한 1초)."""
+        ...
+
+
+# --- ContextVar 전역 접근 ---
+
+_current_budget: ContextVar[Optional[TurnBudget]] = ContextVar(
+    "_current_budget", default=None
+)
+
+
+def get_turn_budget() -> Optional[TurnBudget]:
+    """현재 턴의 TurnBudget 반환 (미설정 시 None → 예산 제약 없음)."""
+    return _current_budget.get()
+
+
+def set_turn_budget(budget: TurnBudget) -> Token:
+    """현재 async 컨텍스트에 TurnBudget 바인딩."""
+    return _current_budget.set(budget)
+
+
+def reset_turn_budget(token: Token) -> None:
+    """ContextVar를 이전 값으로 복원."""
+    _current_budget.reset(token)
@@ -0,0 +1,53 @@
+"""스레드 안전 지연 초기화 헬퍼.
+
+FAISS 인덱스, Chroma, 임베딩 클라이언트, Parquet/NPZ 같은 무거운 리소스를
+첫 사용 시점(또는 명시적 warmup)까지 미룬다. 초기화 소요 시간을 기록해
+startup 벤치마크와 readiness 리포트에 사용.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+import logging
+from typing import Callable, Dict, Generic, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class LazyResource(Generic[T]):
+    """double-checked locking 기반 1회 초기화 래퍼.
+
+    동시 첫 요청이 여러 개여도 factory는 한 번만 실행되고 나머지는 대기 후 같은 인스턴스를 받는다.
+    factory 예외는 캐시하지 않음 → 다음 get()에서 재시도.
+    """
+
+    def __init__(self, name: str, factory: Callable[[], T]):
+        self.name = name
+        self._factory = factory
+        self._value: Optional[T] = None
+        self._lock = threading.Lock()
+        self._ready = False
+        self.init_ms: Optional[float] = None
+
+    def get(self) -> T:
+        """리소스 반환 (미초기화면 초기화)."""
+        if not self._ready:
+            with self._lock:
+                if not self._ready:
+                    t0 = time.perf_counter()
+                    self._value = self._factory()
+                    self.init_ms = (time.perf_counter() - t0) * 1000
+                    self._ready = True
+                    logger.info("lazy init %s: %.0fms", self.name, self.init_ms)
+        return self._value
+
+    @property
+    def ready(self) -> bool:
+        return self._ready
+
+    def status(self) -> Dict[str, object]:
+        """{"name", "ready", "init_ms"}."""
+        return {"name": self.name, "ready": self._ready, "init_ms": self.init_ms}
@@ -5,7 +5,7 @@
 """
 
 from __future__ import annotations
-from typing import Any, Dict, List, Optional, Type, Union
+from typing import Any, Callable, Dict, List, Optional, Type, Union
 from pydantic import BaseModel, ValidationError
 import json
 import hashlib
@@ -13,6 +13,11 @@ import logging
 import time
 from datetime import datetime
 
+from .cancellation import check_cancelled
+from .streaming_json import IncrementalResult
+from .structured_output import get_parse_stats, get_validator, response_format_for
+from .token_budget import CALL_SITE_TOKEN_BUDGETS, PromptParts, TrimResult, trim_to_budget
+
 logger = logging.getLogger(__name__)
 
 
@@ -25,28 +30,55 @@ class LLMCallConfig(BaseModel):
     max_retries: int = 2
     cache_ttl: int = 3600
     use_cache: bool = True
+    priority: Optional[int] = None   # CallPriority. None이면 timeout_s로 추정
+    hedge: bool = False              # QUICK 호출 hedged request 사용 여부
+    batchable: bool = False          # QUICK 분류 호출 세션 간 마이크로 배칭 허용 (acall_json 전용)
+    call_site: Optional[str] = None           # 호출 지점 이름 (CALL_SITE_TOKEN_BUDGETS 조회 키, 통계 그룹)
+    max_input_tokens: Optional[int] = None    # 입력 토큰 예산. None이면 call_site 기본 예산, 둘 다 없으면 무제한
+    strict_schema: bool = True       # output_schema → strict json_schema response_format 자동 생성
 
 
 class LLMCallStats(BaseModel):
     """호출별 통계."""
     call_id: str
     model: str
+    served_model: Optional[str] = None   # 서킷 브레이커 폴백 시 실제 응답한 모델
     prompt_tokens: int = 0
     completion_tokens: int = 0
     total_tokens: int = 0
     duration_ms: int = 0
     cached: bool = False
+    is_async: bool = False
+    hedged: bool = False
+    hedge_extra_tokens: int = 0   # hedge로 추가 소비된 토큰 (패자 포함)
+    coalesced: bool = False   # single-flight follower (LLM 미호출, leader 결과 공유)
+    batch_size: int = 1       # 마이크로 배칭으로 함께 전송된 요청 수 (토큰은 1/batch_size로 안분)
+    call_site: Optional[str] = None
+    estimated_input_tokens: int = 0   # 호출 전 추정 입력 토큰 (트리밍 후)
+    trimmed_tokens: int = 0           # 예산 초과로 잘라낸 입력 토큰 (이력 + 근거)
+    parse_outcome: Optional[str] = None   # ok | repaired | retried | fallback (output_schema 호출만)
     timestamp: str
 
 
 class LLMCallBuilder:
     """통합 LLM 호출 빌더.
 
-    파이프라인: 캐시 확인 → LLM 호출 → JSON 보정 → Pydantic 검증 → 캐시 저장 → 통계 기록.
+    파이프라인: 캐시 확인 → (single-flight 병합) LLM 호출 → JSON 보정 → Pydantic 검증 → 캐시 저장 → 통계 기록.
     """
 
-    def __init__(self, llm_client, cache_manager=None, default_config: Optional[LLMCallConfig] = None):
-        """llm_client: OpenAILLM (.chat() 필수), cache_manager: CacheManager (선택)."""
+    def __init__(
+        self,
+        llm_client,
+        cache_manager=None,
+        default_config: Optional[LLMCallConfig] = None,
+        single_flight=None,
+        micro_batcher=None,
+    ):
+        """llm_client: OpenAILLM (.chat() 필수), cache_manager: CacheManager (선택).
+
+        single_flight: SingleFlight (선택). 캐시 미스 시 동일 캐시 키 동시 호출을 1회로 병합.
+        micro_batcher: MicroBatcher (선택). batchable 호출을 (model, system, 스키마) 단위로 묶어 배치 전송.
+        """
         ...
 
     # ---- 메인 호출 ----
@@ -70,8 +102,23 @@ class LLMCallBuilder:
         parse_json: bool = False,
         json_coerce: bool = False,
         fallback_value: Optional[Any] = None,
+        history: Optional[List[Dict[str, Any]]] = None,
+        evidence: Optional[List[str]] = None,
+        call_site: Optional[str] = None,
+        max_input_tokens: Optional[int] = None,
     ) -> Union[str, Dict[str, Any], BaseModel]:
-        """통합 LLM 호출. 캐싱 + Pydantic 검증 + 통계 수집."""
+        """통합 LLM 호출. 캐싱 + Pydantic 검증 + 통계 수집.
+
+        TurnBudget 바인딩 시 잔여 예산에 따라 모델 다운그레이드(pick_model), 타임아웃 축소(clamp_timeout).
+        LLM 호출 직전 check_cancelled() — 슈퍼바이저 기한 초과로 취소된 에이전트 스레드는 여기서 중단.
+
+        history(오래된 순) / evidence(순위 순)를 넘기면 PromptParts로 조립한 뒤 입력 토큰 예산
+        (max_input_tokens → config.max_input_tokens → CALL_SITE_TOKEN_BUDGETS[call_site])에 맞춰
+        trim_to_budget으로 결정적 트리밍. 캐시 키는 트리밍 후 messages 기준.
+
+        output_schema 지정 + response_format 미지정이면 response_format_for(output_schema, model)로
+        strict json_schema 자동 생성 (클래스별 캐시). strict 지원 모델은 보정/재시도 경로를 타지 않는다.
+        """
         ...
 
     # ---- 편의 메서드 ----
@@ -87,12 +134,95 @@ class LLMCallBuilder:
         """Tool calling + Pydantic 검증 단축 호출."""
         ...
 
+    # ---- 비동기 호출 ----
+
+    async def acall(
+        self,
+        *,
+        system: str,
+        user: str,
+        model: Optional[str] = None,
+        output_schema: Optional[Type[BaseModel]] = None,
+        use_tools: bool = False,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        tool_choice: Optional[str] = None,
+        response_format: Optional[Dict[str, str]] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        cache_key: Optional[str] = None,
+        use_cache: Optional[bool] = None,
+        cache_ttl: Optional[int] = None,
+        parse_json: bool = False,
+        json_coerce: bool = False,
+        fallback_value: Optional[Any] = None,
+        history: Optional[List[Dict[str, Any]]] = None,
+        evidence: Optional[List[str]] = None,
+        call_site: Optional[str] = None,
+        max_input_tokens: Optional[int] = None,
+    ) -> Union[str, Dict[str, Any], BaseModel]:
+        """call()의 비동기 버전. llm_client.achat() 사용, 캐시/보정/검증/통계/토큰 예산 파이프라인 동일.
+
+        single-flight는 ado()로 병합, in-flight 수는 _inflight 카운터로 집계.
+        """
+        ...
+
+    async def acall_json(self, system: str, user: str, output_schema: Type[BaseModel], **kwargs) -> BaseModel:
+        """call_json()의 비동기 버전.
+
+        batchable=True이고 micro_batcher가 있으면 캐시 미스 후 배치 경로(_acall_batched)로 보낸다.
+        """
+        ...
+
+    async def acall_with_tools(
+        self, system: str, user: str, tools: List[Dict[str, Any]],
+        output_schema: Optional[Type[BaseModel]] = None, **kwargs,
+    ) -> Union[Dict[str, Any], BaseModel]:
+        """call_with_tools()의 비동기 버전."""
+        ...
+
+    async def acall_json_incremental(
+        self,
+        system: str,
+        user: str,
+        output_schema: Type[BaseModel],
+        decisive_fields: List[str],
+        on_decisive: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        **kwargs,
+    ) -> IncrementalResult:
+        """구조화 출력을 스트리밍으로 받으며 IncrementalJSONParser로 필드 단위 확정.
+
+        decisive_fields가 모두 완성되면 on_decisive(부분 dict)를 즉시 호출 (라우터가 다음 노드 준비 시작).
+        스트림 종료 후 전체 텍스트를 output_schema로 검증해 final에 저장. 캐시 히트 시 early=final.
+        캐시/통계 파이프라인은 acall()과 동일하며, 통계에 early_ms를 추가 기록.
+        """
+        ...
+
+    async def _acall_batched(
+        self, system: str, user: str, output_schema: Type[BaseModel], model: str, **kwargs,
+    ) -> Optional[BaseModel]:
+        """마이크로 배칭 경로. 저트래픽 바이패스 또는 배치 결과 누락/검증 실패 시 None (호출부가 단건 호출).
+
+        run_batch: system + BATCH_SYSTEM_SUFFIX, build_batch_user(users), batched_schema(output_schema)로
+        achat 1회 → results를 index 기준 정렬. 통계는 항목별로 batch_size와 안분 토큰 기록.
+        """
+        ...
+
     # ---- 내부 헬퍼 ----
 
     def _generate_call_id(self) -> str:
         """호출 ID 생성 (타임스탬프 기반)."""
         ...
 
+    def _resolve_input_budget(self, call_site: Optional[str], max_input_tokens: Optional[int]) -> Optional[int]:
+        """입력 토큰 예산 결정: 호출 인자 > default_config > CALL_SITE_TOKEN_BUDGETS."""
+        ...
+
+    def _apply_token_budget(
+        self, model: str, parts: PromptParts, budget: Optional[int],
+    ) -> TrimResult:
+        """trim_to_budget 적용. 트리밍 발생 시 call_site별 트리밍 횟수/토큰 누적 (get_stats_summary)."""
+        ...
+
     def _generate_cache_key(self, model: str, system: str, user: str) -> str:
         """캐시 키 생성: MD5(model|system|user). session_id 미포함 → 크로스 세션 히트."""
         ...
@@ -110,7 +240,7 @@ class LLMCallBuilder:
         ...
 
     def _coerce_json(self, text: str) -> str:
-        """비정상 JSON 보정: 코드펜스 제거, 마지막 JSON 객체 추출."""
+        """비정상 JSON 보정: 코드펜스 제거, 마지막 JSON 객체 추출. strict 미지원 모델 응답에만 적용."""
         ...
 
     def _process_output(
@@ -118,7 +248,11 @@ class LLMCallBuilder:
         output_schema: Optional[Type[BaseModel]], parse_json: bool,
         fallback_value: Optional[Any] = None,
     ) -> Union[str, Dict[str, Any], BaseModel]:
-        """출력 처리: JSON 파싱 → Pydantic 검증. 실패 시 fallback_value 반환."""
+        """출력 처리: get_validator(output_schema).validate_json으로 파싱+검증 1패스 (json.loads 생략).
+
+        실패 시 (strict 미지원 모델만) _coerce_json 보정 후 재검증, 그래도 실패면 fallback_value.
+        결과(ok/repaired/retried/fallback)는 get_parse_stats().record(call_site, ...)로 집계.
+        """
         ...
 
     def _record_stats(self, call_id: str, model: str, resp: Dict[str, Any], duration_ms: int, cached: bool) -> None:
@@ -128,7 +262,10 @@ class LLMCallBuilder:
     # ---- 모니터링 ----
 
     def get_stats_summary(self) -> Dict[str, Any]:
-        """집계 통계 반환 (총 호출, 캐시 히트율, 평균 지연시간, 총 토큰)."""
+        """집계 통계 반환 (총 호출, 캐시 히트율, single-flight 병합 수, 평균 지연시간, 총 토큰,
+        폴백 응답 비율(model != served_model), 동기/비동기 in-flight 수, 공유 HTTP 풀 재사용률 — get_pool_stats(), hedge 횟수/추가 토큰/추가 비용,
+        배치 호출 수/평균 배치 크기/절감 시스템 프롬프트 토큰 — micro_batcher.stats(),
+        call_site별 평균 추정 입력 토큰/트리밍 횟수/트리밍 토큰, call_site별 파싱 실패율/재시도율 — get_parse_stats().report())."""
         ...
 
     def reset_stats(self) -> None:
@@ -0,0 +1,182 @@
+"""LLM/임베딩 record-replay 레이어 (오프라인 벤치마크용).
+
+record 모드: OpenAILLM.chat / achat / astream 및 임베딩 호출을 실제로 수행하면서
+요청 fingerprint, 응답, 관측 지연(스트리밍은 청크 간격 포함)을 JSONL 카세트에 기록.
+replay 모드: 네트워크 없이 카세트에서 결정적으로 응답. 지연 주입 옵션:
+  none     — 즉시 응답 (로직 회귀 테스트)
+  recorded — 해당 요청의 기록 지연 그대로
+  sampled  — 같은 모델 기록 지연 분포에서 seed 고정 샘플링 (cold/warm 벤치마크 재현)
+
+환경변수 LLM_REPLAY_MODE=off|record|replay, LLM_REPLAY_CASSETTE=경로 로 전역 전환.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, AsyncGenerator, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class ReplayMode:
+    OFF = "off"
+    RECORD = "record"
+    REPLAY = "replay"
+
+
+class LatencyInjection:
+    NONE = "none"
+    RECORDED = "recorded"
+    SAMPLED = "sampled"
+
+
+class CassetteMissError(Exception):
+    """replay 모드에서 카세트에 없는 요청 (strict=True일 때)."""
+    pass
+
+
+def request_fingerprint(kind: str, payload: Dict[str, Any]) -> str:
+    """요청 fingerprint: SHA256(kind | 정렬된 JSON). timeout/retries 등 응답 무관 필드 제외."""
+    ignored = {"timeout", "timeout_s", "retries", "user", "priority", "hedge"}
+    normalized = {k: v for k, v in payload.items() if k not in ignored}
+    raw = json.dumps(normalized, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(f"{kind}|{raw}".encode("utf-8")).hexdigest()
+
+
+@dataclass
+class CassetteEntry:
+    """카세트 1건."""
+    fingerprint: str
+    kind: str                                   # "chat" | "stream" | "embed"
+    model: str
+    response: Any
+    latency_ms: float
+    chunk_offsets_ms: List[float] = field(default_factory=list)   # stream 전용 (TTFT 재현)
+    recorded_at: str = ""
+
+
+class Cassette:
+    """JSONL 카세트 파일. fingerprint → 엔트리 리스트 (같은 요청의 반복 호출은 순서대로 재생)."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._entries: Dict[str, List[CassetteEntry]] = {}
+        self._cursor: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def load(self) -> int:
+        """파일에서 엔트리 로드. 로드 개수 반환."""
+        ...
+
+    def append(self, entry: CassetteEntry) -> None:
+        """엔트리 추가 + 파일 append (record 모드)."""
+        ...
+
+    def next(self, fingerprint: str) -> Optional[CassetteEntry]:
+        """다음 재생 엔트리 (끝에 도달하면 마지막 엔트리 반복)."""
+        ...
+
+    def latencies(self, model: str, kind: str) -> List[float]:
+        """모델/종류별 기록 지연 분포 (sampled 주입용)."""
+        ...
+
+
+class RecordReplayLLM:
+    """OpenAILLM과 동일 인터페이스(chat / achat / astream)의 record-replay 래퍼.
+
+    LLMCallBuilder, LLMRouter 등 호출부는 수정 없이 llm_client만 교체.
+    """
+
+    def __init__(
+        self,
+        inner,
+        cassette: Cassette,
+        mode: str = ReplayMode.REPLAY,
+        latency: str = LatencyInjection.SAMPLED,
+        seed: int = 0,
+        strict: bool = True,
+    ):
+        """inner: 실제 OpenAILLM (replay 모드에서는 None 가능)."""
+        self.inner = inner
+        self.cassette = cassette
+        self.mode = mode
+        self.latency = latency
+        self._rng = random.Random(seed)
+        self.strict = strict
+
+    def _delay_s(self, entry: CassetteEntry) -> float:
+        """latency 옵션에 따른 주입 지연(초)."""
+        ...
+
+    def chat(self, **kwargs) -> Dict[str, Any]:
+        """record: inner.chat() 결과/지연 기록 후 반환. replay: 카세트 응답 + time.sleep(지연)."""
+        ...
+
+    async def achat(self, **kwargs) -> Dict[str, Any]:
+        """chat()의 비동기 버전 (replay 지연은 asyncio.sleep)."""
+        ...
+
+    async def astream(self, **kwargs) -> AsyncGenerator[str, None]:
+        """record: 청크와 도착 오프셋 기록. replay: 기록된 청크를 오프셋 간격대로 yield (TTFT 재현)."""
+        ...
+
+
+class RecordReplayEmbeddings:
+    """임베딩 래퍼 (embed_documents / embed_query). LangChain Embeddings 인터페이스 호환."""
+
+    def __init__(self, inner, cassette: Cassette, mode: str = ReplayMode.REPLAY):
+        """inner: 실제 임베딩 (replay 모드에서는 None 가능)."""
+        self.inner = inner
+        self.cassette = cassette
+        self.mode = mode
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        ...
+
+    def embed_query(self, text: str) -> List[float]:
+        ...
+
+
+def replay_mode_from_env() -> str:
+    """LLM_REPLAY_MODE 환경변수 (기본 off)."""
+    return os.getenv("LLM_REPLAY_MODE", ReplayMode.OFF)
+
+
+def _open_cassette(cassette_path: Optional[str]) -> Cassette:
+    """cassette_path 또는 LLM_REPLAY_CASSETTE 경로의 카세트 로드."""
+    path = cassette_path or os.getenv("LLM_REPLAY_CASSETTE")
+    if not path:
+        raise ValueError("LLM_REPLAY_CASSETTE is required when LLM_REPLAY_MODE is record/replay")
+    cassette = Cassette(path)
+    cassette.load()
+    return cassette
+
+
+def wrap_llm(factory: Callable[[], Any], cassette_path: Optional[str] = None):
+    """factory: 실제 OpenAILLM을 만드는 인자 없는 callable.
+
+    off면 factory() 그대로, record면 RecordReplayLLM(factory()), replay면 factory를 호출하지 않고
+    RecordReplayLLM(None) — API 키/네트워크 없이 실행된다.
+    """
+    mode = replay_mode_from_env()
+    if mode == ReplayMode.OFF:
+        return factory()
+    inner = factory() if mode == ReplayMode.RECORD else None
+    return RecordReplayLLM(inner, _open_cassette(cassette_path), mode=mode)
+
+
+def wrap_embeddings(factory: Callable[[], Any], cassette_path: Optional[str] = None):
+    """wrap_llm과 동일 규칙으로 임베딩 래핑 (replay 모드에서는 factory 미호출)."""
+    mode = replay_mode_from_env()
+    if mode == ReplayMode.OFF:
+        return factory()
+    inner = factory() if mode == ReplayMode.RECORD else None
+    return RecordReplayEmbeddings(inner, _open_cassette(cassette_path), mode=mode)
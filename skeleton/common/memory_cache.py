@@ -1,48 +1,311 @@
-"""TTL 기반 범용 인메모리 캐시."""
+"""TTL 기반 범용 인메모리 캐시 (W-TinyLFU, 바이트 예산, 락 스트라이핑).
+
+구조 (스트라이프마다 독립):
+  window (LRU, 예산의 ~1%) → probation (SLRU) ⇄ protected (SLRU, main의 80%)
+
+- 새 항목은 window에 들어가고, window에서 밀려난 후보는 main의 probation LRU 희생자와
+  빈도(Count-Min Sketch 추정치)를 비교해 더 자주 쓰인 쪽만 남는다 (TinyLFU admission).
+  → 한 번만 오는 질의가 몰려도(스캔성 트래픽) 크로스 유저 라우터 핫 엔트리가 밀려나지 않는다.
+- 모든 연산은 OrderedDict move_to_end/popitem 기반 O(1). 전체 정렬/스캔 없음.
+- 용량은 엔트리 수가 아닌 바이트 예산(max_bytes). 값 크기는 저장 시 1회 추정.
+- 키 해시로 스트라이프를 골라 스트라이프별 락만 잡는다 → 서로 다른 키의 동시 읽기가 직렬화되지 않는다.
+"""
 
 from __future__ import annotations
 import hashlib
+import json
+import sys
 import time
 import threading
 import logging
-from typing import Any, Optional, Dict
+from array import array
+from collections import OrderedDict
+from typing import Any, Optional, Dict, Tuple
+
+from .cache_registry import get_cache_registry
 
 logger = logging.getLogger(__name__)
 
 
+class CountMinSketch:
+    """4-bit 포화 카운터 Count-Min Sketch (빈도 추정, 주기적 감쇠).
+
+    증가 횟수가 sample_size에 도달하면 모든 카운터를 절반으로 → 과거 인기 항목이 영원히 남지 않음.
+    """
+
+    _SEEDS = (0x9E3779B1, 0x85EBCA77, 0xC2B2AE3D, 0x27D4EB2F)
+
+    def __init__(self, width: int):
+        self._width = max(64, width)
+        self._rows = [array("B", bytes(self._width)) for _ in self._SEEDS]
+        self._additions = 0
+        self._sample_size = 10 * self._width
+
+    def _indexes(self, key: str):
+        h = hash(key)
+        return [((h ^ seed) * 0x01000193 & 0xFFFFFFFF) % self._width for seed in self._SEEDS]
+
+    def increment(self, key: str) -> None:
+        for row, idx in zip(self._rows, self._indexes(key)):
+            if row[idx] < 15:
+                row[idx] += 1
+        self._additions += 1
+        if self._additions >= self._sample_size:
+            self._reset()
+
+    def frequency(self, key: str) -> int:
+        return min(row[idx] for row, idx in zip(self._rows, self._indexes(key)))
+
+    def _reset(self) -> None:
+        for row in self._rows:
+            for i in range(self._width):
+                row[i] >>= 1
+        self._additions //= 2
+
+
+class _Entry:
+    __slots__ = ("value", "expires_at", "stale_at", "size")
+
+    def __init__(self, value: Any, expires_at: float, size: int, stale_at: Optional[float] = None):
+        self.value = value
+        self.expires_at = expires_at                                    # hard TTL (삭제)
+        self.stale_at = expires_at if stale_at is None else stale_at    # soft TTL (이후 스테일)
+        self.size = size
+
+
+class _Segment:
+    """스트라이프 1개: window LRU + SLRU main + 빈도 스케치 + 전용 락."""
+
+    def __init__(self, max_bytes: int, window_ratio: float, protected_ratio: float, sketch_width: int):
+        self.lock = threading.Lock()
+        self.window: "OrderedDict[str, _Entry]" = OrderedDict()
+        self.probation: "OrderedDict[str, _Entry]" = OrderedDict()
+        self.protected: "OrderedDict[str, _Entry]" = OrderedDict()
+        self.sketch = CountMinSketch(sketch_width)
+        self.window_max = max(1, int(max_bytes * window_ratio))
+        self.main_max = max(1, max_bytes - self.window_max)
+        self.protected_max = int(self.main_max * protected_ratio)
+        self.window_bytes = 0
+        self.probation_bytes = 0
+        self.protected_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.rejections = 0
+        self.stale_hits = 0
+
+    # ---- 조회 ----
+
+    def get(self, key: str, now: float) -> Any:
+        """히트면 _Entry, 미스/만료면 _MISS."""
+        self.sketch.increment(key)
+        for region in (self.window, self.protected, self.probation):
+            entry = region.get(key)
+            if entry is None:
+                continue
+            if entry.expires_at <= now:
+                self._remove(key)
+                break
+            self.hits += 1
+            if entry.stale_at <= now:
+                self.stale_hits += 1
+            if region is self.probation:
+                self._promote(key, entry)
+            else:
+                region.move_to_end(key)
+            return entry
+        self.misses += 1
+        return _MISS
+
+    def peek(self, key: str, now: float) -> Any:
+        """빈도/통계/LRU 순서를 건드리지 않는 조회. 히트면 _Entry, 아니면 _MISS."""
+        for region in (self.window, self.protected, self.probation):
+            entry = region.get(key)
+            if entry is not None:
+                return entry if entry.expires_at > now else _MISS
+        return _MISS
+
+    def _promote(self, key: str, entry: _Entry) -> None:
+        """probation 히트 → protected MRU. protected 초과분은 probation MRU로 강등."""
+        del self.probation[key]
+        self.probation_bytes -= entry.size
+        self.protected[key] = entry
+        self.protected_bytes += entry.size
+        while self.protected_bytes > self.protected_max and len(self.protected) > 1:
+            k, e = self.protected.popitem(last=False)
+            self.protected_bytes -= e.size
+            self.probation[k] = e
+            self.probation_bytes += e.size
+
+    # ---- 저장 ----
+
+    def set(self, key: str, entry: _Entry) -> None:
+        self._remove(key)
+        self.window[key] = entry
+        self.window_bytes += entry.size
+        while self.window_bytes > self.window_max and self.window:
+            k, candidate = self.window.popitem(last=False)
+            self.window_bytes -= candidate.size
+            self._admit(k, candidate)
+
+    def _admit(self, key: str, candidate: _Entry) -> None:
+        """window 방출 후보를 main에 넣을지 TinyLFU로 결정."""
+        main_bytes = self.probation_bytes + self.protected_bytes
+        compared = False
+        while main_bytes + candidate.size > self.main_max:
+            victim_region = self.probation if self.probation else self.protected
+            if not victim_region:
+                break
+            victim_key = next(iter(victim_region))
+            if not compared:
+                # 첫 희생자와만 비교 — 후보가 이기면 자리가 날 때까지 LRU 순으로 방출
+                if self.sketch.frequency(key) <= self.sketch.frequency(victim_key):
+                    self.rejections += 1
+                    return
+                compared = True
+            victim = victim_region.pop(victim_key)
+            if victim_region is self.probation:
+                self.probation_bytes -= victim.size
+            else:
+                self.protected_bytes -= victim.size
+            main_bytes -= victim.size
+            self.evictions += 1
+        if candidate.size > self.main_max:
+            self.rejections += 1
+            return
+        self.probation[key] = candidate
+        self.probation_bytes += candidate.size
+
+    def _remove(self, key: str) -> bool:
+        for region, attr in ((self.window, "window_bytes"), (self.probation, "probation_bytes"),
+                             (self.protected, "protected_bytes")):
+            entry = region.pop(key, None)
+            if entry is not None:
+                setattr(self, attr, getattr(self, attr) - entry.size)
+                return True
+        return False
+
+    def clear(self) -> int:
+        n = len(self.window) + len(self.probation) + len(self.protected)
+        self.window.clear()
+        self.probation.clear()
+        self.protected.clear()
+        self.window_bytes = self.probation_bytes = self.protected_bytes = 0
+        return n
+
+
+_MISS = object()
+
+# 스트라이프 선택은 해시 상위 절반 비트 사용. 빈도 스케치 인덱스는 하위 32비트에서 나오므로
+# 같은 hash(key) % stripes를 쓰면 스트라이프마다 스케치 카운터의 1/stripes만 쓰게 된다 (빈도 과대 추정).
+_STRIPE_SHIFT = sys.hash_info.width // 2
+
+
+def _estimate_size(key: str, value: Any) -> int:
+    """엔트리 바이트 크기 추정 (저장 시 1회). str/bytes는 getsizeof, 그 외는 JSON 길이."""
+    if isinstance(value, (str, bytes)):
+        size = sys.getsizeof(value)
+    else:
+        try:
+            size = len(json.dumps(value, ensure_ascii=False, default=str).encode("utf-8"))
+        except (TypeError, ValueError):
+            size = sys.getsizeof(value)
+    return size + sys.getsizeof(key) + 64   # 엔트리/OrderedDict 노드 오버헤드
+
+
 class MemoryCache:
-    """스레드 안전 인메모리 캐시 (키별 TTL, MD5 해싱, 최대 크기 제한)."""
+    """스레드 안전 인메모리 캐시 (키별 TTL, MD5 해싱, 바이트 예산, W-TinyLFU 방출)."""
+
+    def __init__(
+        self,
+        default_ttl: int = 1800,
+        max_bytes: int = 64 * 1024 * 1024,
+        stripes: int = 16,
+        window_ratio: float = 0.01,
+        protected_ratio: float = 0.8,
+        expected_entries: int = 50_000,
+        name: Optional[str] = None,
+    ):
+        """expected_entries: 빈도 스케치 크기 산정용 예상 엔트리 수 (스트라이프별로 분할).
 
-    def __init__(self, default_ttl: int = 1800, max_size: int = 500):
-        self._store: Dict[str, Dict[str, Any]] = {}
+        name 지정 시 CacheRegistry에 자기 등록 (/debug/cache 통계, clear/warm 대상).
+        """
         self._default_ttl = default_ttl
-        self._max_size = max_size
-        self._lock = threading.Lock()
-        self._hits = 0
-        self._misses = 0
+        self._max_bytes = max_bytes
+        self._segments = [
+            _Segment(max_bytes // stripes, window_ratio, protected_ratio, expected_entries // stripes)
+            for _ in range(stripes)
+        ]
+        if name:
+            get_cache_registry().register_cache(name, self)
+
+    def _segment(self, key: str) -> _Segment:
+        return self._segments[(hash(key) >> _STRIPE_SHIFT) % len(self._segments)]
 
     def get(self, key: str) -> Optional[Any]:
         """키가 존재하고 만료 안 됐으면 값 반환."""
-        ...
+        seg = self._segment(key)
+        with seg.lock:
+            entry = seg.get(key, time.monotonic())
+        return None if entry is _MISS else entry.value
 
-    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
-        """값 저장. 키별 TTL 오버라이드 가능."""
-        ...
+    def peek(self, key: str) -> Optional[Any]:
+        """get()과 같지만 히트/미스 통계, 빈도 스케치, LRU 순서에 영향 없음 (exists 등 존재 확인용)."""
+        seg = self._segment(key)
+        with seg.lock:
+            entry = seg.peek(key, time.monotonic())
+        return None if entry is _MISS else entry.value
+
+    def get_swr(self, key: str) -> Optional[Tuple[Any, bool]]:
+        """stale-while-revalidate 조회. (값, soft TTL 경과 여부) 또는 None (미스/hard TTL 만료)."""
+        seg = self._segment(key)
+        now = time.monotonic()
+        with seg.lock:
+            entry = seg.get(key, now)
+        return None if entry is _MISS else (entry.value, entry.stale_at <= now)
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None, soft_ttl: Optional[float] = None) -> None:
+        """값 저장. 키별 TTL 오버라이드 가능. admission에서 탈락하면 저장되지 않을 수 있다.
+
+        soft_ttl 지정 시 ttl은 hard TTL — soft_ttl 이후는 get_swr()에서 스테일로 표시.
+        """
+        now = time.monotonic()
+        entry = _Entry(
+            value, now + (ttl or self._default_ttl), _estimate_size(key, value),
+            stale_at=None if soft_ttl is None else now + soft_ttl,
+        )
+        seg = self._segment(key)
+        with seg.lock:
+            seg.set(key, entry)
 
     def invalidate(self, key: str) -> bool:
         """특정 키 삭제. 존재했으면 True."""
-        ...
+        seg = self._segment(key)
+        with seg.lock:
+            return seg._remove(key)
 
     def clear(self) -> int:
         """전체 항목 삭제. 삭제된 개수 반환."""
-        ...
+        total = 0
+        for seg in self._segments:
+            with seg.lock:
+                total += seg.clear()
+        return total
 
-    def stats(self) -> Dict[str, Any]:
-        """hit/miss/사이즈 통계 반환."""
-        ...
+    def clear_namespace(self, prefix: str) -> int:
+        """prefix로 시작하는 키 삭제 (예: 'router:'). 스트라이프별 전체 순회 — 디버그/운영 작업용."""
+        removed = 0
+        for seg in self._segments:
+            with seg.lock:
+                keys = [k for region in (seg.window, seg.probation, seg.protected) for k in region if k.startswith(prefix)]
+                for k in keys:
+                    seg._remove(k)
+                removed += len(keys)
+        return removed
 
-    def _evict_oldest(self) -> None:
-        """캐시 가득 차면 오래된 10% 제거."""
+    def stats(self) -> Dict[str, Any]:
+        """hit/miss/히트율, 엔트리 수(size), 사용 바이트(bytes)/예산, 영역별(window/probation/protected) 바이트,
+        방출 수, admission 거절 수, 스테일 히트 수 반환 (스트라이프 합산)."""
         ...
 
     @staticmethod
@@ -4,6 +4,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Any
 from datetime import datetime
+import json
 import threading
 import time
 import logging
@@ -12,7 +13,7 @@ logger = logging.getLogger(__name__)
 
 
 def calculate_cost(model: str, input_tokens: int, output_tokens: int) -> float:
-    """모델 가격 기준 LLM 호출 비용(USD) 추정."""
+    """모델 가격 기준 LLM 호출 비용(USD) 추정. 호출 전 추정은 token_budget.estimate_call_cost."""
     ...
 
 
@@ -49,6 +50,10 @@ class SessionMetrics:
     _active_nodes: Dict[str, NodeMetric] = field(default_factory=dict)
     ttft_ms: Optional[float] = None
     trace_summary: Optional[Dict[str, Any]] = None
+    speculation_hits: int = 0
+    speculation_misses: int = 0
+    speculation_wasted_tokens: int = 0
+    deadline_hits: Dict[str, int] = field(default_factory=dict)   # agent -> 기한 초과 횟수
 
     def to_dict(self) -> Dict[str, Any]:
         """세션 메트릭을 직렬화 가능한 dict로 변환."""
@@ -98,14 +103,46 @@ class MetricsStore:
         """세션 메트릭에 TraceSummary 첨부."""
         ...
 
+    def record_speculation(
+        self,
+        session_id: str,
+        agent: str,
+        hit: bool,
+        wasted_tokens: int = 0,
+    ) -> None:
+        """추측 실행 결과 기록. hit=False면 폐기된 에이전트 실행의 토큰을 낭비분으로 누적."""
+        ...
+
+    def record_deadline_hit(self, session_id: str, agent: str, deadline_s: float) -> None:
+        """슈퍼바이저 에이전트 기한 초과 기록."""
+        ...
+
     def get_recent_traces(self, limit: int = 20) -> List[Dict[str, Any]]:
         ...
 
+    def export_traces(self, path: str, limit: Optional[int] = None) -> int:
+        """보관 중인 세션의 trace_summary를 JSONL로 내보내기 (캐시 프리웜 쿼리 로그). 기록한 줄 수 반환.
+
+        세션당 마지막 턴의 요약 1건. user_text는 TRACE_RECORD_QUERY_TEXT=1일 때만 채워져 있다 (마스킹됨).
+        limit 지정 시 최근 세션 limit개만.
+        """
+        with self._lock:
+            rows = [
+                {"session_id": m.session_id, "trace_summary": m.trace_summary}
+                for m in self._sessions.values() if m.trace_summary
+            ]
+        if limit is not None:
+            rows = rows[-limit:] if limit > 0 else []
+        with open(path, "w", encoding="utf-8") as f:
+            for row in rows:
+                f.write(json.dumps(row, ensure_ascii=False, default=str) + "\n")
+        return len(rows)
+
     def get_session_metrics(self, session_id: str) -> Optional[Dict[str, Any]]:
         ...
 
     def get_summary(self) -> Dict[str, Any]:
-        """전체 세션 집계 통계 (TTFT p50/p95 포함)."""
+        """전체 세션 집계 통계 (TTFT p50/p95, 추측 실행 적중률/낭비 토큰, 에이전트별 기한 초과 포함)."""
         ...
 
     @staticmethod
@@ -0,0 +1,162 @@
+"""세션 간 마이크로 배칭 (QUICK 분류 호출용).
+
+피크 시간대에는 classify_intent / llm_classify_intent 같은 짧은 분류 호출이 거의 동시에 수백 건 들어오고,
+건마다 요청 오버헤드와 동일한 시스템 프롬프트 토큰을 다시 낸다. 같은 (model, system, 출력 스키마)
+요청을 짧은 윈도우(20-50ms) 동안 모아 하나의 배치 프롬프트로 보내고, 결과 배열을 대기 중인 호출자에게 나눠준다.
+
+- 윈도우는 최근 도착률(EWMA)에 비례해 늘어난다 — 한가할 때는 최소값, 몰릴 때는 최대값.
+- 도착률이 bypass_qps 미만이면 배칭하지 않고 바로 단건 호출 (저트래픽 지연 0ms 추가).
+- 배치 응답 검증 실패/누락 항목은 해당 호출자만 단건 재호출로 폴백.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Type
+
+from pydantic import BaseModel, Field, create_model
+
+logger = logging.getLogger(__name__)
+
+BatchKey = Tuple[str, str, str]   # (model, system 해시, 출력 스키마 이름)
+
+BATCH_SYSTEM_SUFFIX = (
+    "\n\n여러 요청이 번호와 함께 주어진다. 각 요청을 독립적으로 판단해 "
+    '{"results": [{"index": 번호, ...판단 필드}]} 형식으로 요청 수만큼 반환하라.'
+)
+
+
+@dataclass
+class BatchPolicy:
+    """배칭 정책."""
+    min_window_ms: float = 20.0
+    max_window_ms: float = 50.0
+    max_batch_size: int = 16         # 배치 상한 (출력 토큰/지연 증가 억제)
+    bypass_qps: float = 5.0          # 키별 도착률이 이 값 미만이면 배칭 생략
+    saturation_qps: float = 200.0    # 이 도착률에서 윈도우가 max_window_ms에 도달
+    ewma_alpha: float = 0.2
+
+
+@dataclass
+class _PendingItem:
+    """배치 대기 중인 호출 1건."""
+    user: str
+    future: asyncio.Future
+    enqueued_at: float = field(default_factory=time.perf_counter)
+
+
+@dataclass
+class _Batch:
+    """키별로 모이는 중인 배치."""
+    items: List[_PendingItem] = field(default_factory=list)
+    flush_handle: Optional[asyncio.TimerHandle] = None
+
+
+class _ArrivalRate:
+    """키별 도착률 (요청/초). 도착 간격의 EWMA를 유지하고 조회 시 역수로 환산.
+
+    1/gap을 평균내면 유휴 구간 동안 값이 줄지 않아 버스트 후 한참 지나도 배칭 윈도우가 유지된다.
+    조회 시점까지의 경과 시간(now - last)이 평균 간격보다 길면 그 경과 시간을 간격으로 써서 감쇠시킨다.
+    """
+
+    def __init__(self, alpha: float):
+        self._alpha = alpha
+        self._last: Optional[float] = None
+        self._gap_s: Optional[float] = None
+
+    def rate(self, now: float) -> float:
+        """now 기준 추정 도착률. 관측 2건 미만이면 0."""
+        if self._last is None or self._gap_s is None:
+            return 0.0
+        return 1.0 / max(self._gap_s, now - self._last, 1e-4)
+
+    def observe(self, now: float) -> float:
+        """도착 1건 기록 후 now 기준 도착률 반환."""
+        if self._last is not None:
+            gap = max(now - self._last, 1e-4)
+            self._gap_s = gap if self._gap_s is None else self._alpha * gap + (1 - self._alpha) * self._gap_s
+        self._last = now
+        return self.rate(now)
+
+
+def batched_schema(item_schema: Type[BaseModel]) -> Type[BaseModel]:
+    """단건 스키마 → {"results": [{index, ...item 필드}]} 배치 스키마 (스키마별 1회 생성 후 캐시)."""
+    ...
+
+
+class MicroBatcher:
+    """호환 요청을 윈도우 단위로 묶어 1회 호출로 처리.
+
+    이벤트 루프 전용 (acall 경로). 동기 call()은 배칭하지 않는다.
+    """
+
+    def __init__(self, policy: Optional[BatchPolicy] = None):
+        self.policy = policy or BatchPolicy()
+        self._batches: Dict[BatchKey, _Batch] = {}
+        self._rates: Dict[BatchKey, _ArrivalRate] = {}
+        self._lock = threading.Lock()
+        self._stats = {
+            "submitted": 0, "bypassed": 0, "batches": 0, "batched_items": 0,
+            "fallbacks": 0, "saved_prompt_tokens": 0,
+        }
+
+    def window_ms(self, qps: float) -> float:
+        """도착률 → 배치 윈도우(ms). bypass_qps~saturation_qps 구간에서 선형 증가."""
+        p = self.policy
+        if qps <= p.bypass_qps:
+            return p.min_window_ms
+        ratio = min(1.0, (qps - p.bypass_qps) / max(p.saturation_qps - p.bypass_qps, 1e-6))
+        return p.min_window_ms + ratio * (p.max_window_ms - p.min_window_ms)
+
+    def should_bypass(self, key: BatchKey) -> bool:
+        """도착률 갱신(_ArrivalRate.observe) 후 저트래픽이면 True (단건 호출).
+
+        유휴 뒤 첫 요청은 긴 간격이 EWMA에 반영되고 now - last 하한도 걸려 곧바로 bypass된다.
+        """
+        ...
+
+    async def submit(
+        self,
+        key: BatchKey,
+        user: str,
+        run_batch: Callable[[List[str]], Awaitable[List[Optional[Dict[str, Any]]]]],
+    ) -> Optional[Dict[str, Any]]:
+        """요청을 배치에 넣고 결과를 기다린다.
+
+        run_batch(users) → 입력 순서대로 정렬된 결과 dict 리스트 (누락 항목은 None).
+        첫 항목이 들어올 때 window_ms 뒤 flush 예약, max_batch_size 도달 시 즉시 flush.
+        None을 받은 호출자는 단건 호출로 폴백한다.
+        """
+        ...
+
+    async def _flush(self, key: BatchKey, run_batch) -> None:
+        """배치를 떼어내 run_batch 1회 실행 후 각 future에 결과 분배. 예외는 전원에게 전파."""
+        ...
+
+    @staticmethod
+    def build_batch_user(users: List[str]) -> str:
+        """번호 붙인 배치 user 프롬프트 ("[0] ...\\n[1] ...")."""
+        return "\n".join(f"[{i}] {u}" for i, u in enumerate(users))
+
+    def record_batch(self, size: int, system_tokens: int) -> None:
+        """배치 1건 기록. 절감 토큰 = (size - 1) * 시스템 프롬프트 토큰."""
+        ...
+
+    def stats(self) -> Dict[str, Any]:
+        """제출/바이패스/배치 수, 평균 배치 크기, 폴백 수, 절감 프롬프트 토큰, 키별 현재 도착률/윈도우."""
+        ...
+
+
+_global_micro_batcher: Optional[MicroBatcher] = None
+
+
+def get_micro_batcher() -> MicroBatcher:
+    """프로세스 전역 MicroBatcher 싱글톤 반환."""
+    global _global_micro_batcher
+    if _global_micro_batcher is None:
+        _global_micro_batcher = MicroBatcher()
+    return _global_micro_batcher
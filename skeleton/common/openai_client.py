@@ -1,16 +1,21 @@
 """OpenAI Chat Completions API 어댑터.
 
-용도별 타임아웃 분리, 지수 백오프 재시도, 정규화된 응답 포맷,
-tool_calls JSON 파싱, 토큰/비용 로깅, 비동기 스트리밍 지원.
+용도별 타임아웃 분리, 우선순위 레이트 리미팅, 서킷 브레이커 + 모델 폴백, 지수 백오프 재시도, 정규화된 응답 포맷,
+tool_calls JSON 파싱, 토큰/비용 로깅, 비동기 호출/스트리밍 지원.
 """
 
 from __future__ import annotations
 from typing import Any, Dict, List, Optional, Union, AsyncGenerator
+import asyncio
 import os, json, time
 import logging
+import weakref
+import httpx
 from openai import OpenAI, AsyncOpenAI
 from openai import APIConnectionError, RateLimitError, APIStatusError, APITimeoutError
 
+from .llm_replay import wrap_llm
+
 logger = logging.getLogger(__name__)
 
 
@@ -32,6 +37,37 @@ class LLMRateLimitError(Exception):
     pass
 
 
+class HTTPPoolConfig:
+    """공유 AsyncOpenAI 클라이언트의 httpx 커넥션 풀 설정."""
+    MAX_CONNECTIONS = int(os.getenv("OPENAI_MAX_CONNECTIONS", "200"))
+    MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("OPENAI_MAX_KEEPALIVE", "50"))
+    KEEPALIVE_EXPIRY_S = 30.0
+    CONNECT_TIMEOUT_S = 5.0
+    # HTTP/2는 httpx[http2] (h2 패키지) 필요 — 미설치 환경에서 AsyncClient 생성이 실패하므로 opt-in
+    HTTP2 = os.getenv("OPENAI_HTTP2", "0") == "1"
+
+
+_shared_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncOpenAI]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_shared_async_client() -> AsyncOpenAI:
+    """공유 AsyncOpenAI (HTTPPoolConfig 기반 httpx.AsyncClient 주입, 실행 중인 이벤트 루프당 1개).
+
+    인스턴스마다 클라이언트를 만들면 TLS 핸드셰이크와 커넥션이 재사용되지 않는다.
+    httpx.AsyncClient 커넥션은 생성한 루프에 묶이므로 asyncio.get_running_loop()로 키잉하고,
+    루프가 사라지면 WeakKeyDictionary에서 자동 해제된다.
+    풀 재사용률/in-flight 수 계측을 위해 httpx 이벤트 훅을 등록.
+    """
+    ...
+
+
+def get_pool_stats() -> Dict[str, Any]:
+    """공유 풀 통계 (루프별 클라이언트 합산): 신규 커넥션 수, 재사용 요청 수, 재사용률, 현재 in-flight, 최대 in-flight."""
+    ...
+
+
 class OpenAILLM:
     """OpenAI Chat Completions 래퍼.
 
@@ -39,7 +75,26 @@ class OpenAILLM:
     지수 백오프 재시도, 토큰 사용량/비용 로깅, 비동기 스트리밍.
     """
 
-    def __init__(self, model: str = "gpt-4o-mini", timeout_s: float = 30.0, max_retries: int = 2):
+    def __init__(
+        self,
+        model: str = "gpt-4o-mini",
+        timeout_s: float = 30.0,
+        max_retries: int = 2,
+        rate_limiter=None,
+        hedge_controller=None,
+        fallback_chain=None,
+    ):
+        """rate_limiter: PriorityRateLimiter (선택). 지정 시 호출 전 모델별 RPM/TPM 예산 확보.
+
+        hedge_controller: HedgeController (선택). hedge=True 호출에 적응형 hedge 지연 적용.
+        fallback_chain: ModelFallbackChain (선택). 모델별 서킷 브레이커 + 폴백 모델 선택.
+        """
+        ...
+
+    def _acquire_slot(self, model: str, messages: List[Dict[str, Any]], max_tokens: Optional[int],
+                      priority: Optional[int], timeout_s: Optional[float]) -> int:
+        """레이트 리미터 대기 (우선순위는 effective_priority — 미지정 시 priority_for_timeout, 컨텍스트 하한 적용).
+        예상 토큰(프롬프트 추정 + max_tokens) 반환, 대기 시간은 "llm.queue_wait" 스팬으로 기록."""
         ...
 
     def _normalize_tools(self, tools: Optional[List[Dict[str, Any]]]) -> Optional[List[Dict[str, Any]]]:
@@ -66,8 +121,54 @@ class OpenAILLM:
         parse_tool_arguments_json: bool = False,
         timeout_s: Optional[float] = None,
         retries: Optional[int] = None,
+        priority: Optional[int] = None,
+        hedge: bool = False,
     ) -> Dict[str, Any]:
-        """동기 Chat Completion. 재시도 + 정규화된 응답 반환."""
+        """동기 Chat Completion. 레이트 리미터 대기 → 재시도 + 정규화된 응답 반환.
+
+        priority: CallPriority. 재시도는 레이트 리미터를 다시 거쳐 백오프가 버킷 보충과 맞물림.
+        hedge: QUICK 호출 hedging. 동기 경로는 스레드 2개 중 먼저 끝난 응답 사용. 패자 요청은 취소되지 않고
+            끝까지 실행된 뒤 결과만 폐기된다 (토큰 비용 발생, 스레드 점유) — 가능하면 achat() 경로 사용.
+
+        fallback_chain 지정 시 매 시도 전 select(model, skip=timed_out)로 실제 호출 모델 결정.
+        시도가 타임아웃되면 그 모델을 timed_out에 넣어 남은 재시도는 브레이커 OPEN 전이라도 폴백 모델로 진행
+        → 호출당 타임아웃 최대 1회 (폴백 체인이 비면 LLMTimeoutError).
+        allow_request()로 받은 HALF_OPEN probe 슬롯은 finally에서 반환 — 결과가 없으면
+        (레이트 리미터 거절, 취소) record_* 대신 release_probe().
+        응답 dict의 "served_model"에 실제 응답한 모델 기록.
+        """
+        ...
+
+    async def achat(
+        self,
+        *,
+        model: Optional[str] = None,
+        messages: List[Dict[str, Any]],
+        tools: Optional[List[Dict[str, Any]]] = None,
+        tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        response_format: Optional[Dict[str, Any]] = None,
+        parse_tool_arguments_json: bool = False,
+        timeout_s: Optional[float] = None,
+        retries: Optional[int] = None,
+        priority: Optional[int] = None,
+        hedge: bool = False,
+    ) -> Dict[str, Any]:
+        """비동기 Chat Completion (공유 AsyncOpenAI). chat()과 동일한 레이트 리미트/서킷 브레이커/재시도/정규화.
+
+        타임아웃 모델 제외와 probe 슬롯 반환 규칙도 chat()과 같다 (asyncio.CancelledError 시 release_probe()).
+
+        hedge=True면 _ahedged_create() 경유.
+        """
+        ...
+
+    async def _ahedged_create(self, model: str, request: Dict[str, Any]) -> Any:
+        """원 요청 발송 → hedge_delay_s(model) 내 미응답이면 동일 요청 추가 발송.
+
+        asyncio.wait(FIRST_COMPLETED)로 승자 선택 후 패자 태스크 cancel (HTTP 스트림 종료).
+        승자 usage + 패자 추정 프롬프트 토큰을 HedgeController.record_hedge()에 기록.
+        """
         ...
 
     async def astream(
@@ -77,6 +178,16 @@ class OpenAILLM:
         messages: List[Dict[str, Any]],
         temperature: Optional[float] = None,
         max_tokens: Optional[int] = None,
+        response_format: Optional[Dict[str, Any]] = None,
     ) -> AsyncGenerator[str, None]:
-        """비동기 스트리밍 응답 (토큰 단위 yield)."""
+        """비동기 스트리밍 응답 (토큰 단위 yield). response_format 지정 시 구조화 출력 스트리밍."""
         ...
+
+
+def create_llm_client(**kwargs):
+    """OpenAILLM 생성 진입점 (kwargs는 OpenAILLM 생성자 인자).
+
+    LLM_REPLAY_MODE 설정 시 RecordReplayLLM으로 감싸 반환 — replay 모드에서는 OpenAILLM을 만들지 않는다.
+    LLMCallBuilder / LLMRouter / 그래프에 주입할 llm_client는 이 함수로 생성.
+    """
+    return wrap_llm(lambda: OpenAILLM(**kwargs))
@@ -0,0 +1,152 @@
+"""클라이언트 측 우선순위 레이트 리미터 (모델별 RPM/TPM 토큰 버킷).
+
+버스트 시 OpenAI RateLimitError → 지수 백오프 재시도가 겹치면 retry storm이 생기고,
+모든 호출이 동일하게 경쟁해 백그라운드 제안 호출이 TTFT를 좌우하는 QUICK 라우팅 호출을 밀어낸다.
+요청 전에 로컬에서 예산을 확보하고, 대기 요청은 우선순위 순(QUICK > DEFAULT > COMPLEX > BACKGROUND)으로 처리한다.
+대기 시간은 PipelineTracer 스팬 "llm.queue_wait"로 기록.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import logging
+import threading
+import time
+from contextvars import ContextVar, Token
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class CallPriority:
+    """호출 우선순위 (작을수록 먼저). LLMTimeout 카테고리와 1:1 대응."""
+    QUICK = 0          # 라우팅, 분류, 키워드 추출
+    DEFAULT = 1        # 일반 응답 (스트리밍 포함)
+    COMPLEX = 2        # tool_calls, 긴 응답
+    BACKGROUND = 3     # 후속 질문 제안, 메모리 요약 등
+
+
+def priority_for_timeout(timeout_s: Optional[float]) -> int:
+    """LLMTimeout 값으로 우선순위 추정 (priority 미지정 호출용)."""
+    if timeout_s is None:
+        return CallPriority.DEFAULT
+    if timeout_s <= 15.0:
+        return CallPriority.QUICK
+    if timeout_s <= 30.0:
+        return CallPriority.DEFAULT
+    if timeout_s <= 60.0:
+        return CallPriority.COMPLEX
+    return CallPriority.DEFAULT      # STREAMING(120s)은 사용자 대면 응답
+
+
+# 컨텍스트 전체 우선순위 하한 (예: 캐시 프리웜은 BACKGROUND). 호출부가 넘긴 priority보다 낮출 수만 있다.
+_priority_floor: ContextVar[Optional[int]] = ContextVar("_priority_floor", default=None)
+
+
+def get_priority_floor() -> Optional[int]:
+    """현재 컨텍스트의 우선순위 하한 (미바인딩 시 None)."""
+    return _priority_floor.get()
+
+
+def set_priority_floor(priority: int) -> Token:
+    """현재 컨텍스트에 우선순위 하한 바인딩 (asyncio.to_thread / copy_context로 스레드에도 전파)."""
+    return _priority_floor.set(priority)
+
+
+def reset_priority_floor(token: Token) -> None:
+    """ContextVar를 이전 값으로 복원."""
+    _priority_floor.reset(token)
+
+
+def effective_priority(priority: Optional[int], timeout_s: Optional[float]) -> int:
+    """호출 우선순위 (미지정 시 priority_for_timeout)에 컨텍스트 하한 적용."""
+    resolved = priority if priority is not None else priority_for_timeout(timeout_s)
+    floor = _priority_floor.get()
+    return resolved if floor is None else max(resolved, floor)
+
+
+@dataclass
+class ModelRateLimit:
+    """모델별 한도 (조직 tier 한도보다 약간 낮게 설정해 서버 측 429 회피)."""
+    rpm: int
+    tpm: int
+
+
+DEFAULT_RATE_LIMITS: Dict[str, ModelRateLimit] = {
+    "gpt-4o": ModelRateLimit(rpm=4_500, tpm=720_000),
+    "gpt-4o-mini": ModelRateLimit(rpm=9_000, tpm=1_800_000),
+}
+
+
+class TokenBucket:
+    """연속 보충 토큰 버킷. capacity = 분당 한도, 초당 capacity/60 보충."""
+
+    def __init__(self, capacity: float):
+        self.capacity = capacity
+        self.tokens = capacity
+        self.rate_per_s = capacity / 60.0
+        self.updated_at = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate_per_s)
+        self.updated_at = now
+
+    def try_consume(self, amount: float) -> float:
+        """차감 성공 시 0.0, 부족하면 채워질 때까지 필요한 대기 시간(초) 반환 (차감 안 함)."""
+        now = time.monotonic()
+        self._refill(now)
+        if self.tokens >= amount:
+            self.tokens -= amount
+            return 0.0
+        return (amount - self.tokens) / self.rate_per_s
+
+    def refund(self, amount: float) -> None:
+        """예상보다 적게 쓴 토큰 반환 (음수면 추가 차감)."""
+        self.tokens = min(self.capacity, self.tokens + amount)
+
+
+class PriorityRateLimiter:
+    """모델별 RPM + TPM 버킷과 우선순위 대기열.
+
+    대기열 head(가장 높은 우선순위, 같은 우선순위는 FIFO)만 버킷 차감을 시도 →
+    낮은 우선순위 요청이 먼저 온 높은 우선순위 요청을 추월하지 못한다.
+    """
+
+    def __init__(self, limits: Optional[Dict[str, ModelRateLimit]] = None, max_wait_s: float = 30.0):
+        self._limits = limits or DEFAULT_RATE_LIMITS
+        self._buckets: Dict[str, Tuple[TokenBucket, TokenBucket]] = {}
+        self._waiters: Dict[str, List[Tuple[int, int]]] = {}   # model -> heap[(priority, seq)]
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._max_wait_s = max_wait_s
+        self._stats: Dict[str, Any] = {"acquired": 0, "timeouts": 0, "wait_ms_by_priority": {}}
+
+    def acquire(self, model: str, estimated_tokens: int, priority: int = CallPriority.DEFAULT) -> float:
+        """동기 획득. 대기한 ms 반환. max_wait_s 초과 시 LLMRateLimitError."""
+        ...
+
+    async def aacquire(self, model: str, estimated_tokens: int, priority: int = CallPriority.DEFAULT) -> float:
+        """비동기 획득 (이벤트 루프 비차단, 대기열/버킷은 동기 경로와 공유)."""
+        ...
+
+    def settle(self, model: str, estimated_tokens: int, actual_tokens: int) -> None:
+        """응답 usage 기준으로 TPM 버킷 정산 (추정치와의 차이 환급/추가 차감)."""
+        ...
+
+    def stats(self) -> Dict[str, Any]:
+        """획득 수, 타임아웃 수, 우선순위별 대기 p50/p95(ms), 모델별 현재 대기열 길이."""
+        ...
+
+
+_global_rate_limiter: Optional[PriorityRateLimiter] = None
+
+
+def get_rate_limiter() -> PriorityRateLimiter:
+    """프로세스 전역 PriorityRateLimiter 싱글톤 반환."""
+    global _global_rate_limiter
+    if _global_rate_limiter is None:
+        _global_rate_limiter = PriorityRateLimiter()
+    return _global_rate_limiter
@@ -0,0 +1,106 @@
+"""Single-flight 요청 병합 (동일 캐시 키 동시 미스 → LLM 호출 1회).
+
+LLMCallBuilder 캐시 키는 세션 간 공유되므로, 인기 질문이 동시에 몰리면
+캐시가 채워지기 전까지 모든 미스가 각자 OpenAI를 호출한다. 같은 키의 동시 요청은
+첫 요청(leader)의 결과를 기다렸다가 그대로 받는다(follower).
+
+- 스레드: do()  — threading.Event 기반
+- asyncio: ado() — asyncio.Future 기반 (이벤트 루프별)
+- 프로세스 간(선택): Redis SET NX PX 단기 락. 락을 못 잡은 워커는 캐시가 채워질 때까지 폴링.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class _Call:
+    """진행 중인 스레드 호출 1건."""
+    __slots__ = ("event", "result", "error", "followers")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.followers = 0
+
+
+class SingleFlight:
+    """키 단위 in-flight 요청 병합기."""
+
+    def __init__(
+        self,
+        redis_client=None,
+        lock_ttl_ms: int = 30_000,
+        poll_interval_s: float = 0.05,
+        lock_prefix: str = "sf:",
+    ):
+        """redis_client 지정 시 프로세스 간 병합 활성화 (캐시 db=0 클라이언트 재사용)."""
+        self._calls: Dict[str, _Call] = {}
+        self._afutures: Dict[str, asyncio.Future] = {}
+        self._lock = threading.Lock()
+        self._redis = redis_client
+        self._lock_ttl_ms = lock_ttl_ms
+        self._poll_interval_s = poll_interval_s
+        self._lock_prefix = lock_prefix
+        self._stats = {"leaders": 0, "followers": 0, "remote_waits": 0, "remote_timeouts": 0}
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Any:
+        """스레드 병합. leader만 fn() 실행, follower는 결과(또는 예외) 공유."""
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                call.followers += 1
+                self._stats["followers"] += 1
+                leader = False
+            else:
+                call = self._calls[key] = _Call()
+                self._stats["leaders"] += 1
+                leader = True
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.event.set()
+        return call.result
+
+    async def ado(self, key: str, coro_fn: Callable[[], Awaitable[Any]]) -> Any:
+        """asyncio 병합. 같은 루프 내 동일 키 요청은 leader의 Future를 await.
+
+        follower 취소가 leader 태스크를 취소하지 않도록 asyncio.shield 사용.
+        """
+        ...
+
+    # ---- 프로세스 간 (Redis) ----
+
+    def acquire_remote(self, key: str) -> bool:
+        """SET sf:{key} NX PX lock_ttl_ms. 성공 시 이 워커가 leader."""
+        ...
+
+    def release_remote(self, key: str) -> None:
+        """leader 완료 후 락 해제 (자신이 잡은 토큰일 때만, Lua compare-and-delete)."""
+        ...
+
+    def wait_remote(self, key: str, cache_get: Callable[[], Optional[Any]]) -> Optional[Any]:
+        """다른 워커가 leader면 캐시가 채워지거나 락이 사라질 때까지 폴링.
+        락 TTL 내에 값이 안 생기면 None → 호출자가 직접 LLM 호출."""
+        ...
+
+    def stats(self) -> Dict[str, Any]:
+        """leader/follower 수, 병합률(followers / 전체), 원격 대기/타임아웃 수."""
+        ...
@@ -0,0 +1,72 @@
+"""그래프 노드 → SSE 클라이언트 점진 전송 채널 (ContextVar 기반).
+
+ChatService가 요청마다 StreamChannel을 만들어 바인딩하고, 그래프 실행과 동시에 drain한다.
+노드는 get_stream_channel()로 섹션/토큰을 즉시 내보낼 수 있다 — 그래프 종료를 기다리지 않음.
+미바인딩(비스트리밍 호출, 배치 실행) 시 None → 노드는 기존 방식으로 state에만 기록.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class StreamEvent:
+    """채널로 전달되는 단일 이벤트."""
+    type: str                            # "section" | "token" | "section_end"
+    content: str = ""
+    agent: Optional[str] = None
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+
+class StreamChannel:
+    """요청별 비동기 이벤트 큐. 첫 콘텐츠 이벤트 시 PipelineTracer.mark_ttft()."""
+
+    def __init__(self, maxsize: int = 0):
+        self._queue: "asyncio.Queue[Optional[StreamEvent]]" = asyncio.Queue(maxsize=maxsize)
+        self._closed = False
+        self.streamed_agents: List[str] = []
+
+    async def emit_section(self, agent: str, content: str, **metadata) -> None:
+        """에이전트 섹션 1개 전송 (side_by_side / sequential 병합용)."""
+        ...
+
+    async def emit_token(self, token: str, agent: Optional[str] = None) -> None:
+        """토큰 단위 전송 (integrated 병합 스트리밍용)."""
+        ...
+
+    async def close(self) -> None:
+        """종료 센티넬 투입. 이후 emit은 무시."""
+        ...
+
+    async def events(self) -> AsyncIterator[StreamEvent]:
+        """close()까지 이벤트 yield (ChatService가 소비)."""
+        ...
+
+
+# --- ContextVar 전역 접근 ---
+
+_current_channel: ContextVar[Optional[StreamChannel]] = ContextVar(
+    "_current_channel", default=None
+)
+
+
+def get_stream_channel() -> Optional[StreamChannel]:
+    """현재 요청의 StreamChannel 반환 (미설정 시 None)."""
+    return _current_channel.get()
+
+
+def set_stream_channel(channel: StreamChannel) -> Token:
+    """현재 async 컨텍스트에 StreamChannel 바인딩."""
+    return _current_channel.set(channel)
+
+
+def reset_stream_channel(token: Token) -> None:
+    """ContextVar를 이전 값으로 복원."""
+    _current_channel.reset(token)
@@ -0,0 +1,71 @@
+"""스트리밍 JSON 점진 파서 (구조화 출력 조기 판단용).
+
+라우터 응답 `{"intent": "cs", "confidence": 0.93, ..., "reason": "..."}`에서
+intent 같은 결정 필드는 completion 앞부분에서 완성된다. 전체 completion(특히 장문 reason)을
+기다리지 않고 최상위 필드가 닫히는 즉시 값을 확정해 콜백으로 전달한다.
+스트림 종료 후에는 전체 텍스트로 Pydantic 검증을 수행 (조기 값과 불일치하면 최종 값이 우선).
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _ParseCursor:
+    """최상위 객체 스캔 상태."""
+    depth: int = 0                  # 중괄호/대괄호 중첩 깊이 (최상위 객체 내부 = 1)
+    in_string: bool = False
+    escaped: bool = False
+    current_key: Optional[str] = None
+    value_start: int = -1           # 현재 최상위 값의 버퍼 내 시작 오프셋
+    key_start: int = -1
+
+
+class IncrementalJSONParser:
+    """청크를 누적하며 최상위 필드가 완성되는 순간을 감지.
+
+    문자 단위 상태 머신 — 문자열/이스케이프/중첩 깊이만 추적하고, depth==1에서
+    ',' 또는 '}'를 만나면 직전 값 구간을 json.loads로 확정한다. 값 파싱 실패 시
+    해당 필드는 조기 확정하지 않고 최종 검증에 맡긴다.
+    """
+
+    def __init__(self, watch_fields: Optional[Iterable[str]] = None):
+        """watch_fields: 조기 통지할 필드 (None이면 모든 최상위 필드)."""
+        self._buffer: List[str] = []
+        self._pos = 0
+        self._cursor = _ParseCursor()
+        self._watch: Optional[Set[str]] = set(watch_fields) if watch_fields else None
+        self.completed: Dict[str, Any] = {}
+
+    def feed(self, chunk: str) -> Dict[str, Any]:
+        """청크 추가. 이번 청크로 새로 완성된 {필드: 값} 반환."""
+        ...
+
+    def has_all(self, fields: Iterable[str]) -> bool:
+        """지정 필드가 모두 완성됐는지."""
+        return all(f in self.completed for f in fields)
+
+    @property
+    def text(self) -> str:
+        """지금까지 누적된 원문."""
+        return "".join(self._buffer)
+
+
+@dataclass
+class IncrementalResult:
+    """점진 호출 결과.
+
+    early: 결정 필드가 모두 완성된 시점의 부분 dict (스트림이 그 전에 끝나면 최종 dict)
+    final: 전체 검증된 Pydantic 모델 (검증 실패 시 fallback_value)
+    early_ms / final_ms: 호출 시작 대비 도달 시각
+    """
+    early: Dict[str, Any] = field(default_factory=dict)
+    final: Any = None
+    early_ms: Optional[float] = None
+    final_ms: Optional[float] = None
@@ -0,0 +1,166 @@
+"""스키마 강제 구조화 출력 (JSON 보정 재호출 제거).
+
+output_schema만 넘기면 Pydantic 모델에서 strict JSON-schema response_format을 자동 생성한다.
+지원 모델은 디코딩 단계에서 스키마가 강제되므로 코드펜스 제거, 재시도, 기본값 폴백이
+사실상 필요 없어진다. 파생 스키마와 TypeAdapter 검증기는 모델 클래스별로 1회만 만들어 캐시한다.
+
+strict 모드 제약 (OpenAI structured outputs):
+  - 모든 object에 additionalProperties: false
+  - 모든 속성이 required (기본값 있는 필드도 모델이 값을 채워 출력, 타입은 그대로)
+  - default 키워드 미지원 → 제거
+  - 자유 형식 dict(Dict[str, Any] 등 additionalProperties가 열린 object)는 표현 불가
+    → 그런 필드가 있는 스키마는 strict 대신 json_object 모드 + 검증으로 폴백
+"""
+
+from __future__ import annotations
+
+import copy
+import logging
+import re
+import threading
+from collections import defaultdict
+from functools import lru_cache
+from typing import Any, Dict, Iterator, Optional, Type
+
+from pydantic import BaseModel, TypeAdapter
+
+logger = logging.getLogger(__name__)
+
+# json_schema strict 모드 지원 모델 (날짜 스냅샷 접미사 제외한 정확한 이름. 나머지는 json_object 모드 + 검증)
+# o1-mini / o1-preview는 structured outputs 미지원이라 prefix 매칭을 쓰지 않는다
+STRICT_SCHEMA_MODELS = frozenset({
+    "gpt-4o", "gpt-4o-mini", "gpt-4.1", "gpt-4.1-mini", "gpt-4.1-nano",
+    "o1", "o3", "o3-mini", "o4-mini",
+})
+STRICT_SCHEMA_UNSUPPORTED_SNAPSHOTS = frozenset({"gpt-4o-2024-05-13"})
+
+_SNAPSHOT_SUFFIX_RE = re.compile(r"-\d{4}-\d{2}-\d{2}$")
+
+# 값이 "이름 → 스키마" 맵인 키 (맵 자체는 스키마 노드가 아님)
+_SCHEMA_MAP_KEYS = ("properties", "$defs", "definitions", "patternProperties")
+# 값이 스키마가 아닌 리터럴인 키
+_LITERAL_KEYS = ("enum", "const", "examples", "default", "required")
+
+
+def supports_strict_schema(model: str) -> bool:
+    """모델이 strict json_schema response_format을 지원하는지."""
+    if model in STRICT_SCHEMA_UNSUPPORTED_SNAPSHOTS:
+        return False
+    return _SNAPSHOT_SUFFIX_RE.sub("", model) in STRICT_SCHEMA_MODELS
+
+
+def _schema_nodes(node: Any) -> Iterator[Dict[str, Any]]:
+    """스키마 트리의 모든 스키마 노드(dict) 순회. properties 등 이름 맵과 리터럴 값은 노드로 취급하지 않는다."""
+    if isinstance(node, list):
+        for item in node:
+            yield from _schema_nodes(item)
+        return
+    if not isinstance(node, dict):
+        return
+    yield node
+    for key, value in list(node.items()):
+        if key in _LITERAL_KEYS:
+            continue
+        if key in _SCHEMA_MAP_KEYS and isinstance(value, dict):
+            for sub in value.values():
+                yield from _schema_nodes(sub)
+        else:
+            yield from _schema_nodes(value)
+
+
+def _is_open_object(node: Dict[str, Any]) -> bool:
+    """자유 형식 dict (properties 없는 object 또는 additionalProperties 허용)."""
+    extra = node.get("additionalProperties")
+    if extra is not None and extra is not False:
+        return True
+    return node.get("type") == "object" and "properties" not in node
+
+
+def _make_strict(schema: Dict[str, Any]) -> None:
+    """JSON schema를 strict 규칙에 맞게 제자리 변환."""
+    for node in _schema_nodes(schema):
+        node.pop("default", None)
+        if node.get("type") == "object" or "properties" in node:
+            node["required"] = list(node.get("properties", {}).keys())
+            node["additionalProperties"] = False
+
+
+@lru_cache(maxsize=256)
+def strict_json_schema(output_schema: Type[BaseModel]) -> Optional[Dict[str, Any]]:
+    """모델 클래스 → strict JSON schema (클래스별 1회 생성, 이후 캐시 반환 — 호출부에서 변경 금지).
+
+    자유 형식 dict 필드가 있어 strict로 표현할 수 없으면 None.
+    """
+    schema = copy.deepcopy(output_schema.model_json_schema())
+    if any(_is_open_object(node) for node in _schema_nodes(schema)):
+        logger.info("%s has free-form object fields; using json_object mode", output_schema.__name__)
+        return None
+    _make_strict(schema)
+    return schema
+
+
+@lru_cache(maxsize=256)
+def _response_format(output_schema: Type[BaseModel], strict: bool) -> Dict[str, Any]:
+    schema = strict_json_schema(output_schema) if strict else None
+    if schema is None:
+        return {"type": "json_object"}
+    return {
+        "type": "json_schema",
+        "json_schema": {
+            "name": output_schema.__name__,
+            "schema": schema,
+            "strict": True,
+        },
+    }
+
+
+def response_format_for(output_schema: Type[BaseModel], model: str) -> Dict[str, Any]:
+    """output_schema + 모델 → response_format. 미지원 모델/자유 형식 dict 스키마는 json_object 모드."""
+    return _response_format(output_schema, supports_strict_schema(model))
+
+
+@lru_cache(maxsize=256)
+def get_validator(output_schema: Type[BaseModel]) -> TypeAdapter:
+    """모델 클래스별 TypeAdapter (검증 코어 1회 컴파일). validate_json으로 파싱+검증을 한 번에."""
+    return TypeAdapter(output_schema)
+
+
+class ParseStats:
+    """call_site별 구조화 출력 파싱 결과 집계 (스레드 안전).
+
+    outcome:
+      ok        — 첫 응답이 바로 검증 통과
+      repaired  — _coerce_json 보정 후 통과 (strict 미지원 모델)
+      retried   — 재호출 후 통과
+      fallback  — 최종 실패, fallback_value/기본값 사용
+    """
+
+    OUTCOMES = ("ok", "repaired", "retried", "fallback")
+
+    def __init__(self):
+        self._counts: Dict[str, Dict[str, int]] = defaultdict(lambda: dict.fromkeys(self.OUTCOMES, 0))
+        self._lock = threading.Lock()
+
+    def record(self, call_site: Optional[str], outcome: str) -> None:
+        """파싱 결과 1건 기록."""
+        with self._lock:
+            self._counts[call_site or "unknown"][outcome] += 1
+
+    def report(self) -> Dict[str, Dict[str, Any]]:
+        """call_site별 건수, 파싱 실패율(ok 외 비율), 재시도율, 폴백률."""
+        ...
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counts.clear()
+
+
+_global_parse_stats: Optional[ParseStats] = None
+
+
+def get_parse_stats() -> ParseStats:
+    """프로세스 전역 ParseStats 싱글톤 반환."""
+    global _global_parse_stats
+    if _global_parse_stats is None:
+        _global_parse_stats = ParseStats()
+    return _global_parse_stats
@@ -0,0 +1,190 @@
+"""호출 전 토큰 추정과 호출 지점별 입력 토큰 예산.
+
+calculate_cost()는 응답 이후 usage로만 비용을 알려준다. conversation_history와 RAG 근거가
+제한 없이 프롬프트에 붙으면 입력 토큰(=지연+비용)이 턴마다 커진다.
+호출 전에 토큰을 오프라인 추정하고, 예산 초과 시 결정적 순서로 잘라낸다:
+
+  1. 가장 오래된 대화 턴부터 제거 (최근 min_history_turns턴은 보존). 턴 = user 메시지 + 뒤따르는
+     assistant/tool 메시지 묶음 — tool_calls와 tool 결과가 짝을 잃지 않도록 턴 단위로만 자른다
+  2. 그래도 넘으면 순위가 가장 낮은 근거(evidence)부터 제거 (상위 min_evidence개는 보존)
+  3. 그래도 넘으면 남은 마지막 근거를 토큰 단위로 절단
+
+system / user 본문은 자르지 않는다 (지시/질문 손실 방지).
+tiktoken이 있으면 모델 인코딩으로 정확히 세고, 없으면 문자 수 기반 휴리스틱 (한국어 ~1.5자/토큰).
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+from .metrics import calculate_cost
+
+logger = logging.getLogger(__name__)
+
+try:
+    import tiktoken
+except ImportError:  # 선택 의존성 — 없으면 휴리스틱 추정
+    tiktoken = None
+
+# 메시지당 role/구분자 오버헤드 (OpenAI chat 포맷 기준)
+MESSAGE_OVERHEAD_TOKENS = 4
+
+# 호출 지점별 기본 입력 토큰 예산 (LLMCallConfig.max_input_tokens 미지정 시 참조)
+CALL_SITE_TOKEN_BUDGETS: Dict[str, int] = {
+    "router.classify_intent": 1_500,
+    "router.select_agent": 1_500,
+    "router.decide_handoff": 2_000,
+    "skincare.slot_extract": 2_000,
+    "skincare.conversational_response": 6_000,
+    "skincare.routine_synthesizer": 8_000,
+    "cs.answer": 6_000,
+    "reco.answer": 6_000,
+}
+
+
+@lru_cache(maxsize=16)
+def _encoding_for(model: str):
+    """모델별 tiktoken 인코딩 (미지원 모델은 o200k_base)."""
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding("o200k_base")
+
+
+def estimate_tokens(text: str, model: str = "gpt-4o") -> int:
+    """텍스트 토큰 수 추정. tiktoken 미설치 시 ASCII 4자/토큰, 비ASCII 1.5자/토큰."""
+    if not text:
+        return 0
+    if tiktoken is not None:
+        return len(_encoding_for(model).encode(text))
+    ascii_chars = sum(1 for ch in text if ord(ch) < 128)
+    return int(ascii_chars / 4 + (len(text) - ascii_chars) / 1.5) + 1
+
+
+def estimate_message_tokens(message: Dict[str, Any], model: str = "gpt-4o") -> int:
+    """메시지 1개 토큰 추정: content + assistant tool_calls(함수명/arguments) + 오버헤드."""
+    tokens = estimate_tokens(str(message.get("content") or ""), model) + MESSAGE_OVERHEAD_TOKENS
+    for call in message.get("tool_calls") or []:
+        fn = call.get("function") or {}
+        arguments = fn.get("arguments") or ""
+        if not isinstance(arguments, str):
+            arguments = json.dumps(arguments, ensure_ascii=False)
+        tokens += estimate_tokens(str(fn.get("name") or ""), model) + estimate_tokens(arguments, model)
+    return tokens
+
+
+def estimate_messages_tokens(messages: List[Dict[str, Any]], model: str = "gpt-4o") -> int:
+    """chat messages 전체 입력 토큰 추정 (메시지당 오버헤드 포함)."""
+    return sum(estimate_message_tokens(m, model) for m in messages) + 2
+
+
+def estimate_call_cost(model: str, input_tokens: int, max_output_tokens: int) -> float:
+    """호출 전 최악 비용(USD) 추정 — 출력은 max_output_tokens를 모두 쓴다고 가정."""
+    return calculate_cost(model, input_tokens, max_output_tokens)
+
+
+@dataclass
+class PromptParts:
+    """예산 적용 전 프롬프트 구성 요소.
+
+    history: 오래된 것부터 정렬된 대화 이력 ({"role", "content"}, assistant는 "tool_calls" 포함 가능)
+    evidence: 순위 높은 것부터 정렬된 RAG 근거 텍스트 (user 앞에 붙는 컨텍스트)
+    """
+    system: str
+    user: str
+    history: List[Dict[str, Any]] = field(default_factory=list)
+    evidence: List[str] = field(default_factory=list)
+
+    def to_messages(self) -> List[Dict[str, Any]]:
+        """system → history → (근거 + user) 순서 messages. 비어 있지 않은 근거가 없으면 헤더 없이 user만."""
+        messages: List[Dict[str, Any]] = [{"role": "system", "content": self.system}]
+        messages.extend(self.history)
+        user = self.user
+        evidence = [e for e in self.evidence if e]
+        if evidence:
+            user = "[참고 자료]\n" + "\n\n".join(evidence) + "\n\n[질문]\n" + user
+        messages.append({"role": "user", "content": user})
+        return messages
+
+
+@dataclass
+class TrimResult:
+    """예산 적용 결과."""
+    parts: PromptParts
+    original_tokens: int
+    final_tokens: int
+    dropped_history: int = 0          # 제거된 이력 메시지 수 (턴 단위로 제거)
+    dropped_evidence: int = 0
+    truncated_evidence: bool = False
+
+    @property
+    def trimmed_tokens(self) -> int:
+        return max(0, self.original_tokens - self.final_tokens)
+
+
+def _split_turns(history: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+    """이력을 턴 단위로 분할. user 메시지마다 새 턴 시작 (앞쪽의 user 없는 메시지는 별도 묶음)."""
+    turns: List[List[Dict[str, Any]]] = []
+    for message in history:
+        if message.get("role") == "user" or not turns:
+            turns.append([])
+        turns[-1].append(message)
+    return turns
+
+
+def trim_to_budget(
+    parts: PromptParts,
+    max_input_tokens: Optional[int],
+    model: str = "gpt-4o",
+    min_history_turns: int = 2,
+    min_evidence: int = 1,
+) -> TrimResult:
+    """입력 토큰 예산에 맞게 결정적으로 잘라낸 PromptParts 반환 (원본 불변).
+
+    같은 입력이면 항상 같은 결과 → 캐시 키 안정성 유지.
+    """
+    original = estimate_messages_tokens(parts.to_messages(), model)
+    if not max_input_tokens or original <= max_input_tokens:
+        return TrimResult(parts=parts, original_tokens=original, final_tokens=original)
+
+    turns = _split_turns(parts.history)
+    evidence = list(parts.evidence)
+    turn_tokens = [sum(estimate_message_tokens(m, model) for m in turn) for turn in turns]
+    evidence_tokens = [estimate_tokens(e, model) for e in evidence]
+    total = original
+    result = TrimResult(parts=parts, original_tokens=original, final_tokens=original)
+
+    dropped_turns = 0
+    while total > max_input_tokens and len(turns) - dropped_turns > min_history_turns:
+        total -= turn_tokens[dropped_turns]
+        result.dropped_history += len(turns[dropped_turns])
+        dropped_turns += 1
+    history = [m for turn in turns[dropped_turns:] for m in turn]
+
+    while total > max_input_tokens and len(evidence) > min_evidence:
+        evidence.pop()
+        total -= evidence_tokens.pop()
+        result.dropped_evidence += 1
+
+    if total > max_input_tokens and evidence:
+        keep = max(0, evidence_tokens[-1] - (total - max_input_tokens))
+        text = evidence[-1]
+        if tiktoken is not None:
+            enc = _encoding_for(model)
+            evidence[-1] = enc.decode(enc.encode(text)[:keep])
+        else:
+            evidence[-1] = text[: int(len(text) * keep / max(evidence_tokens[-1], 1))]
+        result.truncated_evidence = True
+
+    result.parts = PromptParts(system=parts.system, user=parts.user, history=history, evidence=evidence)
+    result.final_tokens = estimate_messages_tokens(result.parts.to_messages(), model)
+    if result.final_tokens > max_input_tokens:
+        logger.warning(
+            "token budget exceeded after trim: %d > %d (system/user untouched)",
+            result.final_tokens, max_input_tokens,
+        )
+    return result
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import os
+import re
 import time
 import uuid
 import logging
@@ -12,6 +14,22 @@ from typing import Dict, List, Optional, Any
 
 logger = logging.getLogger(__name__)
 
+# 질의 원문 기록은 opt-in (TraceSummary → export_traces → 캐시 프리웜 쿼리 로그). 기록 시에도 PII 마스킹
+TRACE_RECORD_QUERY_TEXT = os.getenv("TRACE_RECORD_QUERY_TEXT", "0") == "1"
+
+_REDACTIONS = (
+    (re.compile(r"[\w.+-]+@[\w-]+(?:\.[\w-]+)+"), "[EMAIL]"),
+    (re.compile(r"(?:\+?82[-\s]?)?0?1[016789][-\s]?\d{3,4}[-\s]?\d{4}"), "[PHONE]"),
+    (re.compile(r"\d[\d-]{6,}\d"), "[NUMBER]"),     # 주문/카드/계좌 번호 등 긴 숫자열
+)
+
+
+def redact_query(text: str) -> str:
+    """이메일, 전화번호, 긴 숫자열 마스킹."""
+    for pattern, mask in _REDACTIONS:
+        text = pattern.sub(mask, text)
+    return text
+
 
 @dataclass
 class SpanRecord:
@@ -31,6 +49,8 @@ class TraceSummary:
     e2e_ms: float = 0.0
     spans: List[SpanRecord] = field(default_factory=list)
     path: str = ""                      # "ingest -> llm_router -> ..."
+    user_text: str = ""                 # 마스킹된 질의 (TRACE_RECORD_QUERY_TEXT=1일 때만, 캐시 프리웜 쿼리 로그용)
+    agent: Optional[str] = None         # 최종 라우팅된 에이전트
 
     def to_dict(self) -> Dict[str, Any]:
         """트레이스 요약을 직렬화 가능한 dict로 변환."""
@@ -49,6 +69,8 @@ class PipelineTracer:
         self._ttft_ms: Optional[float] = None
         self._ttft_marked = False
         self._node_path: List[str] = []
+        self._user_text = ""
+        self._agent: Optional[str] = None
 
     # --- 스팬 API ---
 
@@ -80,6 +102,17 @@ class PipelineTracer:
         """노드 경로에 추가 (연속 중복 제거)."""
         ...
 
+    def set_query(self, user_text: Optional[str] = None, agent: Optional[str] = None) -> None:
+        """질의와 라우팅된 에이전트 기록 (TraceSummary로 내보내 프리웜 대상 선정에 사용).
+
+        질의는 TRACE_RECORD_QUERY_TEXT=1일 때만 redact_query()로 마스킹해 보관. ingest에서 질의,
+        llm_router에서 에이전트를 각각 기록한다 (None 인자는 기존 값 유지).
+        """
+        if user_text is not None and TRACE_RECORD_QUERY_TEXT:
+            self._user_text = redact_query(user_text)
+        if agent is not None:
+            self._agent = agent
+
     # --- 종료 ---
 
     def finish(self) -> TraceSummary:
@@ -7,6 +7,7 @@ from abc import ABC, abstractmethod
 import logging
 
 from .schemas import OrchestratorState, HandoffDecision
+from common.lazy import LazyResource
 
 logger = logging.getLogger(__name__)
 
@@ -17,18 +18,43 @@ class AgentCacheConfig:
     enabled: bool = False
     ttl: int = 3600
     cache_name: str = ""
+    stale_ttl: int = 0   # soft TTL(=ttl) 경과 후 스테일 서빙 허용 시간 (초). 0이면 SWR 비활성
 
 
 class BaseAgentAdapter(ABC):
-    """에이전트 어댑터 기본 클래스. process()와 extract_slots()를 구현해야 함."""
+    """에이전트 어댑터 기본 클래스. process()와 extract_slots()를 구현해야 함.
+
+    그래프와 무거운 리소스(인덱스, 벡터스토어, 카탈로그)는 생성자에서 만들지 않고
+    LazyResource로 등록 → 첫 process() 또는 warmup() 시 초기화.
+    """
 
     def __init__(self, cache_manager=None, cache_config: AgentCacheConfig = None):
         self.cache_manager = cache_manager
         self.cache_config = cache_config or AgentCacheConfig()
+        self._lazy_resources: List[LazyResource] = []
+
+    def _lazy(self, name: str, factory) -> LazyResource:
+        """지연 리소스 등록 후 반환."""
+        resource = LazyResource(f"{self.cache_config.cache_name or type(self).__name__}.{name}", factory)
+        self._lazy_resources.append(resource)
+        return resource
+
+    def warmup(self) -> Dict[str, Any]:
+        """등록된 지연 리소스 전부 초기화. 컴포넌트별 init_ms 반환."""
+        for resource in self._lazy_resources:
+            resource.get()
+        return {r.name: r.status() for r in self._lazy_resources}
+
+    @property
+    def is_warm(self) -> bool:
+        return all(r.ready for r in self._lazy_resources)
 
     @abstractmethod
     def process(self, state: OrchestratorState) -> OrchestratorState:
-        """에이전트 그래프 실행 후 결과를 OrchestratorState로 반환."""
+        """에이전트 그래프 실행 후 결과를 OrchestratorState로 반환.
+
+        그래프를 stream 모드로 돌리며 노드 경계마다 check_cancelled() 호출 (슈퍼바이저 기한 초과 시 중단).
+        """
         ...
 
     @abstractmethod
@@ -46,6 +72,11 @@ class BaseAgentAdapter(ABC):
         """캐시 키 구성 요소 생성 (에이전트별 오버라이드)."""
         return {}
 
+    def _get_cached_result(self, state: OrchestratorState) -> Optional[OrchestratorState]:
+        """cache_manager.get_swr로 응답 캐시 조회. 스테일이면 즉시 반환하고 get_revalidator()로
+        process()를 백그라운드 재실행해 set_swr(soft_ttl=ttl, hard_ttl=ttl + stale_ttl) 갱신."""
+        ...
+
     def _should_cache_result(self, result: OrchestratorState) -> bool:
         """결과 캐싱 여부 판단 (에이전트별 오버라이드)."""
         return False
@@ -59,9 +90,10 @@ class SkincareAgentAdapter(BaseAgentAdapter):
     def __init__(self, checkpointer=None, cache_manager=None):
         super().__init__(
             cache_manager=cache_manager,
-            cache_config=AgentCacheConfig(enabled=True, ttl=1800, cache_name="skincare"),
+            cache_config=AgentCacheConfig(enabled=True, ttl=1800, cache_name="skincare", stale_ttl=1800),
         )
-        # # self.graph = build_skincare_graph(checkpointer=checkpointer)
+        # 그래프 + FAISS 인덱스(build_faiss_from_docs_cached)는 첫 사용 시 로드
+        # self._graph = self._lazy("graph", lambda: build_skincare_graph(checkpointer=checkpointer))
         ...
 
     def process(self, state: OrchestratorState) -> OrchestratorState:
@@ -73,13 +105,16 @@ class SkincareAgentAdapter(BaseAgentAdapter):
 
 
 class RecoAgentAdapter(BaseAgentAdapter):
-    """제품 추천 그래프 어댑터 (슬롯추출->검색->리랭크->응답). 캐시 TTL 1시간."""
+    """제품 추천 그래프 어댑터 (슬롯추출->검색->리랭크->응답). 캐시 TTL 1시간.
+
+    ProductVectorSearch(Parquet + NPZ)와 그래프는 LazyResource로 지연 로드.
+    """
 
     def __init__(self, llm_client=None, product_service=None,
                  cache_manager=None, checkpointer=None):
         super().__init__(
             cache_manager=cache_manager,
-            cache_config=AgentCacheConfig(enabled=True, ttl=3600, cache_name="reco"),
+            cache_config=AgentCacheConfig(enabled=True, ttl=3600, cache_name="reco", stale_ttl=1800),
         )
         ...
 
@@ -106,12 +141,15 @@ class ASAgentAdapter(BaseAgentAdapter):
 
 
 class CSAgentAdapter(BaseAgentAdapter):
-    """CS 에이전트 어댑터 (주문조회, 제품정보, FAQ). 캐시 TTL 15분."""
+    """CS 에이전트 어댑터 (주문조회, 제품정보, FAQ). 캐시 TTL 15분.
+
+    CSRagService(Chroma + OpenAIEmbeddings)와 그래프는 LazyResource로 지연 로드.
+    """
 
     def __init__(self, checkpointer=None, cache_manager=None):
         super().__init__(
             cache_manager=cache_manager,
-            cache_config=AgentCacheConfig(enabled=True, ttl=900, cache_name="cs"),
+            cache_config=AgentCacheConfig(enabled=True, ttl=900, cache_name="cs", stale_ttl=900),
         )
         ...
 
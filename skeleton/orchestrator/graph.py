@@ -20,7 +20,7 @@ logger = logging.getLogger(__name__)
 # ---- 노드 메트릭 데코레이터 ----
 
 def with_node_metrics(node_name: str):
-    """동기 노드 실행 시간 및 상태 변경 추적 데코레이터."""
+    """동기 노드 실행 시간 및 상태 변경 추적 데코레이터. 종료 시 latency_budget_remaining_ms 갱신."""
     def decorator(func: Callable):
         @wraps(func)
         def wrapper(state: OrchestratorState, *args, **kwargs):
@@ -30,7 +30,7 @@ def with_node_metrics(node_name: str):
 
 
 def with_node_metrics_async(node_name: str):
-    """비동기 노드 실행 시간 및 상태 변경 추적 데코레이터."""
+    """비동기 노드 실행 시간 및 상태 변경 추적 데코레이터. 종료 시 latency_budget_remaining_ms 갱신."""
     def decorator(func: Callable):
         @wraps(func)
         async def wrapper(state: OrchestratorState, *args, **kwargs):
@@ -47,16 +47,63 @@ async def node_ingest(
     memory_service=None,
     llm_client=None,
 ) -> OrchestratorState:
-    """유저 프로필 로드, 언어 감지, 대화 이력 추가."""
+    """유저 프로필 로드, 언어 감지, 대화 이력 추가. get_tracer()가 있으면 set_query(state.user_text) (opt-in 마스킹 기록)."""
     ...
 
 
-@with_node_metrics("llm_router")
-def node_llm_router(
+@with_node_metrics_async("llm_router")
+async def node_llm_router(
     state: OrchestratorState,
     llm_router: LLMRouter,
 ) -> OrchestratorState:
-    """LLMRouter.route()로 4-case 조건부 라우팅 수행."""
+    """LLMRouter.aroute()로 4-case 조건부 라우팅 수행 (이벤트 루프 비차단).
+    라우팅 후 get_tracer()가 있으면 set_query(agent=state.current_agent)."""
+    ...
+
+
+# ---- 추측 실행 (speculative execution) ----
+
+# 추측 실행 허용 에이전트 (외부 부작용 없는 읽기 전용 에이전트만).
+# as(접수 DB 저장), cs(문의 처리)는 취소·폐기로 되돌릴 수 없는 쓰기가 있어 제외.
+SPECULATABLE_AGENTS = frozenset({"skincare", "reco"})
+
+
+def predict_speculative_agent(state: OrchestratorState) -> Optional[AgentType]:
+    """라우팅 결과를 기다리지 않고 먼저 실행할 에이전트 예측.
+
+    첫 턴, pending_handoff, 직전 next_step이 handoff/escalate/end면 추측하지 않음(None).
+    current_agent가 SPECULATABLE_AGENTS에 없으면 None.
+    그 외 연속 턴은 current_agent를 반환 (운영상 동일 에이전트 연속 턴 60%).
+    """
+    if state.conversation_turns == 0 or state.pending_handoff is not None:
+        return None
+    if state.current_agent not in SPECULATABLE_AGENTS:
+        return None
+    prev = state.next_step_decision
+    if prev is not None and prev.next_action in ("handoff", "escalate", "end"):
+        return None
+    return state.current_agent
+
+
+@with_node_metrics_async("llm_router")
+async def node_llm_router_speculative(
+    state: OrchestratorState,
+    llm_router: LLMRouter,
+    agent_adapters: Dict[str, Any],
+) -> OrchestratorState:
+    """라우팅과 예측 에이전트 실행을 동시에 시작.
+
+    1) predict_speculative_agent()로 후보 선택, 없으면 일반 라우팅과 동일
+    2) aroute()와 adapter.process()(to_thread)를 동시 실행. 에이전트는 state.model_copy(deep=True) 사본을 받는다
+    3) 라우터가 같은 에이전트를 선택하면 에이전트 결과를 커밋(speculation_committed=True)
+       → 디스패처/에이전트 노드를 건너뛰고 response_formatter로 직행
+    4) 불일치 시 에이전트 태스크 취소 후 결과 폐기. 이미 소비된 토큰은 낭비분으로 기록
+    적중/미스/낭비 토큰은 MetricsStore.record_speculation()에 누적. 확정 에이전트는 tracer.set_query(agent=...).
+
+    주의: 에이전트 체크포인트는 커밋 시점에만 반영되어야 하므로 추측 실행은 일회용 thread_id
+    ('{session_id}:spec:{trace_id}')로 돌린다. 커밋 시 그 체크포인트를 본 thread_id로 복사(replay)하고,
+    불일치 시 일회용 체크포인트는 버린다. 외부 쓰기가 있는 에이전트는 SPECULATABLE_AGENTS로 애초에 제외.
+    """
     ...
 
 
@@ -115,6 +162,45 @@ async def node_response_formatter(
 
 # ---- 슈퍼바이저 노드 ----
 
+# 슈퍼바이저 에이전트별 실행 시간 예산 (초). 초과 시 취소 후 폴백 섹션으로 대체.
+SUPERVISOR_AGENT_DEADLINES_S: Dict[str, float] = {
+    "skincare": 12.0,
+    "reco": 15.0,     # LLM 플랜 + 리랭크로 가장 느림
+    "as": 8.0,
+    "cs": 10.0,
+}
+DEFAULT_AGENT_DEADLINE_S = 12.0
+
+# 기한 초과 + 캐시 폴백도 없을 때 해당 섹션 대체 문구
+AGENT_DEADLINE_NOTES: Dict[str, str] = {
+    "ko": "이 부분은 아직 확인 중이에요. 잠시 후 다시 물어봐 주시면 이어서 안내해 드릴게요.",
+    "en": "I'm still working on this part. Ask me again in a moment and I'll follow up.",
+}
+
+
+async def run_agent_with_deadline(
+    agent_name: str,
+    adapter,
+    state: OrchestratorState,
+    deadline_s: float,
+) -> tuple:
+    """asyncio.wait_for로 에이전트 1개 실행. (응답 텍스트, 기한 초과 여부) 반환.
+
+    adapter.process()는 동기라 asyncio.to_thread로 돌고, wait_for 취소는 스레드를 멈추지 못한다.
+    그래서 실행 전 CancelToken(deadline_s)을 set_cancel_token으로 바인딩하고(to_thread가 컨텍스트 복사),
+    기한 초과 시 token.cancel() → 스레드는 다음 체크포인트(LLMCallBuilder 호출 직전, 그래프 노드 경계)에서
+    AgentCancelled로 종료된다. 진행 중이던 LLM 호출 1건의 토큰은 소비될 수 있다.
+    이후 deadline_fallback()으로 대체 텍스트 생성, MetricsStore.record_deadline_hit() 기록.
+    """
+    ...
+
+
+def deadline_fallback(agent_name: str, adapter, state: OrchestratorState) -> str:
+    """기한 초과 에이전트 섹션 대체: 에이전트 응답 캐시(make_agent_cache_key) 히트면 캐시 값,
+    아니면 AGENT_DEADLINE_NOTES[state.language]."""
+    ...
+
+
 @with_node_metrics("supervisor_plan")
 def node_supervisor_plan(
     state: OrchestratorState,
@@ -130,7 +216,39 @@ async def node_supervisor_execute_agents(
     agent_adapters: Dict[str, Any],
     llm_client,
 ) -> OrchestratorState:
-    """선택된 에이전트들을 asyncio.gather로 병렬 실행."""
+    """선택된 에이전트들을 asyncio.gather로 병렬 실행. 에이전트별 run_agent_with_deadline()로 상한 보장."""
+    ...
+
+
+@with_node_metrics_async("supervisor_execute")
+async def node_supervisor_execute_agents_streaming(
+    state: OrchestratorState,
+    agent_adapters: Dict[str, Any],
+    llm_client,
+) -> OrchestratorState:
+    """스트리밍 슈퍼바이저 실행: asyncio.as_completed로 끝난 에이전트부터 처리.
+
+    plan.merge_strategy가 side_by_side / sequential이면 완료 즉시 해당 섹션을
+    StreamChannel.emit_section()으로 전송 → TTFT = 가장 빠른 에이전트 완료 시점.
+    sequential은 관련도 순서를 지키기 위해 앞 순번이 끝날 때까지 뒤 섹션을 버퍼링.
+    integrated는 섹션을 보내지 않고 merge 단계 토큰 스트리밍에 맡긴다.
+    에이전트별 기한은 node_supervisor_execute_agents와 동일하게 적용 (폴백 섹션도 즉시 전송).
+    채널 미바인딩 시 node_supervisor_execute_agents와 동일 동작.
+    """
+    ...
+
+
+@with_node_metrics_async("supervisor_merge")
+async def node_supervisor_merge_streaming(
+    state: OrchestratorState,
+    llm_client,
+) -> OrchestratorState:
+    """스트리밍 병합.
+
+    - side_by_side / sequential: 섹션은 이미 전송됨(streamed_agents) → 재시도로 추가된 섹션만
+      전송하고 LLM 병합 호출 생략, response_text는 섹션 결합으로 구성
+    - integrated: llm_client.astream()으로 병합 토큰을 생성 즉시 emit_token()
+    """
     ...
 
 
@@ -139,7 +257,11 @@ def node_supervisor_validate(
     state: OrchestratorState,
     llm_client,
 ) -> OrchestratorState:
-    """모든 질문 측면이 커버됐는지 LLM 검증."""
+    """모든 질문 측면이 커버됐는지 LLM 검증. 스트리밍 모드에서는 merge_strategy를 plan 값으로 고정.
+
+    timed_out_agents는 이미 기한 초과로 잘린 에이전트 → retry_agents에서 제외하고
+    해당 측면 누락만으로는 is_sufficient=False를 만들지 않음 (재시도 루프 방지).
+    """
     ...
 
 
@@ -155,7 +277,7 @@ def node_supervisor_merge(
 # ---- 조건부 엣지 함수 ----
 
 def route_after_llm_router(state: OrchestratorState) -> str:
-    """라우터 결과에 따라 다음 노드 결정 (직접응답/멀티에이전트/에스컬레이션/단일에이전트)."""
+    """라우터 결과에 따라 다음 노드 결정 (추측 실행 커밋/직접응답/멀티에이전트/에스컬레이션/단일에이전트)."""
     ...
 
 
@@ -187,13 +309,22 @@ def build_orchestrator_graph(
     memory_service=None,
     suggestion_engine=None,
     checkpointer=None,
+    speculative_execution: bool = False,
+    streaming_supervisor: bool = False,
+    agent_deadlines_s: Optional[Dict[str, float]] = None,
 ) -> StateGraph:
-    """오케스트레이터 LangGraph 빌드 및 컴파일."""
+    """오케스트레이터 LangGraph 빌드 및 컴파일.
+
+    speculative_execution=True면 llm_router 노드를 node_llm_router_speculative로 교체
+    (연속 턴에서 라우팅 지연을 크리티컬 패스에서 제거).
+    streaming_supervisor=True면 supervisor_execute / supervisor_merge를 스트리밍 버전으로 교체.
+    agent_deadlines_s: SUPERVISOR_AGENT_DEADLINES_S 오버라이드 (에이전트별 초 단위).
+    """
     graph = StateGraph(OrchestratorState)
 
     # -- 노드 등록 --
     # graph.add_node("ingest", ingest_wrapper)
-    # graph.add_node("llm_router", router_wrapper)
+    # graph.add_node("llm_router", speculative_router_wrapper if speculative_execution else router_wrapper)
     # graph.add_node("agent_dispatcher", dispatcher_wrapper)
     # graph.add_node("skincare_agent", skincare_wrapper)
     # graph.add_node("reco_agent", reco_wrapper)
@@ -202,9 +333,9 @@ def build_orchestrator_graph(
     # graph.add_node("unknown_handler", unknown_wrapper)
     # graph.add_node("response_formatter", formatter_wrapper)
     # graph.add_node("supervisor_plan", plan_wrapper)
-    # graph.add_node("supervisor_execute", execute_wrapper)
+    # graph.add_node("supervisor_execute", streaming_execute_wrapper if streaming_supervisor else execute_wrapper)
     # graph.add_node("supervisor_validate", validate_wrapper)
-    # graph.add_node("supervisor_merge", merge_wrapper)
+    # graph.add_node("supervisor_merge", streaming_merge_wrapper if streaming_supervisor else merge_wrapper)
 
     # -- 진입점 --
     graph.set_entry_point("ingest")
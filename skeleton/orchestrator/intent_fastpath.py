@@ -0,0 +1,131 @@
+"""로컬 임베딩 기반 인텐트 퀵패스 (LLMRouter 앞단).
+
+라벨링된 예시 발화(exemplar) 임베딩 행렬에 대해 NumPy 벡터화 최근접 이웃 검색.
+신뢰도가 임계치 이상이면 IntentDecision/AgentDecision을 LLM 호출 없이 즉시 반환하고,
+미만이면 None을 반환해 기존 LLM 경로로 넘긴다.
+"""
+
+from __future__ import annotations
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+import logging
+
+import numpy as np
+
+from .schemas import IntentDecision, AgentDecision, AgentType
+
+logger = logging.getLogger(__name__)
+
+# 인텐트명 -> 에이전트명 매핑 (llm_router.AGENT_TO_INTENT의 역방향)
+INTENT_TO_AGENT: Dict[str, AgentType] = {
+    "recommend": "reco",
+    "skincare": "skincare",
+    "as": "as",
+    "cs": "cs",
+    "unknown": "unknown",
+}
+
+
+@dataclass
+class IntentFastPathConfig:
+    """퀵패스 설정."""
+    enabled: bool = True
+    confidence_threshold: float = 0.82   # top-1 코사인 유사도 하한
+    margin_threshold: float = 0.05       # top-1 인텐트와 차순위 인텐트 점수 차 하한
+    top_k: int = 5                       # kNN 투표에 쓰는 이웃 수
+    use_centroids: bool = False          # True면 인텐트별 centroid만 비교 (메모리/지연 최소)
+
+
+@dataclass
+class RoutingScenario:
+    """라우팅 정확도 평가용 시나리오 (50-시나리오 세트의 한 항목)."""
+    user_text: str
+    expected_intent: str
+    expected_agent: AgentType
+    tags: List[str] = field(default_factory=list)
+
+
+class LocalIntentClassifier:
+    """임베딩 kNN 인텐트 분류기.
+
+    exemplar 임베딩은 L2 정규화된 (N, D) float32 행렬로 보관 → 내적 1회로 전체 코사인 유사도 계산.
+    embed_fn은 OpenAI 임베딩 또는 로컬 sentence 임베딩 등 (str 리스트 -> (n, D) 배열) 주입.
+    """
+
+    def __init__(
+        self,
+        embed_fn: Callable[[List[str]], np.ndarray],
+        exemplars: Optional[Dict[str, List[str]]] = None,
+        config: Optional[IntentFastPathConfig] = None,
+    ):
+        self._embed_fn = embed_fn
+        self.config = config or IntentFastPathConfig()
+        self._matrix: np.ndarray = np.zeros((0, 0), dtype=np.float32)
+        self._labels: np.ndarray = np.array([], dtype=object)
+        self._intents: List[str] = []
+        self._hits = 0
+        self._fallthroughs = 0
+        if exemplars:
+            self.fit(exemplars)
+
+    def fit(self, exemplars: Dict[str, List[str]]) -> None:
+        """인텐트별 예시 발화 임베딩 후 정규화 행렬 구축 (use_centroids면 인텐트별 평균 벡터)."""
+        ...
+
+    @staticmethod
+    def _l2_normalize(vectors: np.ndarray) -> np.ndarray:
+        """행 단위 L2 정규화 (0 벡터 보호)."""
+        norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+        return vectors / np.maximum(norms, 1e-12)
+
+    def _score(self, query_vec: np.ndarray) -> Tuple[str, float, float]:
+        """(top 인텐트, 신뢰도, 차순위와의 마진) 계산. 유사도 가중 kNN 투표.
+
+        투표는 top-k 이웃에 실제로 등장한 인텐트만 대상 (음수 유사도만 나오는 도메인 밖 입력 대비).
+        fit() 전이나 빈 행렬이면 신뢰도 0 → classify()는 LLM으로 폴백.
+        """
+        k = min(self.config.top_k, self._matrix.shape[0])
+        if k <= 0:
+            return "unknown", 0.0, 0.0
+        sims = self._matrix @ query_vec
+        top = np.argpartition(-sims, k - 1)[:k]
+        votes: Dict[str, float] = {}
+        for idx in top:
+            label = self._labels[idx]
+            votes[label] = votes.get(label, 0.0) + float(sims[idx])
+        ranked = sorted(votes.items(), key=lambda kv: kv[1], reverse=True)
+        best_intent = ranked[0][0]
+        best_sim = float(sims[top][self._labels[top] == best_intent].max())
+        margin = (ranked[0][1] - ranked[1][1]) / k if len(ranked) > 1 else best_sim
+        return best_intent, best_sim, margin
+
+    def predict(self, user_text: str) -> Tuple[str, float, float]:
+        """단일 발화 분류 (임계치 미적용). 평가/디버깅용."""
+        ...
+
+    def classify(self, user_text: str) -> Optional[Tuple[IntentDecision, AgentDecision]]:
+        """임계치 통과 시 (IntentDecision, AgentDecision) 반환, 아니면 None (LLM 경로로 폴백).
+
+        멀티 인텐트로 보이는 발화(상위 2개 인텐트가 모두 임계치 근처)는 항상 None →
+        Supervisor 판단은 LLM에 맡긴다.
+        """
+        ...
+
+    def stats(self) -> Dict[str, float]:
+        """퀵패스 적중/폴백 횟수와 적중률."""
+        ...
+
+
+def evaluate_routing_accuracy(
+    classifier: LocalIntentClassifier,
+    scenarios: Sequence[RoutingScenario],
+    thresholds: Sequence[float] = (0.70, 0.75, 0.80, 0.82, 0.85, 0.90),
+) -> List[Dict[str, float]]:
+    """임계치별 지연-정확도 트레이드오프 리포트.
+
+    각 임계치에 대해 반환:
+      - coverage: 퀵패스로 처리된 시나리오 비율 (LLM 0호출 비율)
+      - fastpath_accuracy: 퀵패스 처리분의 인텐트/에이전트 정답률
+      - end_to_end_accuracy: 나머지는 LLM 라우팅이 정답이라 가정한 전체 정확도 (현행 50/50 기준)
+    """
+    ...
@@ -2,7 +2,12 @@
 
 from __future__ import annotations
 from typing import Any, Dict, List, Optional
+import asyncio
+import contextvars
 import logging
+import os
+import threading
+import weakref
 from concurrent.futures import ThreadPoolExecutor
 
 from .schemas import (
@@ -14,7 +19,11 @@ from .schemas import (
     NextStepDecision,
     PendingHandoff,
     AgentType,
+    FusedRoutingDecision,
+    RoutingMode,
 )
+from .intent_fastpath import LocalIntentClassifier
+from common.rate_limiter import CallPriority
 
 logger = logging.getLogger(__name__)
 
@@ -28,12 +37,58 @@ AGENT_TO_INTENT = {
     "unknown": "unknown",
 }
 
+# 프로세스 전역 라우터 동시성 상한 (동기 풀 워커 수 / 비동기 세마포어 공통)
+ROUTER_MAX_CONCURRENCY = int(os.getenv("ROUTER_MAX_CONCURRENCY", "32"))
+
+# 라우터 판단 캐시 soft TTL 경과 후 스테일 서빙 허용 시간 (초). 이 구간에서는 백그라운드 재판단
+ROUTER_STALE_TTL = int(os.getenv("ROUTER_STALE_TTL", "600"))
+
+_shared_executor: Optional[ThreadPoolExecutor] = None
+_shared_executor_lock = threading.Lock()
+_router_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_router_executor() -> ThreadPoolExecutor:
+    """동기 병렬 헬퍼용 공유 ThreadPoolExecutor (프로세스당 1개, 크기 제한)."""
+    global _shared_executor
+    if _shared_executor is None:
+        with _shared_executor_lock:
+            if _shared_executor is None:
+                _shared_executor = ThreadPoolExecutor(
+                    max_workers=ROUTER_MAX_CONCURRENCY, thread_name_prefix="router"
+                )
+    return _shared_executor
+
+
+def get_router_semaphore() -> asyncio.Semaphore:
+    """비동기 라우팅 LLM 호출 동시성 제한 세마포어 (실행 중인 이벤트 루프당 1개, 루프 종료 시 자동 해제)."""
+    loop = asyncio.get_running_loop()
+    semaphore = _router_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = _router_semaphores[loop] = asyncio.Semaphore(ROUTER_MAX_CONCURRENCY)
+    return semaphore
+
 
 class LLMRouter:
     """LLM 기반 인텐트 분류 및 에이전트 선택 라우터."""
 
-    def __init__(self, llm_client, temperature: float = 0.1, cache_manager=None):
-        """llm_client: .chat() 메서드를 가진 OpenAI 호환 클라이언트."""
+    def __init__(
+        self,
+        llm_client,
+        temperature: float = 0.1,
+        cache_manager=None,
+        intent_classifier: Optional[LocalIntentClassifier] = None,
+        routing_modes: Optional[Dict[str, RoutingMode]] = None,
+        semantic_cache=None,
+    ):
+        """llm_client: .chat() (비동기 경로는 .achat()) 메서드를 가진 OpenAI 호환 클라이언트.
+
+        intent_classifier: 로컬 임베딩 퀵패스 (선택). 설정 시 캐시 미스 후 LLM 호출 전에 먼저 시도.
+        routing_modes: 케이스별 호출 방식 {"case1".."case4": "split" | "fused"}. 미지정 케이스는 split.
+        semantic_cache: SemanticRouterCache (선택). 근사 중복 발화용, 정확 일치 캐시 미스 후 조회.
+        """
         ...
 
     def _load_agent_capabilities(self) -> Dict[AgentType, str]:
@@ -43,7 +98,7 @@ class LLMRouter:
     # ---- 핵심 판단 메서드 ----
 
     def classify_intent(self, state: OrchestratorState) -> IntentDecision:
-        """유저 인텐트 분류 (캐시 TTL 30분)."""
+        """유저 인텐트 분류 (캐시 TTL 30분). 정확 일치 캐시 → 시맨틱 캐시 → 로컬 퀵패스 → LLM 순."""
         ...
 
     def select_agent(self, state: OrchestratorState) -> AgentDecision:
@@ -62,25 +117,137 @@ class LLMRouter:
         """다음 액션 결정 (collect / process / handoff / finalize 등)."""
         ...
 
+    # ---- 캐시 ----
+
+    def _get_cached_decision(
+        self, step: str, state: OrchestratorState, model_cls
+    ) -> Optional[Any]:
+        """정확 일치(cache_manager) → 시맨틱(semantic_cache) 순 조회.
+
+        정확 일치는 get_swr() — 스테일이면 판단을 즉시 반환하고 get_revalidator().schedule()로
+        같은 step의 LLM 판단을 백그라운드 재실행 (키별 1회, 세션 간 중복 제거).
+
+        시맨틱 히트가 샘플 검증 대상이면 LLM 판단을 백그라운드로 재실행해
+        semantic_cache.report_verification()에 일치 여부 기록.
+        """
+        ...
+
+    def _set_cached_decision(
+        self, step: str, state: OrchestratorState, decision: Any, ttl: int
+    ) -> None:
+        """두 캐시 레이어에 판단 저장. 정확 일치 캐시는 set_swr(soft_ttl=ttl, hard_ttl=ttl + ROUTER_STALE_TTL)."""
+        ...
+
+    # ---- 통합 호출 (fused mode) ----
+
+    def _routing_mode(self, case: str) -> RoutingMode:
+        """케이스("case1".."case4")별 설정된 호출 방식 반환."""
+        return (self.routing_modes or {}).get(case, "split")
+
+    def fused_decide(self, state: OrchestratorState) -> FusedRoutingDecision:
+        """대화 컨텍스트를 1회만 전송, FusedRoutingDecision 스키마로 모든 판단을 한 번에 수신.
+
+        캐시 키 step="fused". 검증 실패 시 split 경로(_full_route_fallback)로 폴백.
+        """
+        ...
+
+    async def afused_decide(self, state: OrchestratorState) -> FusedRoutingDecision:
+        """fused_decide의 비동기 버전."""
+        ...
+
+    @staticmethod
+    def split_fused_decision(
+        fused: FusedRoutingDecision, state: OrchestratorState
+    ) -> tuple:
+        """통합 결과를 (IntentDecision, AgentDecision, HandoffDecision,
+        CompletenessDecision, NextStepDecision)로 분해. from_agent는 state.current_agent.
+        """
+        ...
+
+    # ---- 로컬 퀵패스 ----
+
+    def _try_intent_fastpath(
+        self, state: OrchestratorState
+    ) -> Optional[tuple]:
+        """로컬 분류기 신뢰도가 임계치 이상이면 (IntentDecision, AgentDecision), 아니면 None.
+
+        Case 1/4에서 병렬 LLM 호출 전에 시도 → 적중 시 두 판단 모두 LLM 0호출.
+        결과는 일반 경로와 동일하게 라우터 캐시에 저장.
+        """
+        ...
+
     # ---- 병렬 실행 헬퍼 ----
 
     def classify_intent_and_select_agent_parallel(
         self, state: OrchestratorState
     ) -> tuple:
-        """인텐트 분류 + 에이전트 선택 병렬 실행."""
-        with ThreadPoolExecutor(max_workers=2) as pool:
-            f_intent = pool.submit(self.classify_intent, state)
-            f_agent = pool.submit(self.select_agent, state)
-            return f_intent.result(), f_agent.result()
+        """인텐트 분류 + 에이전트 선택 병렬 실행 (공유 풀 사용, 턴마다 풀 생성 없음).
+
+        풀 스레드는 호출자 ContextVar(TurnBudget, 트레이서)를 물려받지 않으므로 copy_context().run으로 제출.
+        """
+        pool = get_router_executor()
+        f_intent = pool.submit(contextvars.copy_context().run, self.classify_intent, state)
+        f_agent = pool.submit(contextvars.copy_context().run, self.select_agent, state)
+        return f_intent.result(), f_agent.result()
 
     def check_completeness_and_next_step_parallel(
         self, state: OrchestratorState
     ) -> tuple:
-        """완성도 체크 + 다음 단계 결정 병렬 실행."""
-        with ThreadPoolExecutor(max_workers=2) as pool:
-            f_comp = pool.submit(self.check_completeness, state)
-            f_next = pool.submit(self.decide_next_step, state)
-            return f_comp.result(), f_next.result()
+        """완성도 체크 + 다음 단계 결정 병렬 실행 (공유 풀 사용, 컨텍스트 복사 제출)."""
+        pool = get_router_executor()
+        f_comp = pool.submit(contextvars.copy_context().run, self.check_completeness, state)
+        f_next = pool.submit(contextvars.copy_context().run, self.decide_next_step, state)
+        return f_comp.result(), f_next.result()
+
+    # ---- 비동기 판단 메서드 (AsyncOpenAI, 이벤트 루프 비차단) ----
+
+    async def _achat(self, **kwargs) -> Dict[str, Any]:
+        """get_router_semaphore()로 동시성 제한 후 llm_client.achat(priority=CallPriority.QUICK, hedge=True) 호출."""
+        kwargs.setdefault("priority", CallPriority.QUICK)
+        kwargs.setdefault("hedge", True)
+        async with get_router_semaphore():
+            return await self.llm_client.achat(**kwargs)
+
+    async def aclassify_intent(self, state: OrchestratorState) -> IntentDecision:
+        """classify_intent의 비동기 버전 (캐시/퀵패스 동일).
+
+        LLM 경로는 acall_json_incremental(decisive_fields=["intent", "confidence"]) 사용 →
+        reason 생성 완료 전에 판단 확정. LLMCallBuilder에 micro_batcher가 있으면 batchable=True로
+        acall_json (피크 시 다른 세션 분류 요청과 한 프롬프트로 묶임, 저트래픽은 자동 바이패스).
+        """
+        ...
+
+    async def aselect_agent(self, state: OrchestratorState) -> AgentDecision:
+        """select_agent의 비동기 버전. decisive_fields=["selected_agent", "confidence"]."""
+        ...
+
+    async def adecide_handoff(self, state: OrchestratorState) -> HandoffDecision:
+        """decide_handoff의 비동기 버전. decisive_fields=["should_handoff", "to_agent"]."""
+        ...
+
+    async def acheck_completeness(self, state: OrchestratorState) -> CompletenessDecision:
+        """check_completeness의 비동기 버전."""
+        ...
+
+    async def adecide_next_step(self, state: OrchestratorState) -> NextStepDecision:
+        """decide_next_step의 비동기 버전."""
+        ...
+
+    async def aclassify_intent_and_select_agent_parallel(
+        self, state: OrchestratorState
+    ) -> tuple:
+        """인텐트 분류 + 에이전트 선택 asyncio.gather 병렬 실행."""
+        return await asyncio.gather(
+            self.aclassify_intent(state), self.aselect_agent(state)
+        )
+
+    async def acheck_completeness_and_next_step_parallel(
+        self, state: OrchestratorState
+    ) -> tuple:
+        """완성도 체크 + 다음 단계 결정 asyncio.gather 병렬 실행."""
+        return await asyncio.gather(
+            self.acheck_completeness(state), self.adecide_next_step(state)
+        )
 
     # ---- 메인 진입점 ----
 
@@ -88,13 +255,19 @@ class LLMRouter:
         """
         4-case 조건부 라우팅. 턴 상황에 따라 필요한 LLM 호출만 수행.
 
-        Case 1 (첫 턴): 인텐트+에이전트 병렬 2호출, 나머지 스킵
+        Case 1 (첫 턴): 인텐트+에이전트 병렬 2호출, 나머지 스킵 (로컬 퀵패스 적중 시 0호출)
         Case 2 (핸드오프 요청): 인텐트->에이전트->핸드오프 순차 3호출, 루프가드 포함
         Case 3 (동일 에이전트 계속): 대기 중이면 LLM 0호출, 아니면 완성도+다음단계 병렬
-        Case 4 (풀 라우팅): 4호출 병렬화
+        Case 4 (풀 라우팅): 4호출 병렬화 (퀵패스 적중 시 인텐트/에이전트 2호출 생략)
+
+        routing_modes에서 해당 케이스가 "fused"면 병렬 호출 대신 fused_decide() 1호출.
         """
         ...
 
+    async def aroute(self, state: OrchestratorState) -> OrchestratorState:
+        """route()의 비동기 버전. 4-case 분기 로직 동일, 병렬 쌍은 asyncio.gather로 실행."""
+        ...
+
     # ---- 에러 복구 ----
 
     def _full_route_fallback(self, state: OrchestratorState) -> OrchestratorState:
@@ -104,3 +277,7 @@ class LLMRouter:
     def _escalate_to_cs_due_to_loop(self, state: OrchestratorState) -> OrchestratorState:
         """핸드오프 루프 임계치 초과 시 CS 강제 전환."""
         ...
+
+    async def _afull_route_fallback(self, state: OrchestratorState) -> OrchestratorState:
+        """_full_route_fallback의 비동기 버전."""
+        ...
@@ -1,4 +1,8 @@
-"""오케스트레이터 스키마 정의. 라우팅 판단 결과를 Pydantic 모델로 표현."""
+"""오케스트레이터 스키마 정의. 라우팅 판단 결과를 Pydantic 모델로 표현.
+
+판단 스키마는 결정 필드를 앞에, 장문 reason을 맨 뒤에 둔다 — 스트리밍 JSON 파싱 시
+결정 필드가 reason 생성 전에 완성되어 호출부가 먼저 행동할 수 있도록 (필드 순서 = 생성 순서).
+"""
 
 from __future__ import annotations
 from typing import Literal, Optional, List, Dict, Any
@@ -13,19 +17,19 @@ class IntentDecision(BaseModel):
     """LLM이 분류한 사용자 의도"""
     intent: Literal["skincare", "recommend", "as", "cs", "unknown"] = "unknown"
     confidence: float = Field(ge=0.0, le=1.0, default=0.0)
-    reason: str = ""
     keywords: List[str] = Field(default_factory=list)
     context_factors: List[str] = Field(default_factory=list)
     is_multi_intent: bool = False
+    reason: str = ""
 
 
 class AgentDecision(BaseModel):
     """LLM이 선택한 담당 에이전트"""
     selected_agent: AgentType = "unknown"
     confidence: float = Field(ge=0.0, le=1.0, default=0.0)
-    reason: str = ""
     alternative_agents: List[AgentType] = Field(default_factory=list)
     requires_handoff: bool = False
+    reason: str = ""
 
 
 class HandoffDecision(BaseModel):
@@ -33,10 +37,10 @@ class HandoffDecision(BaseModel):
     should_handoff: bool = False
     from_agent: Optional[AgentType] = None
     to_agent: Optional[AgentType] = None
-    reason: str = ""
     confidence: float = Field(ge=0.0, le=1.0, default=0.0)
     transfer_data: Dict[str, Any] = Field(default_factory=dict)
     user_message: Optional[str] = None
+    reason: str = ""
 
 
 class PendingHandoff(BaseModel):
@@ -64,11 +68,11 @@ class CompletenessDecision(BaseModel):
     confidence: float = Field(ge=0.0, le=1.0, default=0.0)
     missing_info: List[str] = Field(default_factory=list)
     clarification_questions: List[ClarificationQuestion] = Field(default_factory=list)
-    reason: str = ""
     can_proceed_anyway: bool = False
     assumptions: Dict[str, Any] = Field(default_factory=dict)
     collection_progress: float = Field(default=0.0, ge=0.0, le=1.0)
     next_priority_slot: Optional[str] = None
+    reason: str = ""
 
 
 class ConversationFlow(BaseModel):
@@ -93,11 +97,43 @@ class NextStepDecision(BaseModel):
         "escalate", "end", "clarify", "confirm", "suggest_alternative",
     ] = "collect_info"
     confidence: float = Field(ge=0.0, le=1.0, default=0.0)
-    reason: str = ""
     suggested_response: Optional[str] = None
     conversation_flow: Optional[ConversationFlow] = None
     fallback_action: Optional[str] = None
     retry_strategy: Optional[str] = None
+    reason: str = ""
+
+
+# --- 단일 호출 통합 라우팅 (fused mode) ---
+
+RoutingMode = Literal["split", "fused"]
+
+
+class FusedRoutingDecision(BaseModel):
+    """Case 4 판단 5종을 한 번의 structured output으로 받는 통합 스키마.
+
+    결정 필드를 앞에, 장문 reason을 뒤에 배치. LLMRouter.split_fused_decision()이
+    기존 IntentDecision/AgentDecision/HandoffDecision/CompletenessDecision/NextStepDecision으로 분해.
+    """
+    intent: Literal["skincare", "recommend", "as", "cs", "unknown"] = "unknown"
+    selected_agent: AgentType = "unknown"
+    should_handoff: bool = False
+    to_agent: Optional[AgentType] = None
+    is_complete: bool = False
+    next_action: Literal[
+        "collect_info", "process", "handoff", "finalize",
+        "escalate", "end", "clarify", "confirm", "suggest_alternative",
+    ] = "collect_info"
+    is_multi_intent: bool = False
+    intent_confidence: float = Field(ge=0.0, le=1.0, default=0.0)
+    agent_confidence: float = Field(ge=0.0, le=1.0, default=0.0)
+    handoff_confidence: float = Field(ge=0.0, le=1.0, default=0.0)
+    completeness_confidence: float = Field(ge=0.0, le=1.0, default=0.0)
+    next_step_confidence: float = Field(ge=0.0, le=1.0, default=0.0)
+    keywords: List[str] = Field(default_factory=list)
+    missing_info: List[str] = Field(default_factory=list)
+    alternative_agents: List[AgentType] = Field(default_factory=list)
+    reason: str = ""
 
 
 # --- Multi-Agent Supervisor ---
@@ -108,6 +144,7 @@ class SupervisorPlan(BaseModel):
     parallel: bool = True
     reasoning: str = ""
     is_complex: bool = False
+    merge_strategy: Literal["integrated", "side_by_side", "sequential"] = "integrated"
 
 
 class SupervisorValidation(BaseModel):
@@ -160,6 +197,10 @@ class OrchestratorState(BaseModel):
     current_agent: AgentType = "intent"
     previous_agent: Optional[AgentType] = None
 
+    # 추측 실행 (라우팅과 동시에 시작한 에이전트; 라우터 판단과 일치할 때만 커밋)
+    speculative_agent: Optional[AgentType] = None
+    speculation_committed: bool = False
+
     # 에이전트별 상태 + 공유 컨텍스트
     agent_states: Dict[AgentType, Dict[str, Any]] = Field(default_factory=dict)
     shared_context: Dict[str, Any] = Field(default_factory=dict)
@@ -173,6 +214,11 @@ class OrchestratorState(BaseModel):
     is_complete: bool = False
     is_escalated: bool = False
 
+    # 턴 레이턴시 예산 (ChatService 설정, 노드 데코레이터가 잔여분 갱신)
+    latency_budget_ms: Optional[float] = None
+    latency_budget_remaining_ms: Optional[float] = None
+    skipped_nodes: List[str] = Field(default_factory=list)
+
     # 에러 처리
     error_message: Optional[str] = None
     retry_count: int = 0
@@ -183,6 +229,8 @@ class OrchestratorState(BaseModel):
     supervisor_validation: Optional[SupervisorValidation] = None
     agent_results: Dict[str, str] = Field(default_factory=dict)
     supervisor_retry_count: int = 0
+    streamed_agents: List[str] = Field(default_factory=list)  # SSE로 이미 전송된 섹션
+    timed_out_agents: List[str] = Field(default_factory=list)  # 기한 초과로 폴백 처리된 에이전트
 
     # 타임스탬프
     created_at: datetime = Field(default_factory=datetime.now)
@@ -211,13 +259,13 @@ class HandoffResponseAnalysis(BaseModel):
     """핸드오프 제안에 대한 사용자 응답 분석"""
     user_choice: Literal["accept", "reject", "both", "unclear"] = "unclear"
     confidence: float = Field(ge=0.0, le=1.0, default=0.5)
-    reason: str = ""
     suggested_action: Literal["proceed_handoff", "stay_current", "ask_again"] = "stay_current"
+    reason: str = ""
 
 
 class DomainMatchDecision(BaseModel):
     """현재 입력이 활성 에이전트 도메인에 맞는지"""
     domain_match: bool = True
     confidence: float = Field(ge=0.0, le=1.0, default=0.5)
-    reason: str = ""
     should_full_route: bool = False
+    reason: str = ""
@@ -0,0 +1,77 @@
+"""에이전트 리소스 백그라운드 워밍업 + readiness 보고.
+
+프로세스는 라우팅이 가능해지는 즉시(라우터 + 세션 저장소) ready를 보고하고,
+FAISS/Chroma/Parquet 로드와 캐시 프라이밍은 백그라운드 스레드에서 진행한다.
+워밍업 전에 들어온 요청은 해당 어댑터의 LazyResource가 그 자리에서 초기화한다.
+"""
+
+from __future__ import annotations
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ComponentStatus:
+    """컴포넌트별 워밍업 상태."""
+    name: str
+    state: str = "pending"        # pending | warming | ready | failed
+    duration_ms: Optional[float] = None
+    error: Optional[str] = None
+
+
+@dataclass
+class WarmupReport:
+    """readiness 엔드포인트 응답."""
+    routing_ready: bool = False
+    fully_warm: bool = False
+    started_at: Optional[float] = None
+    components: List[ComponentStatus] = field(default_factory=list)
+
+
+class WarmupManager:
+    """어댑터 warmup()을 순서대로 호출하는 백그라운드 워커.
+
+    순서: 요청 빈도 높은 순(cs → reco → skincare → as). 실패한 컴포넌트는 failed로 표시하고
+    다음으로 진행 — 해당 어댑터는 첫 요청 시 지연 초기화로 재시도.
+    """
+
+    def __init__(self, llm_router, agent_adapters: Dict[str, Any], prime_queries: Optional[List[str]] = None):
+        """prime_queries: 워밍업 후 라우터/에이전트 캐시 프라이밍용 대표 질의 (선택)."""
+        ...
+
+    def start(self, background: bool = True) -> None:
+        """워밍업 시작. background=False면 완료까지 블로킹 (배치/벤치마크용)."""
+        ...
+
+    def _warm_component(self, name: str, adapter) -> ComponentStatus:
+        """adapter.warmup() 실행 및 소요 시간 기록."""
+        ...
+
+    def report(self) -> WarmupReport:
+        """현재 readiness 스냅샷."""
+        ...
+
+
+_warmup_manager: Optional[WarmupManager] = None
+_warmup_lock = threading.Lock()
+
+
+def warmup(llm_router, agent_adapters: Dict[str, Any], background: bool = True,
+           prime_queries: Optional[List[str]] = None) -> WarmupManager:
+    """프로세스 전역 WarmupManager 생성 후 시작 (중복 호출 시 기존 인스턴스 반환)."""
+    global _warmup_manager
+    with _warmup_lock:
+        if _warmup_manager is None:
+            _warmup_manager = WarmupManager(llm_router, agent_adapters, prime_queries)
+            _warmup_manager.start(background=background)
+    return _warmup_manager
+
+
+def get_warmup_report() -> WarmupReport:
+    """readiness 조회 (warmup() 미호출 시 routing_ready=False)."""
+    ...
@@ -0,0 +1,207 @@
+"""쿼리 로그 기반 캐시 프리웜 작업.
+
+배포나 Redis flush 직후에는 인기 질문마다 콜드 경로(CS TTFT 20.8초, Supervisor 42.7초)를 다시 치른다.
+트래픽 전환 전에 운영 기록에서 상위 N개 정규화 질문을 뽑아 실제 경로로 재생해
+라우터 / 에이전트 / RAGCache / 쿼리 확장 lru_cache를 미리 채운다.
+
+입력 (JSONL, 혼합 가능):
+  - MetricsStore.export_traces() 출력: {"trace_summary": {"user_text", "agent", ...}, ...}
+    (user_text는 TRACE_RECORD_QUERY_TEXT=1로 수집한 마스킹 질의 — 미설정이면 비어 있어 건너뜀)
+  - TraceSummary.to_dict() 한 줄: {"user_text", "agent", ...}
+  - 쿼리 로그: {"query": "..."} 또는 평문 한 줄
+
+실행:
+  python -m services.cache_prewarm --log traces.jsonl --top-n 200 --dry-run
+  python -m services.cache_prewarm --log traces.jsonl --top-n 200 --concurrency 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence
+
+from cache.cache_manager import normalize_query
+from common.rate_limiter import CallPriority, reset_priority_floor, set_priority_floor
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PrewarmConfig:
+    """프리웜 설정."""
+    top_n: int = 200
+    min_count: int = 2                 # 이 횟수 미만 질문은 제외 (일회성 질의)
+    concurrency: int = 8               # 동시 재생 수 (모든 LLM 호출은 CallPriority.BACKGROUND)
+    agents: Optional[List[str]] = None # 지정 시 해당 에이전트로 라우팅된 질문만
+    max_cost_usd: Optional[float] = None   # 추정 비용 초과 시 실행 거부
+    skip_cached: bool = True           # 라우터 캐시에 이미 있으면 건너뜀
+
+
+@dataclass
+class QueryCandidate:
+    """프리웜 대상 질문 (정규화 키 단위)."""
+    normalized: str
+    text: str                          # 대표 원문 (가장 자주 나온 표기)
+    count: int
+    agent: Optional[str] = None        # 가장 자주 라우팅된 에이전트
+
+
+@dataclass
+class CostEstimate:
+    """dry-run 비용 추정."""
+    queries: int = 0
+    llm_calls: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cost_usd: float = 0.0
+    by_agent: Dict[str, float] = field(default_factory=dict)
+
+
+@dataclass
+class PrewarmProgress:
+    """진행 상황."""
+    total: int
+    done: int = 0
+    failed: int = 0
+    skipped_cached: int = 0
+    started_at: float = field(default_factory=time.monotonic)
+    errors: List[str] = field(default_factory=list)
+
+    def report(self) -> str:
+        """한 줄 진행 리포트 (완료/실패/스킵, 처리율, ETA)."""
+        finished = self.done + self.failed + self.skipped_cached
+        elapsed = time.monotonic() - self.started_at
+        rate = finished / elapsed if elapsed > 0 else 0.0
+        eta = (self.total - finished) / rate if rate > 0 else float("inf")
+        return (
+            f"[prewarm] {finished}/{self.total} done={self.done} failed={self.failed} "
+            f"skipped={self.skipped_cached} rate={rate:.2f}/s eta={eta:.0f}s"
+        )
+
+
+def load_query_log(paths: Sequence[str]) -> Iterator[Dict[str, Any]]:
+    """입력 파일들에서 {"text", "agent"} 레코드 순회. 파싱 불가 줄은 평문 질의로 취급."""
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    yield {"text": line, "agent": None}
+                    continue
+                if not isinstance(record, dict):
+                    continue
+                summary = record.get("trace_summary") or record
+                text = summary.get("user_text") or record.get("query")
+                if text:
+                    yield {"text": text, "agent": summary.get("agent")}
+
+
+def select_top_queries(
+    records: Iterable[Dict[str, Any]],
+    top_n: int,
+    min_count: int = 2,
+    agents: Optional[List[str]] = None,
+) -> List[QueryCandidate]:
+    """normalize_query() 키별 빈도 집계 후 상위 top_n. 대표 원문과 에이전트는 최빈값.
+
+    캐시 키 빌더도 같은 정규화 후 해시하므로 대표 원문 1건 재생이 같은 키의 모든 표기를 채운다.
+    """
+    counts: Counter = Counter()
+    texts: Dict[str, Counter] = {}
+    routed: Dict[str, Counter] = {}
+    for record in records:
+        key = normalize_query(record["text"])
+        if not key:
+            continue
+        counts[key] += 1
+        texts.setdefault(key, Counter())[record["text"]] += 1
+        if record.get("agent"):
+            routed.setdefault(key, Counter())[record["agent"]] += 1
+    candidates = []
+    for key, count in counts.most_common():
+        if count < min_count:
+            break
+        agent = routed[key].most_common(1)[0][0] if key in routed else None
+        if agents and agent not in agents:
+            continue
+        candidates.append(QueryCandidate(key, texts[key].most_common(1)[0][0], count, agent))
+        if len(candidates) >= top_n:
+            break
+    return candidates
+
+
+class CachePrewarmer:
+    """후보 질문을 LLMRouter → 에이전트 어댑터(→ RAG 체인) 경로로 재생해 캐시를 채운다.
+
+    세션 상태는 질문마다 새 OrchestratorState (크로스 유저 캐시 키에 session_id가 없으므로 그대로 공유됨).
+    """
+
+    def __init__(
+        self,
+        router,
+        adapters: Dict[str, Any],
+        config: Optional[PrewarmConfig] = None,
+        progress_cb: Optional[Callable[[PrewarmProgress], None]] = None,
+    ):
+        """router: LLMRouter, adapters: {에이전트명: BaseAgentAdapter}.
+
+        progress_cb: 항목 완료마다 호출 (기본은 10건마다 report() 로그).
+        """
+        self.router = router
+        self.adapters = adapters
+        self.config = config or PrewarmConfig()
+        self.progress_cb = progress_cb
+
+    def estimate_cost(self, candidates: Sequence[QueryCandidate]) -> CostEstimate:
+        """dry-run 비용 추정. 에이전트별 평균 호출 수/입출력 토큰(MetricsStore 요약 또는 기본 프로필)에
+        라우터 호출 토큰(estimate_tokens)을 더해 calculate_cost로 환산. 캐시 히트 예정 항목은 제외."""
+        ...
+
+    async def run(self, candidates: Sequence[QueryCandidate]) -> PrewarmProgress:
+        """asyncio.Semaphore(concurrency)로 동시 재생. max_cost_usd 초과 추정 시 실행 전 ValueError."""
+        ...
+
+    async def _warm_one(self, candidate: QueryCandidate, progress: PrewarmProgress) -> None:
+        """단건 재생: router.aroute → (skip_cached면 라우터 캐시 히트 시 스킵) → adapter.process를
+        asyncio.to_thread로 실행. RAG 경로는 어댑터 내부에서 get_rag_cache()/쿼리 확장 캐시를 채운다.
+        예외는 progress.errors에 기록하고 계속 진행.
+
+        재생 동안 우선순위 하한을 CallPriority.BACKGROUND로 바인딩 → 라우터의 QUICK 호출까지
+        라이브 트래픽 뒤로 밀린다 (to_thread가 컨텍스트를 복사하므로 어댑터 스레드에도 적용).
+        """
+        token = set_priority_floor(CallPriority.BACKGROUND)
+        try:
+            await self._replay(candidate, progress)
+        finally:
+            reset_priority_floor(token)
+
+    async def _replay(self, candidate: QueryCandidate, progress: PrewarmProgress) -> None:
+        """_warm_one의 실제 재생 경로 (우선순위 하한 바인딩 안에서 실행)."""
+        ...
+
+
+def main(argv: Sequence[str] | None = None) -> PrewarmProgress | CostEstimate:
+    """CLI 진입점. --dry-run이면 후보 목록과 CostEstimate만 출력."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--log", action="append", required=True, help="JSONL 쿼리 로그 (여러 번 지정 가능)")
+    parser.add_argument("--top-n", type=int, default=200)
+    parser.add_argument("--min-count", type=int, default=2)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--agents", default=None, help="쉼표 구분 에이전트 필터")
+    parser.add_argument("--max-cost-usd", type=float, default=None)
+    parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args(argv)
+    ...
+
+
+if __name__ == "__main__":
+    main()
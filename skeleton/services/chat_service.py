@@ -18,14 +18,20 @@ THINKING_MESSAGES: Dict[str, list] = {
     "cs_agent":         ["Looking up your inquiry..."],
     "as_agent":         ["Checking service information..."],
     "response_formatter": ["Preparing your answer..."],
+    "supervisor_execute": ["Consulting multiple specialists..."],
 }
 
 
 class ChatService:
     """FastAPI 엔드포인트와 오케스트레이터 그래프를 연결하는 SSE 스트리밍 서비스."""
 
-    def __init__(self, session_store, orchestrator_graph):
-        """session_store: 세션 관리, orchestrator_graph: 컴파일된 LangGraph."""
+    def __init__(self, session_store, orchestrator_graph, turn_latency_budget_ms: Optional[float] = None):
+        """session_store: 세션 관리, orchestrator_graph: 컴파일된 LangGraph.
+
+        turn_latency_budget_ms: 턴 레이턴시 예산 (opt-in). None이면 예산 제약 없음 — 모델 다운그레이드와
+        노드 스킵이 일어나지 않는다. 콜드 Supervisor 턴(~43초)보다 낮게 잡으면 콜드 턴마다 품질이 낮아지므로
+        웜 경로 기준으로 설정.
+        """
         ...
 
     async def process_message_stream(
@@ -36,9 +42,12 @@ class ChatService:
         """
         유저 메시지를 처리하고 SSE 이벤트를 yield.
 
-        흐름: PipelineTracer 생성 -> 상태 구성 -> 그래프 실행
+        흐름: PipelineTracer 생성 -> StreamChannel / TurnBudget 바인딩 -> 상태 구성 -> 그래프 실행
         -> thinking 이벤트 -> 첫 토큰(TTFT) -> token 이벤트
         -> metadata/done -> 에러 시 체크포인트 복구
+
+        그래프 실행 중 StreamChannel 이벤트(section/token)를 동시에 drain해 즉시 전송.
+        이미 스트리밍된 응답(state.streamed_agents)은 종료 후 다시 token으로 보내지 않음.
         """
         ...
 
@@ -79,6 +88,10 @@ class ChatService:
         """복구 상태를 포함한 유저 대면 에러 메시지 생성."""
         ...
 
+    def readiness(self) -> Dict[str, Any]:
+        """/ready 엔드포인트용: 라우팅 가능 여부 + 컴포넌트별 워밍업 상태 (get_warmup_report)."""
+        ...
+
     @staticmethod
     def generate_message_id() -> str:
         return uuid.uuid4().hex[:12]